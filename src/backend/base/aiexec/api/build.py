@@ -31,6 +31,7 @@ from aiexec.schema.schema import OutputValue
 from aiexec.services.database.models.flow.model import Flow
 from aiexec.services.deps import get_chat_service, get_telemetry_service, session_scope
 from aiexec.services.job_queue.service import JobQueueNotFoundError, JobQueueService
+from aiexec.services.telemetry.metrics import observe_histogram
 from aiexec.services.telemetry.schema import ComponentPayload, PlaygroundPayload
 
 
@@ -93,6 +94,7 @@ async def get_flow_events_response(
                 queue=main_queue,
                 event_manager=event_manager,
                 event_task=event_task,
+                event_delivery=event_delivery,
             )
 
         # Polling mode - get all available events
@@ -100,7 +102,8 @@ async def get_flow_events_response(
             events: list = []
             # Get all available events from the queue without blocking
             while not main_queue.empty():
-                _, value, _ = await main_queue.get()
+                _, value, put_time = await main_queue.get()
+                _observe_event_queue(main_queue, put_time, event_delivery)
                 if value is None:
                     # End of stream, trigger end event
                     if event_task is not None:
@@ -113,7 +116,8 @@ async def get_flow_events_response(
 
             # If no events were available, wait for one (with timeout)
             if not events:
-                _, value, _ = await main_queue.get()
+                _, value, put_time = await main_queue.get()
+                _observe_event_queue(main_queue, put_time, event_delivery)
                 if value is None:
                     # End of stream, trigger end event
                     if event_task is not None:
@@ -142,10 +146,18 @@ async def get_flow_events_response(
         raise HTTPException(status_code=500, detail=f"Unexpected error: {exc!s}") from exc
 
 
+def _observe_event_queue(queue: asyncio.Queue, put_time: float, event_delivery: EventDeliveryType) -> None:
+    """Record how long an event waited in the job queue and how many are still queued behind it."""
+    labels = {"event_delivery": event_delivery.value}
+    observe_histogram("event_queue_wait_duration", time.time() - put_time, labels)
+    observe_histogram("event_queue_backlog", queue.qsize(), labels)
+
+
 async def create_flow_response(
     queue: asyncio.Queue,
     event_manager: EventManager,
     event_task: asyncio.Task,
+    event_delivery: EventDeliveryType = EventDeliveryType.STREAMING,
 ) -> DisconnectHandlerStreamingResponse:
     """Create a streaming response for the flow build process."""
 
@@ -153,6 +165,7 @@ async def create_flow_response(
         while True:
             try:
                 event_id, value, put_time = await queue.get()
+                _observe_event_queue(queue, put_time, event_delivery)
                 if value is None:
                     break
                 get_time = time.time()
@@ -353,6 +366,11 @@ async def generate_flow_events(
             result_data_response.duration = duration
             result_data_response.timedelta = timedelta
             vertex.add_build_time(timedelta)
+            observe_histogram(
+                "vertex_build_duration",
+                timedelta,
+                {"component_type": vertex_id.split("-")[0], "success": str(valid).lower()},
+            )
             # Capture both inactivated and conditionally excluded vertices
             inactivated_vertices = list(graph.inactivated_vertices.union(graph.conditionally_excluded_vertices))
             graph.reset_inactivated_vertices()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 import uuid
 from ast import literal_eval
 from datetime import timedelta
@@ -21,6 +22,7 @@ from aiexec.services.database.models.user.model import User
 from aiexec.services.database.models.vertex_builds.model import VertexBuildTable
 from aiexec.services.deps import get_session, session_scope
 from aiexec.services.store.utils import get_lf_version_from_pypi
+from aiexec.services.telemetry.metrics import observe_histogram
 from aiexec.utils.constants import AIEXEC_GLOBAL_VAR_HEADER_PREFIX
 
 if TYPE_CHECKING:
@@ -169,7 +171,9 @@ async def build_graph_from_data(flow_id: uuid.UUID | str, payload: dict, **kwarg
     str_flow_id = str(flow_id)
     session_id = kwargs.get("session_id") or str_flow_id
 
+    start_time = time.perf_counter()
     graph = Graph.from_payload(payload, str_flow_id, flow_name, kwargs.get("user_id"))
+    observe_histogram("graph_build_duration", time.perf_counter() - start_time, {"flow_id": str_flow_id})
     for vertex_id in graph.has_session_id_vertices:
         vertex = graph.get_vertex(vertex_id)
         if vertex is None:
@@ -207,7 +211,9 @@ async def build_and_cache_graph_from_data(
     """Build and cache the graph."""
     # Convert flow_id to str if it's UUID
     str_flow_id = str(flow_id) if isinstance(flow_id, uuid.UUID) else flow_id
+    start_time = time.perf_counter()
     graph = Graph.from_payload(graph_data, str_flow_id)
+    observe_histogram("graph_build_duration", time.perf_counter() - start_time, {"flow_id": str_flow_id})
     await chat_service.set_cache(str_flow_id, graph)
     return graph
 
@@ -46,6 +46,7 @@ from aiexec.services.deps import (
     session_scope,
 )
 from aiexec.services.job_queue.service import JobQueueNotFoundError, JobQueueService
+from aiexec.services.telemetry.metrics import observe_histogram
 from aiexec.services.telemetry.schema import ComponentPayload, PlaygroundPayload
 
 if TYPE_CHECKING:
@@ -359,6 +360,11 @@ async def build_vertex(
         result_data_response.duration = duration
         result_data_response.timedelta = timedelta
         vertex.add_build_time(timedelta)
+        observe_histogram(
+            "vertex_build_duration",
+            timedelta,
+            {"component_type": vertex_id.split("-")[0], "success": str(valid).lower()},
+        )
         inactivated_vertices = list(graph.inactivated_vertices)
         graph.reset_inactivated_vertices()
         graph.reset_activated_vertices()
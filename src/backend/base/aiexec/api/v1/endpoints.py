@@ -51,7 +51,8 @@ from aiexec.services.database.models.flow.utils import get_all_webhook_component
 from aiexec.services.database.models.user.model import User, UserRead
 from aiexec.services.deps import get_session_service, get_settings_service, get_telemetry_service
 from aiexec.services.telemetry.schema import RunPayload
-from aiexec.utils.compression import compress_response
+from aiexec.utils.component_catalog import component_catalog
+from aiexec.utils.compression import precompressed_response
 from aiexec.utils.version import get_version_info
 
 if TYPE_CHECKING:
@@ -84,17 +85,18 @@ async def parse_input_request_from_body(http_request: Request) -> SimplifiedAPIR
 
 
 @router.get("/all", dependencies=[Depends(get_current_active_user)])
-async def get_all():
+async def get_all(request: Request):
     """Retrieve all component types with compression for better performance.
 
-    Returns a compressed response containing all available component types.
+    Returns a compressed response containing all available component types. The body is serialized and
+    compressed once per catalog change and carries an ETag, so revalidating clients get a 304.
     """
     from aiexec.interface.components import get_and_cache_all_types_dict
 
     try:
         all_types = await get_and_cache_all_types_dict(settings_service=get_settings_service())
-        # Return compressed response using our utility function
-        return compress_response(all_types)
+        payload = await component_catalog.get_payload(all_types)
+        return precompressed_response(request, payload)
 
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -0,0 +1,191 @@
+"""Translation of in-process flow events into OpenAI Responses API stream events."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from wfx.events.message_delta import MESSAGE_DELTA_EVENT, MessageStateReducer
+
+from aiexec.schema import OpenAIResponsesStreamChunk
+
+if TYPE_CHECKING:
+    from wfx.events.event_manager import FlowEvent
+
+    from aiexec.schema import OpenAIResponsesRequest
+
+AI_SENDERS = frozenset({"Machine", "AI", "Agent"})
+AI_SENDER_NAMES = frozenset({"Agent", "AI"})
+
+
+def _sse(event_type: str, payload: dict[str, Any]) -> str:
+    return f"event: {event_type}\ndata: {json.dumps(payload)}\n\n"
+
+
+class OpenAIResponsesStreamTranslator:
+    """Turns `FlowEvent`s from an `InProcessEventManager` into OpenAI Responses server-sent events.
+
+    Text is forwarded as it arrives: token chunks and `message_delta` appends are sent as-is, and only
+    full `add_message` snapshots are compared with what was already sent. Tool calls are emitted once,
+    when their output is known; a tool step is identified by its position in the message, so only new
+    or changed steps are inspected.
+    """
+
+    def __init__(self, request: OpenAIResponsesRequest, response_id: str, created: int) -> None:
+        self.request = request
+        self.response_id = response_id
+        self.created = created
+        self.include_results = bool(request.include and "tool_call.results" in request.include)
+        self.messages = MessageStateReducer()
+        self.tool_call_counter = 0
+        self.sent_text = ""
+        self._sent_text_message_id: str | None = None
+        self._seen_steps: set[tuple[str, int, int]] = set()
+        self._emitted_tools: set[tuple[str, bytes]] = set()
+
+    def content_chunk(self, content: str) -> str:
+        chunk = OpenAIResponsesStreamChunk(
+            id=self.response_id, created=self.created, model=self.request.model, delta={"content": content}
+        )
+        return f"data: {chunk.model_dump_json()}\n\n"
+
+    def final_chunk(self) -> str:
+        chunk = OpenAIResponsesStreamChunk(
+            id=self.response_id, created=self.created, model=self.request.model, delta={}, status="completed"
+        )
+        return f"data: {chunk.model_dump_json()}\n\n"
+
+    def translate(self, event: FlowEvent) -> list[str]:
+        """Return the server-sent events to forward for one flow event."""
+        data = event.data
+        if not isinstance(data, dict):
+            return []
+        if event.type == "token":
+            chunk = data.get("chunk")
+            return [self.content_chunk(chunk)] if isinstance(chunk, str) and chunk else []
+        if event.type == "add_message":
+            message = self.messages.apply_snapshot(data)
+            steps = [
+                (block_index, index, step)
+                for block_index, block in enumerate(message.get("content_blocks") or [])
+                for index, step in enumerate(block.get("contents") or [])
+            ]
+            return [*self._tool_events(message, steps), *self._text_events(message)]
+        if event.type == MESSAGE_DELTA_EVENT:
+            message = self.messages.apply_delta(data)
+            if message is None:
+                return []
+            steps = [(change["block"], change["index"], change["content"]) for change in data.get("contents", [])]
+            appended = data.get("text_append") if "text" not in data else None
+            return [*self._tool_events(message, steps), *self._text_events(message, appended)]
+        return []
+
+    def _is_ai_text(self, message: dict[str, Any]) -> bool:
+        text = message.get("text")
+        return (
+            isinstance(text, str)
+            and message.get("sender") in AI_SENDERS
+            and message.get("sender_name") in AI_SENDER_NAMES
+            and text != self.request.input
+        )
+
+    def _text_events(self, message: dict[str, Any], appended: str | None = None) -> list[str]:
+        if not self._is_ai_text(message):
+            return []
+        text = message["text"]
+        message_id = str(message.get("id"))
+        if appended is not None and message_id == self._sent_text_message_id:
+            content = appended
+        elif text.startswith(self.sent_text):
+            content = text[len(self.sent_text) :]
+        else:
+            # The text was reset (e.g. a different message); send it in full
+            content = text
+        self.sent_text = text
+        self._sent_text_message_id = message_id
+        return [self.content_chunk(content)] if content else []
+
+    def _tool_events(self, message: dict[str, Any], steps: list[tuple[int, int, Any]]) -> list[str]:
+        events: list[str] = []
+        message_id = str(message.get("id"))
+        for block_index, index, step in steps:
+            position = (message_id, block_index, index)
+            if position in self._seen_steps or not isinstance(step, dict) or step.get("type") != "tool_use":
+                continue
+            tool_name = step.get("name")
+            tool_input = step.get("tool_input")
+            tool_output = step.get("output")
+            if not tool_name or tool_input is None or tool_output is None:
+                continue
+            self._seen_steps.add(position)
+            # The same tool call can also appear in a later message (e.g. the chat output echoing the agent)
+            arguments = jsonable_encoder(tool_input)
+            signature = (tool_name, orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS))
+            if signature in self._emitted_tools:
+                continue
+            self._emitted_tools.add(signature)
+            events.extend(self._tool_call_events(tool_name, arguments, tool_output))
+        return events
+
+    def _tool_call_events(self, tool_name: str, arguments: Any, tool_output: Any) -> list[str]:
+        self.tool_call_counter += 1
+        call_id = f"call_{self.tool_call_counter}"
+        tool_id = f"fc_{self.tool_call_counter}"
+        arguments_str = json.dumps(arguments)
+        added = {
+            "type": "response.output_item.added",
+            "item": {
+                "id": tool_id,
+                "type": "function_call",
+                "status": "in_progress",
+                "name": tool_name,
+                "arguments": "",
+                "call_id": call_id,
+            },
+        }
+        arguments_delta = {
+            "type": "response.function_call_arguments.delta",
+            "delta": arguments_str,
+            "item_id": tool_id,
+            "output_index": 0,
+        }
+        arguments_done = {
+            "type": "response.function_call_arguments.done",
+            "arguments": arguments_str,
+            "item_id": tool_id,
+            "output_index": 0,
+        }
+        if self.include_results:
+            done = {
+                "type": "response.output_item.done",
+                "item": {
+                    "id": f"{tool_name}_{tool_id}",
+                    "inputs": arguments,
+                    "status": "completed",
+                    "type": "tool_call",
+                    "tool_name": tool_name,
+                    "results": jsonable_encoder(tool_output),
+                },
+                "output_index": 0,
+                "sequence_number": self.tool_call_counter + 5,
+            }
+        else:
+            done = {
+                "type": "response.output_item.done",
+                "item": {
+                    "id": tool_id,
+                    "type": "function_call",
+                    "status": "completed",
+                    "arguments": arguments_str,
+                    "call_id": call_id,
+                    "name": tool_name,
+                },
+            }
+        return [
+            _sse("response.output_item.added", added),
+            _sse("response.function_call_arguments.delta", arguments_delta),
+            _sse("response.function_call_arguments.done", arguments_done),
+            _sse("response.output_item.done", done),
+        ]
@@ -11,9 +11,9 @@ from aiexec.api.utils import CurrentActiveUser, DbSession
 from aiexec.api.v1.schemas import UsersResponse
 from aiexec.initial_setup.setup import get_or_create_default_folder
 from aiexec.services.auth.utils import (
+    aget_password_hash,
+    averify_password,
     get_current_active_superuser,
-    get_password_hash,
-    verify_password,
 )
 from aiexec.services.database.models.user.crud import get_user_by_id, update_user
 from aiexec.services.database.models.user.model import User, UserCreate, UserRead, UserUpdate
@@ -30,7 +30,7 @@ async def add_user(
     """Add a new user to the database."""
     new_user = User.model_validate(user, from_attributes=True)
     try:
-        new_user.password = get_password_hash(user.password)
+        new_user.password = await aget_password_hash(user.password)
         new_user.is_active = get_settings_service().auth_settings.NEW_USER_IS_ACTIVE
         session.add(new_user)
         await session.commit()
@@ -91,7 +91,7 @@ async def patch_user(
     if update_password:
         if not user.is_superuser:
             raise HTTPException(status_code=400, detail="You can't change your password here")
-        user_update.password = get_password_hash(user_update.password)
+        user_update.password = await aget_password_hash(user_update.password)
 
     if user_db := await get_user_by_id(session, user_id):
         if not update_password:
@@ -113,9 +113,9 @@ async def reset_password(
 
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    if verify_password(user_update.password, user.password):
+    if await averify_password(user_update.password, user.password):
         raise HTTPException(status_code=400, detail="You can't use your current password")
-    new_password = get_password_hash(user_update.password)
+    new_password = await aget_password_hash(user_update.password)
     user.password = new_password
     await session.commit()
     await session.refresh(user)
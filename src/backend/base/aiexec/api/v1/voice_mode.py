@@ -33,7 +33,7 @@ from aiexec.services.database.models.flow.model import Flow
 from aiexec.services.database.models.message.model import MessageTable
 from aiexec.services.database.models.user.model import User
 from aiexec.services.deps import get_variable_service, session_scope
-from aiexec.utils.voice_utils import BYTES_PER_24K_FRAME, VAD_SAMPLE_RATE_16K, resample_24k_to_16k
+from aiexec.utils.voice_utils import VoiceActivityDetector
 
 router = APIRouter(prefix="/voice", tags=["Voice"])
 
@@ -771,34 +771,22 @@ async def flow_as_tool_websocket(
 
             # Setup for VAD processing.
             vad_queue: asyncio.Queue = asyncio.Queue()
-            vad_audio_buffer = bytearray()
             bot_speaking_flag = [False]
 
             async def process_vad_audio() -> None:
-                nonlocal vad_audio_buffer
                 last_speech_time = datetime.now(tz=timezone.utc)
-                vad = get_vad()
+                detector = VoiceActivityDetector(get_vad())
                 while True:
-                    base64_data = await vad_queue.get()
-                    raw_chunk_24k = base64.b64decode(base64_data)
-                    vad_audio_buffer.extend(raw_chunk_24k)
-                    has_speech = False
-                    while len(vad_audio_buffer) >= BYTES_PER_24K_FRAME:
-                        frame_24k = vad_audio_buffer[:BYTES_PER_24K_FRAME]
-                        del vad_audio_buffer[:BYTES_PER_24K_FRAME]
-                        try:
-                            frame_16k = resample_24k_to_16k(frame_24k)
-                            is_speech = vad.is_speech(frame_16k, VAD_SAMPLE_RATE_16K)
-                            if is_speech:
-                                has_speech = True
-                                logger.trace("!", end="")
-                                if bot_speaking_flag[0]:
-                                    msg_handler.openai_send({"type": "response.cancel"})
-                                    bot_speaking_flag[0] = False
-                        except Exception as e:  # noqa: BLE001
-                            await logger.aerror(f"[ERROR] VAD processing failed (ValueError): {e}")
-                            continue
+                    # Drain everything queued so far and classify it in one worker-thread hop
+                    chunks = [base64.b64decode(await vad_queue.get())]
+                    while not vad_queue.empty():
+                        chunks.append(base64.b64decode(vad_queue.get_nowait()))
+                    has_speech = await asyncio.to_thread(detector.process, chunks)
                     if has_speech:
+                        logger.trace("!", end="")
+                        if bot_speaking_flag[0]:
+                            msg_handler.openai_send({"type": "response.cancel"})
+                            bot_speaking_flag[0] = False
                         last_speech_time = datetime.now(tz=timezone.utc)
                         logger.trace(".", end="")
                     else:
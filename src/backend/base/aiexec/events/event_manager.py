@@ -4,15 +4,21 @@
 from wfx.events.event_manager import (
     EventCallback,
     EventManager,
+    FlowEvent,
+    InProcessEventManager,
     PartialEventCallback,
     create_default_event_manager,
+    create_in_process_stream_event_manager,
     create_stream_tokens_event_manager,
 )
 
 __all__ = [
     "EventCallback",
     "EventManager",
+    "FlowEvent",
+    "InProcessEventManager",
     "PartialEventCallback",
     "create_default_event_manager",
+    "create_in_process_stream_event_manager",
     "create_stream_tokens_event_manager",
 ]
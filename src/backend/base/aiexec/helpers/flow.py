@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import copy
+import hashlib
 from typing import TYPE_CHECKING, Any, cast
 from uuid import UUID
 
+import orjson
+from cachetools import LRUCache
 from fastapi import HTTPException
 from pydantic.v1 import BaseModel, Field, create_model
 from sqlmodel import select
@@ -27,6 +31,11 @@ INPUT_TYPE_MAP = {
     "JSONInput": {"type_hint": "Optional[dict]", "default": "{}"},
 }
 
+MAX_CACHED_SUBFLOWS = 128
+# Tweaked flow payloads keyed by (flow id, updated_at, tweaks hash). Graphs hold run state, so every run
+# still builds its own Graph from a copy; the cache saves loading the flow data and applying the tweaks.
+_subflow_payload_cache: LRUCache[tuple[str, str, str], dict] = LRUCache(maxsize=MAX_CACHED_SUBFLOWS)
+
 
 async def list_flows(*, user_id: str | None = None) -> list[Data]:
     if not user_id:
@@ -60,14 +69,31 @@ async def load_flow(
             msg = f"Flow {flow_name} not found"
             raise ValueError(msg)
 
+    flow_uuid = UUID(flow_id) if isinstance(flow_id, str) else flow_id
+    tweaks_hash = _hash_tweaks(tweaks)
     async with session_scope() as session:
-        graph_data = flow.data if (flow := await session.get(Flow, flow_id)) else None
+        updated_at = (await session.exec(select(Flow.updated_at).where(Flow.id == flow_uuid))).first()
+        cache_key = (str(flow_uuid), updated_at.isoformat(), tweaks_hash) if updated_at and tweaks_hash else None
+        graph_data = _subflow_payload_cache.get(cache_key) if cache_key else None
+        if graph_data is None:
+            graph_data = flow.data if (flow := await session.get(Flow, flow_uuid)) else None
+            if graph_data and tweaks:
+                graph_data = process_tweaks(graph_data=graph_data, tweaks=tweaks)
+            if graph_data and cache_key:
+                _subflow_payload_cache[cache_key] = graph_data
     if not graph_data:
         msg = f"Flow {flow_id} not found"
         raise ValueError(msg)
-    if tweaks:
-        graph_data = process_tweaks(graph_data=graph_data, tweaks=tweaks)
-    return Graph.from_payload(graph_data, flow_id=flow_id, user_id=user_id)
+    # Vertices update their node data in place, so never hand out the cached payload itself.
+    return Graph.from_payload(copy.deepcopy(graph_data), flow_id=flow_id, user_id=user_id)
+
+
+def _hash_tweaks(tweaks: dict | None) -> str | None:
+    """Hash of the tweaks for the subflow cache, or None when they are not plain JSON and cannot be keyed."""
+    try:
+        return hashlib.sha256(orjson.dumps(tweaks or {}, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    except TypeError:
+        return None
 
 
 async def find_flow(flow_name: str, user_id: str) -> str | None:
@@ -1,6 +1,7 @@
 import asyncio
 import json
 from collections.abc import Sequence
+from dataclasses import dataclass
 from uuid import UUID
 
 from langchain_core.chat_history import BaseChatMessageHistory
@@ -151,19 +152,37 @@ async def aadd_messages(messages: Message | list[Message], flow_id: str | UUID |
         raise
 
 
+def _as_uuid(value: str | UUID) -> UUID:
+    return value if isinstance(value, UUID) else UUID(str(value))
+
+
+async def _aget_messagetables_by_id(session: AsyncSession, ids: set[UUID]) -> dict[UUID, MessageTable]:
+    """Load the rows for `ids` with a single query."""
+    if not ids:
+        return {}
+    result = await session.exec(select(MessageTable).where(col(MessageTable.id).in_(ids)))
+    return {row.id: row for row in result.all()}
+
+
+def _apply_message_update(message_table: MessageTable, message: Message) -> MessageTable:
+    message_table = message_table.sqlmodel_update(message.model_dump(exclude_unset=True, exclude_none=True))
+    # Convert flow_id to UUID if it's a string preventing error when saving to database
+    if message_table.flow_id and isinstance(message_table.flow_id, str):
+        message_table.flow_id = UUID(message_table.flow_id)
+    return message_table
+
+
 async def aupdate_messages(messages: Message | list[Message]) -> list[Message]:
     if not isinstance(messages, list):
         messages = [messages]
 
     async with session_scope() as session:
+        existing = await _aget_messagetables_by_id(session, {_as_uuid(message.id) for message in messages})
         updated_messages: list[MessageTable] = []
         for message in messages:
-            msg = await session.get(MessageTable, message.id)
+            msg = existing.get(_as_uuid(message.id))
             if msg:
-                msg = msg.sqlmodel_update(message.model_dump(exclude_unset=True, exclude_none=True))
-                # Convert flow_id to UUID if it's a string preventing error when saving to database
-                if msg.flow_id and isinstance(msg.flow_id, str):
-                    msg.flow_id = UUID(msg.flow_id)
+                msg = _apply_message_update(msg, message)
                 session.add(msg)
                 updated_messages.append(msg)
             else:
@@ -193,8 +212,8 @@ async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession
         except asyncio.CancelledError:
             await session.rollback()
             return await aadd_messagetables(messages, session)
-        for message in messages:
-            await session.refresh(message)
+        # No refresh: ids and timestamps are generated client side and the session
+        # does not expire attributes on commit, so the rows already hold what was written.
     except asyncio.CancelledError as e:
         await logger.aexception(e)
         error_msg = "Operation cancelled"
@@ -311,16 +330,102 @@ async def astore_message(
             f" Sender: {message.sender}, Sender Name: {message.sender_name}"
         )
         raise ValueError(msg)
-    if hasattr(message, "id") and message.id:
-        # if message has an id and exist in the database, update it
-        # if not raise an error and add the message to the database
-        try:
-            return await aupdate_messages([message])
-        except ValueError as e:
-            await logger.aerror(e)
     if flow_id and not isinstance(flow_id, UUID):
         flow_id = UUID(flow_id)
-    return await aadd_messages([message], flow_id=flow_id)
+    return [await _session_writers.submit(message, flow_id)]
+
+
+@dataclass
+class _PendingWrite:
+    message: Message
+    flow_id: UUID | None
+    future: asyncio.Future
+
+
+class _SessionWriteBatch:
+    """Writes queued for one chat session."""
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.pending: list[_PendingWrite] = []
+
+
+class _SessionMessageWriters:
+    """Group commit for `astore_message`.
+
+    Writes are queued per chat session. Whoever holds the session lock commits every write queued
+    so far in one transaction, so concurrent writers of a session share a commit instead of each
+    paying for their own round-trips. Writes of a session are applied in submission order, and
+    several updates of the same message in a batch are coalesced into a single row write. Callers
+    still wait for their own commit, so reads issued afterwards see the message.
+    """
+
+    def __init__(self) -> None:
+        self._batches: dict[tuple[int, str], _SessionWriteBatch] = {}
+
+    async def submit(self, message: Message, flow_id: UUID | None) -> Message:
+        loop = asyncio.get_running_loop()
+        # Locks and futures belong to an event loop, so batches are not shared between loops
+        key = (id(loop), str(message.session_id))
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = _SessionWriteBatch()
+        write = _PendingWrite(message=message, flow_id=flow_id, future=loop.create_future())
+        batch.pending.append(write)
+        async with batch.lock:
+            if not write.future.done():
+                writes, batch.pending = batch.pending, []
+                try:
+                    await self._commit(writes)
+                finally:
+                    # If this writer was cancelled mid-commit, hand the other writes to the next one
+                    batch.pending[:0] = [other for other in writes if other is not write and not other.future.done()]
+            if not batch.pending and self._batches.get(key) is batch:
+                del self._batches[key]
+        return write.future.result()
+
+    @staticmethod
+    async def _commit(writes: list[_PendingWrite]) -> None:
+        try:
+            async with session_scope() as session:
+                message_ids = [getattr(write.message, "id", None) for write in writes]
+                existing = await _aget_messagetables_by_id(
+                    session, {_as_uuid(message_id) for message_id in message_ids if message_id}
+                )
+                written: list[tuple[_PendingWrite, MessageTable, bool]] = []
+                for write, message_id in zip(writes, message_ids, strict=True):
+                    message_table = existing.get(_as_uuid(message_id)) if message_id else None
+                    is_update = message_table is not None
+                    try:
+                        if is_update:
+                            message_table = _apply_message_update(message_table, write.message)
+                        else:
+                            if message_id:
+                                await logger.aerror(f"Message with id {message_id} not found")
+                            message_table = MessageTable.from_message(write.message, flow_id=write.flow_id)
+                            existing[message_table.id] = message_table
+                    except Exception as e:  # noqa: BLE001
+                        write.future.set_exception(e)
+                        continue
+                    session.add(message_table)
+                    written.append((write, message_table, is_update))
+        except Exception as e:  # noqa: BLE001
+            # Any failure must reach every waiting writer, otherwise their futures never resolve
+            await logger.aexception(e)
+            for write in writes:
+                if not write.future.done():
+                    write.future.set_exception(e)
+            return
+        for write, message_table, is_update in written:
+            try:
+                stored = MessageRead.model_validate(message_table, from_attributes=True)
+                # Same return types as aupdate_messages and aadd_messages respectively
+                write.future.set_result(stored if is_update else await Message.create(**stored.model_dump()))
+            except Exception as e:  # noqa: BLE001
+                write.future.set_exception(e)
+
+
+_session_writers = _SessionMessageWriters()
 
 
 class LCBuiltinChatMemory(BaseChatMessageHistory):
@@ -1,9 +1,12 @@
+import asyncio
 import base64
 import random
 import warnings
-from collections.abc import Coroutine
+from collections.abc import Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Annotated
+from functools import cache, lru_cache, partial
+from typing import TYPE_CHECKING, Annotated, TypeVar
 from uuid import UUID
 
 from cryptography.fernet import Fernet
@@ -21,10 +24,13 @@ from aiexec.services.database.models.api_key.crud import check_key
 from aiexec.services.database.models.user.crud import get_user_by_id, get_user_by_username, update_user_last_login_at
 from aiexec.services.database.models.user.model import User, UserRead
 from aiexec.services.deps import get_db_service, get_session, get_settings_service, session_scope
+from aiexec.services.telemetry.metrics import increment_counter
 
 if TYPE_CHECKING:
     from aiexec.services.database.models.api_key.model import ApiKey
 
+T = TypeVar("T")
+
 oauth2_login = OAuth2PasswordBearer(tokenUrl="api/v1/login", auto_error=False)
 
 API_KEY_NAME = "x-api-key"
@@ -345,6 +351,30 @@ def get_password_hash(password):
     return settings_service.auth_settings.pwd_context.hash(password)
 
 
+@cache
+def _get_auth_executor(max_workers: int) -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="aiexec-auth")
+
+
+async def run_in_auth_executor(func: Callable[..., T], *args) -> T:
+    """Run CPU-bound auth work (bcrypt, Fernet) on the bounded auth thread pool.
+
+    bcrypt releases the GIL while hashing, so a thread pool keeps the event loop free; its size is
+    set by `AuthSettings.PASSWORD_HASHING_MAX_WORKERS` and caps how many hashes run at once.
+    """
+    settings_service = get_settings_service()
+    executor = _get_auth_executor(settings_service.auth_settings.PASSWORD_HASHING_MAX_WORKERS)
+    return await asyncio.get_running_loop().run_in_executor(executor, partial(func, *args))
+
+
+async def averify_password(plain_password, hashed_password) -> bool:
+    return await run_in_auth_executor(verify_password, plain_password, hashed_password)
+
+
+async def aget_password_hash(password) -> str:
+    return await run_in_auth_executor(get_password_hash, password)
+
+
 def create_token(data: dict, expires_delta: timedelta):
     settings_service = get_settings_service()
 
@@ -369,7 +399,7 @@ async def create_super_user(
     if not super_user:
         super_user = User(
             username=username,
-            password=get_password_hash(password),
+            password=await aget_password_hash(password),
             is_superuser=True,
             is_active=True,
             last_login_at=None,
@@ -510,14 +540,20 @@ async def authenticate_user(username: str, password: str, db: AsyncSession) -> U
     user = await get_user_by_username(db, username)
 
     if not user:
+        increment_counter("login_attempts", {"result": "unknown_user"})
         return None
 
     if not user.is_active:
+        increment_counter("login_attempts", {"result": "inactive"})
         if not user.last_login_at:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Waiting for approval")
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Inactive user")
 
-    return user if verify_password(password, user.password) else None
+    if not await averify_password(password, user.password):
+        increment_counter("login_attempts", {"result": "invalid_password"})
+        return None
+    increment_counter("login_attempts", {"result": "success"})
+    return user
 
 
 def add_padding(s):
@@ -539,10 +575,14 @@ def ensure_valid_key(s: str) -> bytes:
     return key
 
 
+@lru_cache(maxsize=4)
+def _get_fernet_for_secret(secret_key: str) -> Fernet:
+    return Fernet(ensure_valid_key(secret_key))
+
+
 def get_fernet(settings_service: SettingsService):
     secret_key: str = settings_service.auth_settings.SECRET_KEY.get_secret_value()
-    valid_key = ensure_valid_key(secret_key)
-    return Fernet(valid_key)
+    return _get_fernet_for_secret(secret_key)
 
 
 def encrypt_api_key(api_key: str, settings_service: SettingsService):
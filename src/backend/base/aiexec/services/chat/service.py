@@ -3,9 +3,12 @@ from collections import defaultdict
 from threading import RLock
 from typing import Any
 
+from wfx.services.cache.utils import CacheMiss
+
 from aiexec.services.base import Service
 from aiexec.services.cache.base import AsyncBaseCacheService, CacheService
 from aiexec.services.deps import get_cache_service
+from aiexec.services.telemetry.metrics import increment_counter
 
 
 class ChatService(Service):
@@ -52,8 +55,14 @@ class ChatService(Service):
             Any: The cached data.
         """
         if isinstance(self.cache_service, AsyncBaseCacheService):
-            return await self.cache_service.get(key, lock=lock or self.async_cache_locks[key])
-        return await asyncio.to_thread(self.cache_service.get, key, lock=lock or self._sync_cache_locks[key])
+            value = await self.cache_service.get(key, lock=lock or self.async_cache_locks[key])
+        else:
+            value = await asyncio.to_thread(self.cache_service.get, key, lock=lock or self._sync_cache_locks[key])
+        increment_counter(
+            "cache_requests",
+            {"cache": type(self.cache_service).__name__, "result": "miss" if isinstance(value, CacheMiss) else "hit"},
+        )
+        return value
 
     async def clear_cache(self, key: str, lock: asyncio.Lock | None = None) -> None:
         """Clear the cache for a client.
@@ -30,12 +30,32 @@ from aiexec.services.database.models.user.crud import get_user_by_username
 from aiexec.services.database.session import NoopSession
 from aiexec.services.database.utils import Result, TableResults
 from aiexec.services.deps import get_settings_service
+from aiexec.services.telemetry.metrics import observe_histogram
 from aiexec.services.utils import teardown_superuser
 
 if TYPE_CHECKING:
     from wfx.services.settings.service import SettingsService
 
 
+def observe_connection_acquisition(session: AsyncSession, dialect: str) -> None:
+    """Record how long the first statement of `session` waits for its connection.
+
+    The connection is still acquired lazily: the time runs from the start of the first execution, which is
+    dispatched before the session checks a connection out, to the beginning of its transaction.
+    """
+    started: list[float] = []
+
+    def on_execute(_orm_execute_state) -> None:
+        started.append(time.perf_counter())
+
+    def on_begin(_session, _transaction, _connection) -> None:
+        if started:
+            observe_histogram("db_session_acquisition_duration", time.perf_counter() - started[0], {"dialect": dialect})
+
+    event.listen(session.sync_session, "do_orm_execute", on_execute, once=True)
+    event.listen(session.sync_session, "after_begin", on_begin, once=True)
+
+
 class DatabaseService(Service):
     name = "database_service"
 
@@ -191,6 +211,7 @@ class DatabaseService(Service):
             async with AsyncSession(self.engine, expire_on_commit=False) as session:
                 # Start of Selection
                 try:
+                    observe_connection_acquisition(session, self.engine.dialect.name)
                     yield session
                 except exc.SQLAlchemyError as db_exc:
                     await logger.aerror(f"Database error during session scope: {db_exc}")
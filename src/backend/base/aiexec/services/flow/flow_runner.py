@@ -13,7 +13,7 @@ from wfx.utils.util import update_settings
 from aiexec.api.utils import cascade_delete_flow
 from aiexec.load.utils import replace_tweaks_with_env
 from aiexec.processing.process import process_tweaks, run_graph
-from aiexec.services.auth.utils import get_password_hash
+from aiexec.services.auth.utils import aget_password_hash
 from aiexec.services.cache.service import AsyncBaseCacheService
 from aiexec.services.database.models import Flow, User, Variable
 from aiexec.services.database.utils import initialize_database
@@ -167,7 +167,7 @@ class AiexecRunnerExperimental:
     async def generate_user(self) -> User:
         async with session_scope() as session:
             user_id = str(uuid4())
-            user = User(id=user_id, username=user_id, password=get_password_hash(str(uuid4())), is_active=True)
+            user = User(id=user_id, username=user_id, password=await aget_password_hash(str(uuid4())), is_active=True)
             session.add(user)
             await session.commit()
             await session.refresh(user)
@@ -6,6 +6,7 @@ from wfx.log.logger import logger
 
 from aiexec.events.event_manager import EventManager
 from aiexec.services.base import Service
+from aiexec.services.telemetry.metrics import update_gauge
 
 
 class JobQueueNotFoundError(Exception):
@@ -147,6 +148,7 @@ class JobQueueService(Service):
 
         # Register the queue without an active task.
         self._queues[job_id] = (main_queue, event_manager, None, None)
+        self._report_queue_depth()
         logger.debug(f"Queue and event manager successfully created for job_id {job_id}")
         return main_queue, event_manager
 
@@ -249,6 +251,7 @@ class JobQueueService(Service):
         await logger.adebug(f"Removed {items_cleared} items from queue for job_id {job_id}")
         # Remove the job entry from the registry
         self._queues.pop(job_id, None)
+        self._report_queue_depth()
         await logger.adebug(f"Cleanup successful for job_id {job_id}: resources have been released.")
 
     async def _periodic_cleanup(self) -> None:
@@ -302,6 +305,10 @@ class JobQueueService(Service):
                         await logger.adebug(f"Cleaning up job_id {job_id} after grace period")
                         await self.cleanup_job(job_id)
 
+    def _report_queue_depth(self) -> None:
+        """Publish the number of registered job queues to the job_queue_depth gauge."""
+        update_gauge("job_queue_depth", len(self._queues), {"service": self.name})
+
     def _create_default_event_manager(self, queue: asyncio.Queue) -> EventManager:
         """Creates the default event manager with predefined events.
 
@@ -319,6 +326,7 @@ class JobQueueService(Service):
             ("on_error", "error"),
             ("on_end", "end"),
             ("on_message", "add_message"),
+            ("on_message_delta", "message_delta"),
             ("on_remove_message", "remove_message"),
             ("on_end_vertex", "end_vertex"),
             ("on_build_start", "build_start"),
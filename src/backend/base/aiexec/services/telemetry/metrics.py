@@ -0,0 +1,51 @@
+"""Helpers for recording performance metrics on hot paths.
+
+The metrics themselves are registered in `OpenTelemetry._register_metric` and exposed through the
+Prometheus reader. These helpers resolve the registry through the telemetry service and never raise,
+so instrumented code paths are not affected when telemetry is unavailable.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from aiexec.services.telemetry.opentelemetry import OpenTelemetry
+
+
+def _get_opentelemetry() -> OpenTelemetry | None:
+    from aiexec.services.deps import get_telemetry_service
+
+    telemetry_service = get_telemetry_service()
+    return getattr(telemetry_service, "ot", None)
+
+
+def observe_histogram(metric_name: str, value: float, labels: Mapping[str, str]) -> None:
+    """Record a value on a registered histogram."""
+    try:
+        if ot := _get_opentelemetry():
+            ot.observe_histogram(metric_name, value, labels)
+    except Exception:  # noqa: BLE001
+        logger.debug(f"Error recording metric {metric_name}", exc_info=True)
+
+
+def increment_counter(metric_name: str, labels: Mapping[str, str], value: float = 1.0) -> None:
+    """Increment a registered counter."""
+    try:
+        if ot := _get_opentelemetry():
+            ot.increment_counter(metric_name, labels, value)
+    except Exception:  # noqa: BLE001
+        logger.debug(f"Error recording metric {metric_name}", exc_info=True)
+
+
+def update_gauge(metric_name: str, value: float, labels: Mapping[str, str]) -> None:
+    """Set the current value of a registered gauge."""
+    try:
+        if ot := _get_opentelemetry():
+            ot.update_gauge(metric_name, value, labels)
+    except Exception:  # noqa: BLE001
+        logger.debug(f"Error recording metric {metric_name}", exc_info=True)
@@ -140,6 +140,62 @@ class OpenTelemetry(metaclass=ThreadSafeSingletonMetaUsingWeakref):
             metric_type=MetricType.COUNTER,
             labels={"flow_id": mandatory_label},
         )
+        self._add_metric(
+            name="vertex_build_duration",
+            description="Time spent building a single vertex",
+            unit="s",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"component_type": mandatory_label, "success": optional_label},
+        )
+        self._add_metric(
+            name="graph_build_duration",
+            description="Time spent constructing a graph from its flow payload",
+            unit="s",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"flow_id": mandatory_label},
+        )
+        self._add_metric(
+            name="event_queue_wait_duration",
+            description="Time an event waited in a job queue before it was consumed",
+            unit="s",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"event_delivery": mandatory_label},
+        )
+        self._add_metric(
+            name="event_queue_backlog",
+            description="The number of events still waiting in a job queue when one is consumed",
+            unit="",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"event_delivery": mandatory_label},
+        )
+        self._add_metric(
+            name="job_queue_depth",
+            description="The number of job queues registered in the job queue service",
+            unit="",
+            metric_type=MetricType.OBSERVABLE_GAUGE,
+            labels={"service": mandatory_label},
+        )
+        self._add_metric(
+            name="cache_requests",
+            description="The number of cache lookups, labelled by hit or miss",
+            unit="",
+            metric_type=MetricType.COUNTER,
+            labels={"cache": mandatory_label, "result": mandatory_label},
+        )
+        self._add_metric(
+            name="db_session_acquisition_duration",
+            description="Time spent acquiring a database connection for a session",
+            unit="s",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"dialect": mandatory_label},
+        )
+        self._add_metric(
+            name="login_attempts",
+            description="Number of password login attempts",
+            unit="",
+            metric_type=MetricType.COUNTER,
+            labels={"result": mandatory_label},
+        )
 
     def __init__(self, *, prometheus_enabled: bool = True):
         # Only initialize once
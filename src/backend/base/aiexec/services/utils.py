@@ -9,7 +9,7 @@ from sqlmodel import col, select
 from wfx.log.logger import logger
 from wfx.services.settings.constants import DEFAULT_SUPERUSER, DEFAULT_SUPERUSER_PASSWORD
 
-from aiexec.services.auth.utils import create_super_user, verify_password
+from aiexec.services.auth.utils import averify_password, create_super_user
 from aiexec.services.cache.base import ExternalAsyncBaseCacheService
 from aiexec.services.cache.factory import CacheServiceFactory
 from aiexec.services.database.models.transactions.model import TransactionTable
@@ -36,7 +36,7 @@ async def get_or_create_super_user(session: AsyncSession, username, password, is
 
     if user and is_default:
         if user.is_superuser:
-            if verify_password(password, user.password):
+            if await averify_password(password, user.password):
                 return None
             # Superuser exists but password is incorrect
             # which means that the user has changed the
@@ -54,7 +54,7 @@ async def get_or_create_super_user(session: AsyncSession, username, password, is
         return None
 
     if user:
-        if verify_password(password, user.password):
+        if await averify_password(password, user.password):
             msg = "User with superuser credentials exists but is not a superuser."
             raise ValueError(msg)
         msg = "Incorrect superuser credentials"
@@ -78,22 +78,34 @@ class DatabaseVariableService(VariableService, Service):
         # we decrypt the value
         return auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
 
+    def _decrypt_generic_values(self, variables: Sequence[Variable]) -> list[tuple[str | None, Exception | None]]:
+        results: list[tuple[str | None, Exception | None]] = []
+        for variable in variables:
+            if variable.type != GENERIC_TYPE:
+                results.append((None, None))
+                continue
+            try:
+                value = auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+            except Exception as e:  # noqa: BLE001
+                results.append((None, e))
+            else:
+                results.append((value, None))
+        return results
+
     async def get_all(self, user_id: UUID | str, session: AsyncSession) -> list[VariableRead]:
         stmt = select(Variable).where(Variable.user_id == user_id)
         variables = list((await session.exec(stmt)).all())
         # For variables of type 'Generic', attempt to decrypt the value.
         # If decryption fails, assume the value is already plaintext.
+        # All values are decrypted in a single hop to the auth executor.
+        decrypted = await auth_utils.run_in_auth_executor(self._decrypt_generic_values, variables)
         variables_read = []
-        for variable in variables:
-            value = None
-            if variable.type == GENERIC_TYPE:
-                try:
-                    value = auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
-                except Exception as e:  # noqa: BLE001
-                    await logger.adebug(
-                        f"Decryption of {variable.type} failed for variable '{variable.name}': {e}. Assuming plaintext."
-                    )
-                    value = variable.value
+        for variable, (decrypted_value, error) in zip(variables, decrypted, strict=True):
+            if error is not None:
+                await logger.adebug(
+                    f"Decryption of {variable.type} failed for variable '{variable.name}': {error}. Assuming plaintext."
+                )
+            value = variable.value if error is not None else decrypted_value
             variable_read = VariableRead.model_validate(variable, from_attributes=True)
             variable_read.value = value
             variables_read.append(variable_read)
@@ -0,0 +1,72 @@
+"""Precomputed `/api/v1/all` response.
+
+The component catalog is several megabytes of JSON, so encoding and compressing it on every request is
+expensive. The catalog is serialized per category and the fragments are reused until
+`component_cache.mark_changed` reports that a category (or the whole catalog) changed; only then are the
+affected fragments re-encoded and the body recompressed, off the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from wfx.interface.components import ComponentCache, component_cache
+
+from aiexec.utils.compression import PrecompressedJSON
+
+
+def _encode_fragment(category: str, components: dict[str, Any]) -> bytes:
+    # Same separators as json.dumps so the joined fragments match json.dumps of the whole catalog
+    return f"{json.dumps(category)}: {json.dumps(jsonable_encoder(components))}".encode()
+
+
+class ComponentCatalog:
+    """Keeps the serialized, compressed catalog in sync with a `ComponentCache`."""
+
+    def __init__(self, cache: ComponentCache = component_cache) -> None:
+        self._cache = cache
+        self._source: dict[str, Any] | None = None
+        self._version: int | None = None
+        self._fragments: dict[str, tuple[int, bytes]] = {}
+        self._payload: PrecompressedJSON | None = None
+
+    def _is_current(self, all_types: dict[str, Any]) -> bool:
+        return self._payload is not None and all_types is self._source and self._cache.version == self._version
+
+    async def get_payload(self, all_types: dict[str, Any]) -> PrecompressedJSON:
+        """Return the precompressed catalog for `all_types`, rebuilding only what changed."""
+        if self._is_current(all_types):
+            return self._payload  # type: ignore[return-value]
+
+        version = self._cache.version
+        fragments = self._fragments if all_types is self._source else {}
+        # Snapshot on the loop: the cache may be updated while the thread encodes.
+        stale = {
+            category: (self._cache.get_type_version(category), dict(components))
+            for category, components in all_types.items()
+            if category not in fragments or fragments[category][0] != self._cache.get_type_version(category)
+        }
+        order = list(all_types)
+
+        def build() -> tuple[dict[str, tuple[int, bytes]], PrecompressedJSON]:
+            updated = {category: fragments[category] for category in order if category not in stale}
+            for category, (type_version, components) in stale.items():
+                updated[category] = (type_version, _encode_fragment(category, components))
+            body = b"{" + b", ".join(updated[category][1] for category in order) + b"}"
+            return updated, PrecompressedJSON.from_bytes(body)
+
+        self._fragments, self._payload = await asyncio.to_thread(build)
+        self._source, self._version = all_types, version
+        return self._payload
+
+    def clear(self) -> None:
+        self._source = None
+        self._version = None
+        self._fragments = {}
+        self._payload = None
+
+
+component_catalog = ComponentCatalog()
@@ -1,8 +1,10 @@
 import gzip
+import hashlib
 import json
+from dataclasses import dataclass
 from typing import Any
 
-from fastapi import Response
+from fastapi import Request, Response, status
 from fastapi.encoders import jsonable_encoder
 
 
@@ -17,3 +19,45 @@ def compress_response(data: Any) -> Response:
         media_type="application/json",
         headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding", "Content-Length": str(len(compressed_data))},
     )
+
+
+@dataclass(frozen=True)
+class PrecompressedJSON:
+    """A JSON body serialized and compressed ahead of time, identified by a content-hash ETag."""
+
+    body: bytes
+    gzip_body: bytes
+    etag: str
+
+    @classmethod
+    def from_bytes(cls, body: bytes) -> "PrecompressedJSON":
+        return cls(
+            body=body,
+            gzip_body=gzip.compress(body, compresslevel=6),
+            etag=f'"{hashlib.sha256(body).hexdigest()}"',
+        )
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def precompressed_response(request: Request, payload: PrecompressedJSON) -> Response:
+    """Serve a precompressed JSON body, answering conditional requests with 304 Not Modified.
+
+    The gzip variant is sent unless the client explicitly advertises encodings without gzip.
+    """
+    headers = {"ETag": payload.etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, payload.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    accept_encoding = request.headers.get("accept-encoding")
+    if accept_encoding is None or "gzip" in accept_encoding.lower():
+        headers["Content-Encoding"] = "gzip"
+        content = payload.gzip_body
+    else:
+        content = payload.body
+    headers["Content-Length"] = str(len(content))
+    return Response(content=content, media_type="application/json", headers=headers)
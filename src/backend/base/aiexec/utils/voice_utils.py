@@ -1,6 +1,7 @@
 import asyncio
 import base64
 from pathlib import Path
+from typing import Any
 
 import numpy as np
 from scipy.signal import resample
@@ -43,6 +44,55 @@ def resample_24k_to_16k(frame_24k_bytes):
     return frame_16k.tobytes()
 
 
+def resample_24k_frames_to_16k(frames_24k_bytes: bytes) -> np.ndarray:
+    """Resample consecutive 20ms frames from 24kHz to 16kHz in a single call.
+
+    Each frame is resampled independently, exactly as `resample_24k_to_16k` would, but as one
+    vectorized operation over all frames.
+
+    Args:
+        frames_24k_bytes: 24kHz audio whose length is a multiple of 960 bytes
+
+    Returns:
+        An int16 array of shape (frames, 320), one row per 16kHz frame
+    """
+    if len(frames_24k_bytes) % BYTES_PER_24K_FRAME:
+        msg = f"Expected a multiple of {BYTES_PER_24K_FRAME} bytes for 24kHz frames, got {len(frames_24k_bytes)}"
+        raise ValueError(msg)
+    samples_per_frame = BYTES_PER_24K_FRAME // BYTES_PER_SAMPLE
+    frames_24k = np.frombuffer(frames_24k_bytes, dtype=np.int16).reshape(-1, samples_per_frame)
+    if not len(frames_24k):
+        return np.empty((0, BYTES_PER_16K_FRAME // BYTES_PER_SAMPLE), dtype=np.int16)
+    return resample(frames_24k, BYTES_PER_16K_FRAME // BYTES_PER_SAMPLE, axis=1).astype(np.int16)
+
+
+class VoiceActivityDetector:
+    """Buffers 24kHz PCM chunks and classifies complete 20ms frames with webrtcvad.
+
+    `process` is synchronous and CPU bound; it is meant to run in a worker thread. Only whole frames
+    are consumed, and the partial frame left over is carried to the next call.
+    """
+
+    def __init__(self, vad: Any) -> None:
+        self.vad = vad
+        self._pending = b""
+
+    def process(self, chunks: list[bytes]) -> bool:
+        """Append `chunks` to the buffer and return whether any complete frame contained speech."""
+        data = self._pending + b"".join(chunks)
+        usable = len(data) - len(data) % BYTES_PER_24K_FRAME
+        self._pending = data[usable:]
+        has_speech = False
+        for frame_16k in resample_24k_frames_to_16k(data[:usable]):
+            try:
+                if self.vad.is_speech(frame_16k.tobytes(), VAD_SAMPLE_RATE_16K):
+                    has_speech = True
+                    break
+            except Exception as e:  # noqa: BLE001
+                logger.error(f"[ERROR] VAD processing failed: {e}")
+        return has_speech
+
+
 # def resample_24k_to_16k(frame_24k_bytes: bytes) -> bytes:
 #    """
 #    Convert one 20ms chunk (960 bytes @ 24kHz) to 20ms @ 16kHz (640 bytes).
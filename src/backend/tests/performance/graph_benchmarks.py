@@ -0,0 +1,139 @@
+"""Helpers for the graph engine benchmark suite.
+
+The suite measures the engine in isolation: graphs are generated synthetically from offline components
+(no network, no database, no LLM providers) and each benchmark is timed over several rounds.
+
+Baselines live in `baselines/graph_engine.json` next to this module and are machine dependent, so the
+regression check is opt-in:
+
+    # record new baselines on the reference machine
+    AIEXEC_BENCHMARK_SAVE=1 uv run pytest src/backend/tests/performance/test_graph_engine.py
+
+    # fail when a benchmark is slower than baseline * threshold (default 1.5)
+    AIEXEC_BENCHMARK_COMPARE=1 AIEXEC_BENCHMARK_THRESHOLD=1.3 uv run pytest src/backend/tests/performance
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import statistics
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from wfx.components.input_output import ChatInput, TextOutputComponent
+from wfx.graph import Graph
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+BASELINES_PATH = Path(__file__).parent / "baselines" / "graph_engine.json"
+GRAPH_SIZES = [10, 100, 500, 2000]
+DEFAULT_THRESHOLD = 1.5
+
+
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "false").lower() in {"1", "true", "yes"}
+
+
+def build_layered_graph(num_vertices: int, width: int = 10) -> Graph:
+    """Build a layered graph with `num_vertices` vertices.
+
+    The first vertex is a ChatInput and every following layer holds up to `width` Text Output
+    components, each fed by a vertex of the previous layer.
+    """
+    chat_input = ChatInput(_id="ChatInput-root")
+    chat_input.set(should_store_message=False)
+    components: list[Any] = [chat_input]
+    previous_layer: list[Any] = [chat_input]
+    index = 0
+    while len(components) < num_vertices:
+        layer = []
+        for position in range(width):
+            if len(components) >= num_vertices:
+                break
+            parent = previous_layer[position % len(previous_layer)]
+            text_output = TextOutputComponent(_id=f"TextOutput-{index}")
+            index += 1
+            parent_output = parent.message_response if parent is chat_input else parent.text_response
+            text_output.set(input_value=parent_output)
+            layer.append(text_output)
+            components.append(text_output)
+        previous_layer = layer
+
+    graph = Graph()
+    for component in components:
+        graph.add_component(component)
+    return graph
+
+
+def build_payload(num_vertices: int, width: int = 10) -> dict:
+    """Return the flow payload (nodes and edges) of a synthetic layered graph."""
+    graph = build_layered_graph(num_vertices, width)
+    # Edges are only materialized from the components when the graph is prepared.
+    graph.prepare()
+    return graph.dump()["data"]
+
+
+class BenchmarkRecorder:
+    """Times benchmarks and compares them with the saved baselines."""
+
+    def __init__(self, baselines_path: Path = BASELINES_PATH) -> None:
+        self.baselines_path = baselines_path
+        self.save = _env_flag("AIEXEC_BENCHMARK_SAVE")
+        self.compare = _env_flag("AIEXEC_BENCHMARK_COMPARE")
+        self.threshold = float(os.getenv("AIEXEC_BENCHMARK_THRESHOLD", str(DEFAULT_THRESHOLD)))
+        self.baselines: dict[str, dict[str, float]] = {}
+        if baselines_path.exists():
+            self.baselines = json.loads(baselines_path.read_text(encoding="utf-8"))
+        self.results: dict[str, dict[str, float]] = {}
+
+    def _record(self, name: str, timings: list[float]) -> float:
+        median = statistics.median(timings)
+        self.results[name] = {"median": median, "min": min(timings), "rounds": len(timings)}
+        baseline = self.baselines.get(name)
+        if self.compare and baseline is not None:
+            limit = baseline["median"] * self.threshold
+            if median > limit:
+                msg = (
+                    f"Benchmark {name} regressed: median {median:.6f}s exceeds "
+                    f"baseline {baseline['median']:.6f}s x {self.threshold}"
+                )
+                raise AssertionError(msg)
+        return median
+
+    def measure(self, name: str, func: Callable[[Any], Any], *, rounds: int = 5, setup: Callable[[], Any]) -> float:
+        """Time `func(setup())` over `rounds` rounds and return the median; setup is not timed."""
+        timings = []
+        for _ in range(rounds):
+            args = setup()
+            start = time.perf_counter()
+            func(args)
+            timings.append(time.perf_counter() - start)
+        return self._record(name, timings)
+
+    def measure_async(
+        self,
+        name: str,
+        func: Callable[[Any], Awaitable[Any]],
+        *,
+        rounds: int = 5,
+        setup: Callable[[], Any],
+    ) -> float:
+        """Async variant of `measure`; each round runs in a fresh event loop."""
+        timings = []
+        for _ in range(rounds):
+            args = setup()
+            start = time.perf_counter()
+            asyncio.run(func(args))
+            timings.append(time.perf_counter() - start)
+        return self._record(name, timings)
+
+    def save_baselines(self) -> None:
+        if not self.save or not self.results:
+            return
+        merged = {**self.baselines, **self.results}
+        self.baselines_path.parent.mkdir(parents=True, exist_ok=True)
+        self.baselines_path.write_text(json.dumps(merged, indent=2, sort_keys=True) + "\n", encoding="utf-8")
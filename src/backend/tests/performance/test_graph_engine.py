@@ -0,0 +1,149 @@
+"""Benchmarks for the graph engine hot paths.
+
+Every benchmark runs against synthetic layered graphs of increasing size so that super-linear
+behavior shows up as a disproportionate jump between sizes. See `graph_benchmarks.py` for how
+baselines are recorded and compared.
+"""
+
+import asyncio
+import copy
+
+import pytest
+from wfx.events.event_manager import create_default_event_manager
+from wfx.graph import Graph
+from wfx.graph.graph.utils import layered_topological_sort
+from wfx.serialization import serialize
+
+from tests.performance.graph_benchmarks import GRAPH_SIZES, BenchmarkRecorder, build_payload
+
+pytestmark = pytest.mark.benchmark
+
+SIZES = [pytest.param(size, marks=pytest.mark.slow) if size >= 2000 else size for size in GRAPH_SIZES]
+
+
+def _rounds(size: int) -> int:
+    return 3 if size >= 500 else 5
+
+
+@pytest.fixture(scope="module")
+def recorder():
+    benchmark_recorder = BenchmarkRecorder()
+    yield benchmark_recorder
+    benchmark_recorder.save_baselines()
+
+
+@pytest.fixture(scope="module")
+def payloads():
+    return {}
+
+
+@pytest.fixture
+def payload(payloads, size):
+    if size not in payloads:
+        payloads[size] = build_payload(size)
+    return payloads[size]
+
+
+def _graph_from(payload: dict) -> Graph:
+    return Graph.from_payload(copy.deepcopy(payload))
+
+
+def _processed_graph(payload: dict) -> Graph:
+    graph = _graph_from(payload)
+    asyncio.run(graph.process(fallback_to_env_vars=False))
+    return graph
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_graph_from_payload(recorder, payload, size):
+    recorder.measure(
+        f"from_payload[{size}]",
+        Graph.from_payload,
+        rounds=_rounds(size),
+        setup=lambda: copy.deepcopy(payload),
+    )
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_layered_topological_sort(recorder, payload, size):
+    graph = _graph_from(payload)
+
+    def sort(_):
+        return layered_topological_sort(
+            vertices_ids=set(graph.get_vertex_ids()),
+            in_degree_map=graph.in_degree_map,
+            successor_map=graph.successor_map,
+            predecessor_map=graph.predecessor_map,
+        )
+
+    recorder.measure(f"layered_topological_sort[{size}]", sort, rounds=_rounds(size), setup=lambda: None)
+    assert sum(len(layer) for layer in sort(None)) == size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_sort_vertices(recorder, payload, size):
+    recorder.measure(
+        f"sort_vertices[{size}]",
+        lambda graph: graph.sort_vertices(),
+        rounds=_rounds(size),
+        setup=lambda: _graph_from(payload),
+    )
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_build_params(recorder, payload, size):
+    def build_params(graph: Graph) -> None:
+        for vertex in graph.vertices:
+            vertex.build_params()
+
+    recorder.measure(f"build_params[{size}]", build_params, rounds=_rounds(size), setup=lambda: _graph_from(payload))
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_graph_process(recorder, payload, size):
+    recorder.measure_async(
+        f"process[{size}]",
+        lambda graph: graph.process(fallback_to_env_vars=False),
+        rounds=_rounds(size),
+        setup=lambda: _graph_from(payload),
+    )
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_async_start(recorder, payload, size):
+    async def run(graph: Graph) -> None:
+        async for _ in graph.async_start():
+            pass
+
+    recorder.measure_async(f"async_start[{size}]", run, rounds=_rounds(size), setup=lambda: _graph_from(payload))
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_serialize_results(recorder, payload, size):
+    graph = _processed_graph(payload)
+    assert all(vertex.built for vertex in graph.vertices)
+    results = [vertex.result for vertex in graph.vertices]
+
+    recorder.measure(
+        f"serialize_results[{size}]",
+        lambda items: [serialize(item) for item in items],
+        rounds=_rounds(size),
+        setup=lambda: results,
+    )
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_event_emission(recorder, payload, size):
+    graph = _processed_graph(payload)
+    build_data = [{"id": vertex.id, "data": vertex.result} for vertex in graph.vertices]
+
+    def emit(event_manager) -> None:
+        for data in build_data:
+            event_manager.on_end_vertex(data={"build_data": data})
+
+    recorder.measure(
+        f"event_emission[{size}]",
+        emit,
+        rounds=_rounds(size),
+        setup=lambda: create_default_event_manager(asyncio.Queue()),
+    )
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
@@ -145,6 +146,33 @@ async def test_astore_message():
     assert stored_messages[0].text == "Stored message"
 
 
+@pytest.mark.usefixtures("client")
+async def test_astore_message_concurrent_writes_keep_session_order():
+    session_id = "concurrent_session_id"
+    messages = [
+        Message(text=f"Message {i}", sender="User", sender_name="User", session_id=session_id) for i in range(10)
+    ]
+
+    results = await asyncio.gather(*[astore_message(message) for message in messages])
+
+    assert len({result[0].id for result in results}) == len(messages)
+    stored_messages = await aget_messages(session_id=session_id, order="ASC")
+    assert [message.text for message in stored_messages] == [message.text for message in messages]
+
+
+@pytest.mark.usefixtures("client")
+async def test_astore_message_updates_existing_message():
+    session_id = "update_session_id"
+    stored = (await astore_message(Message(text="Draft", sender="AI", sender_name="AI", session_id=session_id)))[0]
+    stored.text = "Final"
+
+    updated = await asyncio.gather(*[astore_message(stored) for _ in range(3)])
+
+    assert all(result[0].id == stored.id for result in updated)
+    stored_messages = await aget_messages(session_id=session_id)
+    assert [message.text for message in stored_messages] == ["Final"]
+
+
 @pytest.mark.parametrize("method_name", ["message", "convert_to_langchain_type"])
 def test_convert_to_langchain(method_name):
     def convert(value):
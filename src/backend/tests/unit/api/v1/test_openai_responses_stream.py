@@ -0,0 +1,82 @@
+import json
+
+from aiexec.api.v1.openai_responses_stream import OpenAIResponsesStreamTranslator
+from aiexec.schema import OpenAIResponsesRequest
+from wfx.events.event_manager import FlowEvent
+
+
+def _translator(**request_kwargs) -> OpenAIResponsesStreamTranslator:
+    request = OpenAIResponsesRequest(model="flow-id", input="hi", stream=True, **request_kwargs)
+    return OpenAIResponsesStreamTranslator(request, response_id="resp-1", created=0)
+
+
+def _contents(sse_events: list[str]) -> list[str]:
+    return [
+        json.loads(event.removeprefix("data: "))["delta"]["content"]
+        for event in sse_events
+        if event.startswith("data: ")
+    ]
+
+
+def _agent_message(text: str = "", contents: list | None = None) -> dict:
+    return {
+        "id": "msg-1",
+        "text": text,
+        "sender": "Machine",
+        "sender_name": "AI",
+        "content_blocks": [{"title": "Agent Steps", "contents": contents or []}],
+    }
+
+
+def test_token_events_are_forwarded():
+    translator = _translator()
+    assert _contents(translator.translate(FlowEvent("token", {"chunk": "Hel", "id": "m"}))) == ["Hel"]
+    assert translator.translate(FlowEvent("token", {"chunk": "", "id": "m"})) == []
+
+
+def test_text_deltas_are_forwarded_without_diffing():
+    translator = _translator()
+    assert translator.translate(FlowEvent("add_message", _agent_message())) == []
+
+    first = translator.translate(FlowEvent("message_delta", {"id": "msg-1", "seq": 1, "text_append": "Hello"}))
+    second = translator.translate(FlowEvent("message_delta", {"id": "msg-1", "seq": 2, "text_append": " world"}))
+
+    assert _contents(first + second) == ["Hello", " world"]
+    assert translator.sent_text == "Hello world"
+
+
+def test_snapshot_after_deltas_only_sends_new_text():
+    translator = _translator()
+    translator.translate(FlowEvent("add_message", _agent_message()))
+    translator.translate(FlowEvent("message_delta", {"id": "msg-1", "seq": 1, "text_append": "Hello"}))
+
+    events = translator.translate(FlowEvent("add_message", _agent_message("Hello world")))
+    assert _contents(events) == [" world"]
+
+
+def test_user_input_echo_is_not_streamed():
+    translator = _translator()
+    assert translator.translate(FlowEvent("add_message", _agent_message("hi"))) == []
+
+
+def test_tool_call_is_emitted_once_when_output_is_known():
+    translator = _translator()
+    pending = {"type": "tool_use", "name": "search", "tool_input": {"q": "x"}, "output": None}
+    done = {**pending, "output": "found"}
+
+    assert translator.translate(FlowEvent("add_message", _agent_message(contents=[pending]))) == []
+    events = translator.translate(
+        FlowEvent("message_delta", {"id": "msg-1", "seq": 1, "contents": [{"block": 0, "index": 0, "content": done}]})
+    )
+    assert [event.split("\n", 1)[0] for event in events] == [
+        "event: response.output_item.added",
+        "event: response.function_call_arguments.delta",
+        "event: response.function_call_arguments.done",
+        "event: response.output_item.done",
+    ]
+
+    # A later snapshot, or another message echoing the same call, does not emit it again
+    assert translator.translate(FlowEvent("add_message", _agent_message(contents=[done]))) == []
+    echoed = {**_agent_message(contents=[done]), "id": "msg-2"}
+    assert translator.translate(FlowEvent("add_message", echoed)) == []
+    assert translator.tool_call_counter == 1
@@ -376,3 +376,30 @@ class TestDirectoryComponent(ComponentTestBaseWithoutClient):
             actual_texts = [r.text for r in results]
             expected_texts = ["content1", "content2"]
             assert actual_texts == expected_texts, f"Expected texts {expected_texts}, got {actual_texts}"
+
+    def test_directory_with_manifest_loads_only_changed_files(self):
+        """Test that a manifest makes re-runs skip files that did not change."""
+        directory_component = DirectoryComponent()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / "docs").mkdir()
+            (Path(temp_dir) / "docs" / "a.txt").write_text("alpha", encoding="utf-8")
+            (Path(temp_dir) / "docs" / "b.txt").write_text("beta", encoding="utf-8")
+            manifest_path = Path(temp_dir) / "manifest.json"
+            directory_component.set_attributes(
+                {
+                    "path": str(Path(temp_dir) / "docs"),
+                    "types": ["txt"],
+                    "use_multithreading": False,
+                    "silent_errors": False,
+                    "manifest_path": str(manifest_path),
+                }
+            )
+
+            assert sorted(r.text for r in directory_component.load_directory()) == ["alpha", "beta"]
+            assert manifest_path.exists()
+
+            assert directory_component.load_directory() == []
+
+            (Path(temp_dir) / "docs" / "b.txt").write_text("beta v2", encoding="utf-8")
+            assert [r.text for r in directory_component.load_directory()] == ["beta v2"]
@@ -1,3 +1,4 @@
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
@@ -36,8 +37,8 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
 
     @pytest.fixture
     def mock_recursive_loader(self):
-        """Mock the RecursiveUrlLoader.load method."""
-        with patch("langchain_community.document_loaders.RecursiveUrlLoader.load") as mock:
+        """Mock the WebCrawler.crawl method."""
+        with patch("wfx.base.data.web_crawler.WebCrawler.crawl") as mock:
             yield mock
 
     def test_url_component_basic_functionality(self, mock_recursive_loader):
@@ -205,6 +206,23 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         with pytest.raises(ValueError, match="Error loading documents:"):
             component.fetch_content()
 
+    def test_url_component_loads_urls_concurrently(self, mock_recursive_loader):
+        """Test that URLs are crawled in parallel and results keep the input order."""
+        component = URLComponent()
+        urls = ["https://example1.com", "https://example2.com"]
+        component.set_attributes({"urls": urls})
+        # Both loads must be in flight at the same time for the barrier to release
+        barrier = threading.Barrier(len(urls), timeout=5)
+
+        def load(_url):
+            barrier.wait()
+            return [Mock(page_content="content", metadata={"source": "https://example.com"})]
+
+        mock_recursive_loader.side_effect = load
+
+        data_frame = component.fetch_content()
+        assert len(data_frame) == len(urls)
+
     def test_url_component_ensure_url(self):
         """Test URLComponent's ensure_url method."""
         component = URLComponent()
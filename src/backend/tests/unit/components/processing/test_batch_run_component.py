@@ -1,4 +1,6 @@
+import asyncio
 import re
+from unittest.mock import patch
 
 import pytest
 from wfx.components.processing.batch_run import BatchRunComponent
@@ -102,7 +104,7 @@ class TestBatchRunComponent(ComponentTestBaseWithoutClient):
             def with_config(self, *_, **__):
                 return self
 
-            async def abatch(self, *_):
+            async def ainvoke(self, *_):
                 msg = "Mock error during batch processing"
                 raise AttributeError(msg)
 
@@ -131,7 +133,7 @@ class TestBatchRunComponent(ComponentTestBaseWithoutClient):
             def with_config(self, *_, **__):
                 return self
 
-            async def abatch(self, *_):
+            async def ainvoke(self, *_):
                 msg = "Mock error during batch processing"
                 raise AttributeError(msg)
 
@@ -256,3 +258,129 @@ class TestBatchRunComponent(ComponentTestBaseWithoutClient):
         )
         result_dicts = result.to_dict("records")
         assert all(row["metadata"]["processing_status"] == "success" for row in result_dicts)
+
+    async def test_failing_row_is_retried(self):
+        attempts: dict[str, int] = {}
+
+        class FlakyModel(MockLanguageModel):
+            async def ainvoke(self, messages, *args, **kwargs):
+                content = messages[-1]["content"]
+                attempts[content] = attempts.get(content, 0) + 1
+                if content == "flaky" and attempts[content] < 2:
+                    msg = "rate limited"
+                    raise RuntimeError(msg)
+                return await super().ainvoke(messages, *args, **kwargs)
+
+        component = BatchRunComponent(
+            model=FlakyModel(),
+            df=DataFrame({"text": ["ok", "flaky"]}),
+            column_name="text",
+            enable_metadata=True,
+        )
+        component.max_retries = 2
+        with patch("wfx.base.processing.batch.asyncio.sleep"):
+            result = await component.run_batch()
+
+        assert attempts == {"ok": 1, "flaky": 2}
+        assert result["model_response"].tolist() == ["Response for ok", "Response for flaky"]
+
+    async def test_row_failing_after_retries_is_marked_failed(self):
+        class FailingModel(MockLanguageModel):
+            async def ainvoke(self, messages, *args, **kwargs):
+                if messages[-1]["content"] == "bad":
+                    msg = "provider error"
+                    raise RuntimeError(msg)
+                return await super().ainvoke(messages, *args, **kwargs)
+
+        component = BatchRunComponent(
+            model=FailingModel(),
+            df=DataFrame({"text": ["good", "bad"]}),
+            column_name="text",
+            enable_metadata=True,
+        )
+        component.max_retries = 1
+        with patch("wfx.base.processing.batch.asyncio.sleep"):
+            result = await component.run_batch()
+
+        rows = result.to_dict("records")
+        assert rows[0]["metadata"]["processing_status"] == "success"
+        assert rows[1]["metadata"] == {"error": "provider error", "processing_status": "failed"}
+        assert rows[1]["model_response"] == ""
+        assert rows[0]["model_response_error"] is None
+        assert rows[1]["model_response_error"] == "provider error"
+
+    async def test_failed_rows_are_reported_without_metadata(self):
+        class FailingModel(MockLanguageModel):
+            async def ainvoke(self, messages, *args, **kwargs):
+                if messages[-1]["content"] == "bad":
+                    msg = "provider error"
+                    raise RuntimeError(msg)
+                return await super().ainvoke(messages, *args, **kwargs)
+
+        component = BatchRunComponent(
+            model=FailingModel(),
+            df=DataFrame({"text": ["good", "bad"]}),
+            column_name="text",
+            output_column_name="answer",
+        )
+        component.max_retries = 0
+        result = await component.run_batch()
+
+        assert "metadata" not in result.columns
+        assert list(result["answer_error"]) == [None, "provider error"]
+
+    async def test_batch_raises_when_every_row_fails(self):
+        class FailingModel(MockLanguageModel):
+            async def ainvoke(self, *_args, **_kwargs):
+                msg = "provider down"
+                raise RuntimeError(msg)
+
+        component = BatchRunComponent(model=FailingModel(), df=DataFrame({"text": ["a", "b"]}), column_name="text")
+        component.max_retries = 0
+
+        with pytest.raises(RuntimeError, match="All 2 rows failed after retries: provider down"):
+            await component.run_batch()
+
+    async def test_concurrency_is_bounded(self):
+        in_flight = 0
+        peak = 0
+
+        class SlowModel(MockLanguageModel):
+            async def ainvoke(self, messages, *args, **kwargs):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return await super().ainvoke(messages, *args, **kwargs)
+
+        component = BatchRunComponent(
+            model=SlowModel(),
+            df=DataFrame({"text": [str(i) for i in range(10)]}),
+            column_name="text",
+        )
+        component.max_concurrency = 3
+        result = await component.run_batch()
+
+        assert peak == 3
+        assert result["model_response"].tolist() == [f"Response for {i}" for i in range(10)]
+
+    async def test_checkpoint_resumes_completed_rows(self, tmp_path):
+        checkpoint_path = str(tmp_path / "batch.jsonl")
+        calls: list[str] = []
+
+        class CountingModel(MockLanguageModel):
+            async def ainvoke(self, messages, *args, **kwargs):
+                calls.append(messages[-1]["content"])
+                return await super().ainvoke(messages, *args, **kwargs)
+
+        def run(texts):
+            component = BatchRunComponent(model=CountingModel(), df=DataFrame({"text": texts}), column_name="text")
+            component.checkpoint_path = checkpoint_path
+            return component.run_batch()
+
+        await run(["a", "b"])
+        result = await run(["a", "changed", "c"])
+
+        assert calls == ["a", "b", "changed", "c"]
+        assert result["model_response"].tolist() == ["Response for a", "Response for changed", "Response for c"]
@@ -1,7 +1,13 @@
+import json
 from unittest.mock import AsyncMock
 
 import pytest
-from wfx.components.processing.lambda_filter import LambdaFilterComponent
+from wfx.components.processing.lambda_filter import (
+    LambdaFilterComponent,
+    _generated_lambda_cache,
+    _json_head,
+    _json_tail,
+)
 from wfx.schema import Data
 
 from tests.base import ComponentTestBaseWithoutClient
@@ -26,6 +32,12 @@ class TestLambdaFilterComponent(ComponentTestBaseWithoutClient):
     def file_names_mapping(self):
         return []
 
+    @pytest.fixture(autouse=True)
+    def clear_lambda_cache(self):
+        _generated_lambda_cache.clear()
+        yield
+        _generated_lambda_cache.clear()
+
     async def test_invalid_lambda_response(self, component_class, default_kwargs):
         component = await self.component_setup(component_class, default_kwargs)
         component.llm.ainvoke.return_value.content = "invalid lambda syntax"
@@ -106,6 +118,59 @@ class TestLambdaFilterComponent(ComponentTestBaseWithoutClient):
         assert filtered_items[0]["id"] == 3, f"Expected id 3, got {filtered_items[0]['id']}"
         assert filtered_items[0]["score"] == 95, f"Expected score 95, got {filtered_items[0]['score']}"
 
+    async def test_generated_lambda_is_reused(self, component_class, default_kwargs):
+        """Both outputs and later runs with the same instruction and data structure reuse the lambda."""
+        component = await self.component_setup(component_class, default_kwargs)
+        component.llm.ainvoke.return_value.content = "lambda x: [item for item in x['items'] if item['value'] > 15]"
+
+        data_result = await component.process_as_data()
+        dataframe_result = await component.process_as_dataframe()
+
+        default_kwargs["data"] = [Data(data={"items": [{"name": "test3", "value": 30}]})]
+        other_run = await self.component_setup(component_class, {**default_kwargs, "llm": component.llm})
+        other_run._vertex.graph = component.graph
+        other_result = await other_run.process_as_data()
+
+        assert component.llm.ainvoke.await_count == 1
+        assert data_result.data["_results"] == [{"name": "test2", "value": 20}]
+        assert len(dataframe_result) == 1
+        assert other_result.data["_results"] == [{"name": "test3", "value": 30}]
+
+    async def test_generated_lambda_is_not_shared_across_flows(self, component_class, default_kwargs):
+        component = await self.component_setup(component_class, default_kwargs)
+        component.llm.ainvoke.return_value.content = "lambda x: x['items'][0]"
+        other_flow = await self.component_setup(component_class, {**default_kwargs, "llm": component.llm})
+        component.graph.user_id = other_flow.graph.user_id = "user"
+
+        await component.process_as_data()
+        await other_flow.process_as_data()
+        await component.process_as_data()
+
+        assert component.llm.ainvoke.await_count == 2
+
+    async def test_failing_cached_lambda_is_regenerated(self, component_class, default_kwargs):
+        component = await self.component_setup(component_class, default_kwargs)
+        component.llm.ainvoke.return_value.content = "lambda x: x['missing']"
+
+        with pytest.raises(KeyError):
+            await component.process_as_data()
+        component.llm.ainvoke.return_value.content = "lambda x: x['items'][0]"
+        result = await component.process_as_data()
+
+        assert component.llm.ainvoke.await_count == 2
+        assert result.data == {"name": "test1", "value": 10}
+
+    def test_head_and_tail_sample_match_the_full_dump(self):
+        data = {"items": [{"name": f"test{i}", "value": i, "tags": ["a", None]} for i in range(2000)]}
+        dump = json.dumps(data)
+
+        head, is_large = _json_head(data, 30000)
+
+        assert is_large
+        assert head[:1000] == dump[:1000]
+        assert _json_tail(data, 1000) == dump[-1000:]
+        assert _json_head([1, 2], 30000) == (json.dumps([1, 2]), False)
+
     def test_validate_lambda(self, component_class):
         component = component_class()
 
@@ -1,5 +1,6 @@
 import pytest
 from wfx.components.data import URLComponent
+from wfx.base.textsplitters.manifest import SplitManifest
 from wfx.components.processing import SplitTextComponent
 from wfx.schema import Data, DataFrame
 
@@ -246,6 +247,88 @@ class TestSplitTextComponent(ComponentTestBaseWithoutClient):
         assert "Another text" in results["text"][2], f"Expected 'Another text', got '{results['text'][2]}'"
         assert "Another line" in results["text"][3], f"Expected 'Another line', got '{results['text'][3]}'"
 
+    def test_stream_chunks_matches_batch_split_with_offsets_and_ids(self):
+        """Streaming yields the same chunks, with their start index and a stable chunk id."""
+        attributes = {
+            "data_inputs": [Data(text="First text\nSecond line"), Data(text="Another text\nAnother line")],
+            "chunk_overlap": 0,
+            "chunk_size": 10,
+            "separator": "\n",
+        }
+        batch_component = SplitTextComponent()
+        batch_component.set_attributes(attributes)
+        stream_component = SplitTextComponent()
+        stream_component.set_attributes({**attributes, "stream_chunks": True})
+
+        batch_results = batch_component.split_text()
+        stream_results = stream_component.split_text()
+
+        assert list(stream_results["text"]) == list(batch_results["text"])
+        assert list(stream_results["start_index"]) == [0, 11, 0, 13]
+        assert list(stream_results["chunk_index"]) == [0, 1, 0, 1]
+        assert stream_results["chunk_id"].is_unique
+        assert list(stream_component.split_text()["chunk_id"]) == list(stream_results["chunk_id"])
+
+    def test_stream_chunks_skips_documents_in_the_split_manifest(self, tmp_path):
+        """Documents already split with the same settings are skipped when a manifest is used."""
+        manifest_path = str(tmp_path / "split_manifest.jsonl")
+        attributes = {
+            "data_inputs": [Data(text="First text\nSecond line")],
+            "chunk_overlap": 0,
+            "chunk_size": 10,
+            "separator": "\n",
+            "stream_chunks": True,
+            "split_manifest_path": manifest_path,
+        }
+        component = SplitTextComponent()
+        component.set_attributes(attributes)
+        assert len(component.split_text()) == 2
+
+        component = SplitTextComponent()
+        component.set_attributes(
+            {**attributes, "data_inputs": [Data(text="First text\nSecond line"), Data(text="New text")]}
+        )
+        results = component.split_text()
+        assert list(results["text"]) == ["New text"]
+
+        component = SplitTextComponent()
+        component.set_attributes({**attributes, "chunk_size": 100})
+        assert len(component.split_text()) == 1
+
+    def test_split_manifest_is_only_updated_once_every_chunk_is_consumed(self, tmp_path):
+        """Documents are not marked as split when the chunks are not fully consumed."""
+        manifest_path = tmp_path / "split_manifest.jsonl"
+        component = SplitTextComponent()
+        component.set_attributes(
+            {
+                "data_inputs": [Data(text="First text"), Data(text="Second text")],
+                "chunk_overlap": 0,
+                "chunk_size": 100,
+                "separator": "\n",
+                "stream_chunks": True,
+                "split_manifest_path": str(manifest_path),
+            }
+        )
+
+        chunks = component.iter_chunks()
+        next(chunks)
+        chunks.close()
+        assert not manifest_path.exists() or SplitManifest(manifest_path).keys == set()
+
+        assert len(list(component.iter_chunks())) == 2
+        assert len(SplitManifest(manifest_path).keys) == 2
+
+    def test_split_manifest_appends_after_a_truncated_line(self, tmp_path):
+        """A line cut short by an interrupted write does not swallow the next recorded key."""
+        path = tmp_path / "split_manifest.jsonl"
+        path.write_bytes(b'{"key": "a"}\n{"key": "b')
+
+        manifest = SplitManifest(path)
+        manifest.record("c")
+        manifest.close()
+
+        assert SplitManifest(path).keys == {"a", "c"}
+
     def test_with_url_loader(self):
         """Test splitting text with URL loader."""
         component = SplitTextComponent()
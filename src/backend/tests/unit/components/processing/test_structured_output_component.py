@@ -8,7 +8,9 @@ from aiexec.helpers.base_model import build_model_from_schema
 from aiexec.inputs.inputs import TableInput
 from langchain_openai import ChatOpenAI
 from pydantic import BaseModel
-from wfx.components.processing.structured_output import StructuredOutputComponent
+from wfx.components.processing.structured_output import StructuredOutputComponent, _get_output_model
+from wfx.schema.data import Data
+from wfx.schema.dataframe import DataFrame
 
 from tests.base import ComponentTestBaseWithoutClient
 from tests.unit.mock_language_model import MockLanguageModel
@@ -1038,3 +1040,82 @@ class TestStructuredOutputComponent(ComponentTestBaseWithoutClient):
             pytest.raises(ValueError, match="No structured output returned"),
         ):
             component.build_structured_dataframe()
+
+    async def test_build_batch_dataframe_reports_errors_per_row(self):
+        """Test that batch mode extracts every row and records failures as error rows."""
+
+        class MockExtractor:
+            def with_config(self, *_, **__):
+                return self
+
+            async def ainvoke(self, messages):
+                text = messages[-1].content
+                if text == "boom":
+                    msg = "extraction failed"
+                    raise RuntimeError(msg)
+
+                class MockBaseModel(BaseModel):
+                    def model_dump(self, **__):
+                        return {"objects": [{"field": text}, {"field": text.upper()}]}
+
+                return {"messages": [], "responses": [MockBaseModel()], "response_metadata": [], "attempts": 1}
+
+        component = StructuredOutputComponent(
+            llm=MockLanguageModel(),
+            schema_name="TestSchema",
+            output_schema=[{"name": "field", "type": "str", "description": "A test field"}],
+            system_prompt="Test system prompt",
+            batch_input=[DataFrame([{"text": "a"}, {"text": "boom"}]), Data(data={"text": "b"})],
+            max_retries=0,
+        )
+
+        with patch("wfx.components.processing.structured_output.create_extractor", return_value=MockExtractor()):
+            result = await component.build_batch_dataframe()
+
+        records = result.to_dict(orient="records")
+        assert [(record["row_index"], record["field"]) for record in records if record["error"] is None] == [
+            (0, "a"),
+            (0, "A"),
+            (2, "b"),
+            (2, "B"),
+        ]
+        failed = [record for record in records if record["error"] is not None]
+        assert len(failed) == 1
+        assert failed[0]["row_index"] == 1
+        assert "extraction failed" in failed[0]["error"]
+
+    async def test_build_batch_dataframe_rejects_fields_named_like_batch_columns(self):
+        """Test that batch mode refuses schema fields the row_index and error columns would overwrite."""
+        component = StructuredOutputComponent(
+            llm=MockLanguageModel(),
+            schema_name="TestSchema",
+            output_schema=[{"name": "error", "type": "str", "description": "An error message"}],
+            system_prompt="Test system prompt",
+            batch_input=[Data(data={"text": "a"})],
+        )
+
+        with pytest.raises(ValueError, match="clash with the columns"):
+            await component.build_batch_dataframe()
+
+    def test_input_message_is_only_needed_outside_batch_mode(self):
+        """Test that the input message is optional in the template but required by the single-input outputs."""
+        input_value = next(input_ for input_ in StructuredOutputComponent.inputs if input_.name == "input_value")
+        assert not input_value.required
+
+        component = StructuredOutputComponent(
+            llm=MockLanguageModel(),
+            schema_name="TestSchema",
+            output_schema=[{"name": "field", "type": "str", "description": "A test field"}],
+            system_prompt="Test system prompt",
+        )
+        with pytest.raises(ValueError, match="Input Message cannot be empty"):
+            component.build_structured_output_base()
+
+    def test_output_model_is_cached_per_schema(self):
+        """Test that the output model is built once per schema and reused by later runs."""
+        schema = [{"name": "field", "type": "str", "description": "A test field"}]
+
+        first = _get_output_model("TestSchema", schema)
+
+        assert _get_output_model("TestSchema", [dict(schema[0])]) is first
+        assert _get_output_model("OtherSchema", schema) is not first
@@ -217,12 +217,14 @@ class TestChromaVectorStoreComponent(ComponentTestBaseWithoutClient):
 
         documents = results["documents"]
 
-        # The documents are returned in a list structure
-        assert len(documents) == 3  # All documents are added, even duplicates
+        # The duplicate is recognized by its content hash and only stored once
+        assert len(documents) == 2
+        assert set(documents) == {"This is a test document", "This is another document"}
 
-        # Count unique texts
-        unique_texts = set(documents)
-        assert len(unique_texts) == 2  # Should have 2 unique texts
+        # Ingesting the same data again adds nothing
+        component = component_class().set(**default_kwargs)
+        vector_store = component.build_vector_store()
+        assert vector_store._collection.count() == 2
 
         # Test with allow_duplicates=True
         test_data = [
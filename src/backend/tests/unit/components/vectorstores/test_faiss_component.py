@@ -0,0 +1,133 @@
+import threading
+
+import pytest
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from wfx.base.vectorstores.index_cache import loaded_index_cache
+from wfx.schema.data import Data
+
+pytest.importorskip("faiss")
+pytest.importorskip("langchain_community")
+
+from wfx.components.FAISS.faiss import FaissVectorStoreComponent
+
+
+class CountingEmbedding(DeterministicFakeEmbedding):
+    model: str = "fake-model"
+    embedded: list[str] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.embedded.extend(texts)
+        return super().embed_documents(texts)
+
+
+@pytest.fixture(autouse=True)
+def clear_index_cache():
+    loaded_index_cache.clear()
+    yield
+    loaded_index_cache.clear()
+
+
+@pytest.fixture
+def embedding():
+    return CountingEmbedding(size=8, embedded=[])
+
+
+def build(tmp_path, embedding, texts, **kwargs):
+    component = FaissVectorStoreComponent(
+        index_name="test_index",
+        persist_directory=str(tmp_path),
+        embedding=embedding,
+        ingest_data=[Data(text=text) for text in texts],
+        should_cache_vector_store=False,
+        **kwargs,
+    )
+    return component.build_vector_store()
+
+
+def stored_texts(faiss):
+    return sorted(faiss.docstore.search(id_).page_content for id_ in faiss.index_to_docstore_id.values())
+
+
+def test_index_is_updated_incrementally(tmp_path, embedding):
+    first = build(tmp_path, embedding, ["a", "b"])
+    second = build(tmp_path, embedding, ["b", "c"])
+
+    assert embedding.embedded == ["a", "b", "c"]
+    assert stored_texts(second) == ["a", "b", "c"]
+    # The index other flows received before the update is not modified
+    assert stored_texts(first) == ["a", "b"]
+
+
+def test_partial_ingest_keeps_the_documents_already_indexed(tmp_path, embedding):
+    build(tmp_path, embedding, ["a", "b", "c"])
+
+    faiss = build(tmp_path, embedding, ["b"])
+
+    assert stored_texts(faiss) == ["a", "b", "c"]
+    assert embedding.embedded == ["a", "b", "c"]
+
+
+def test_missing_documents_are_removed_when_requested(tmp_path, embedding):
+    build(tmp_path, embedding, ["a", "b"])
+
+    faiss = build(tmp_path, embedding, ["b", "c"], remove_missing_documents=True)
+
+    assert stored_texts(faiss) == ["b", "c"]
+    assert stored_texts(build(tmp_path, embedding, [])) == ["b", "c"]
+
+
+def test_index_is_rebuilt_when_the_embedding_model_changes(tmp_path, embedding):
+    build(tmp_path, embedding, ["a", "b"])
+    other = CountingEmbedding(size=8, model="other-model", embedded=[])
+
+    faiss = build(tmp_path, other, ["c"])
+
+    assert sorted(other.embedded) == ["a", "b", "c"]
+    assert stored_texts(faiss) == ["a", "b", "c"]
+    # Later builds with the new model are incremental again
+    build(tmp_path, other, ["d"])
+    assert sorted(other.embedded) == ["a", "b", "c", "d"]
+
+
+def test_unchanged_index_is_not_saved_again(tmp_path, embedding):
+    build(tmp_path, embedding, ["a", "b"])
+    index_file = tmp_path / "test_index.faiss"
+    modified = index_file.stat().st_mtime_ns
+
+    faiss = build(tmp_path, embedding, ["b", "a"])
+
+    assert index_file.stat().st_mtime_ns == modified
+    assert stored_texts(faiss) == ["a", "b"]
+    assert embedding.embedded == ["a", "b"]
+
+
+def test_index_is_reloaded_from_disk(tmp_path, embedding):
+    build(tmp_path, embedding, ["a", "b"])
+    loaded_index_cache.clear()
+
+    faiss = build(tmp_path, embedding, [])
+
+    assert stored_texts(faiss) == ["a", "b"]
+
+
+def test_concurrent_builds_add_each_document_once(tmp_path, embedding):
+    build(tmp_path, embedding, ["a"])
+    barrier = threading.Barrier(4)
+    errors: list[Exception] = []
+
+    def run():
+        barrier.wait()
+        try:
+            build(tmp_path, embedding, ["a", "b", "c"])
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert stored_texts(build(tmp_path, embedding, [])) == ["a", "b", "c"]
+    assert sorted(embedding.embedded) == ["a", "b", "c"]
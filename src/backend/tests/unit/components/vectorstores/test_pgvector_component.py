@@ -0,0 +1,66 @@
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.documents import Document
+from sqlalchemy import Column, String, create_engine
+from sqlalchemy.orm import Session, declarative_base
+
+pytest.importorskip("langchain_community")
+
+from wfx.components.pgvector.pgvector import PGVectorStoreComponent
+
+Base = declarative_base()
+
+
+class EmbeddingStore(Base):
+    """The columns of langchain_community's PGVector embedding table used by the id lookup."""
+
+    __tablename__ = "embedding"
+
+    id = Column(String, primary_key=True)
+    collection_id = Column(String)
+    custom_id = Column(String)
+
+
+@pytest.fixture
+def vector_store():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            [
+                EmbeddingStore(id="1", collection_id="docs", custom_id="a"),
+                EmbeddingStore(id="2", collection_id="docs", custom_id="b"),
+                EmbeddingStore(id="3", collection_id="other", custom_id="c"),
+            ]
+        )
+        session.commit()
+    return SimpleNamespace(
+        _bind=engine,
+        EmbeddingStore=EmbeddingStore,
+        get_collection=lambda _session: SimpleNamespace(uuid="docs"),
+    )
+
+
+def test_stored_ids_are_looked_up_in_the_collection(vector_store):
+    component = PGVectorStoreComponent()
+
+    stored = component._get_stored_ids(vector_store, ["a", "b", "c", "d"])
+
+    assert stored == {"a", "b"}
+
+
+def test_filter_stored_documents_skips_rows_already_in_the_collection(vector_store):
+    component = PGVectorStoreComponent()
+    documents = [Document(page_content="first"), Document(page_content="new")]
+
+    kept, ids = component._filter_stored_documents(vector_store, documents, ["a", "d"])
+
+    assert [document.page_content for document in kept] == ["new"]
+    assert ids == ["d"]
+
+
+def test_missing_collection_has_no_stored_ids(vector_store):
+    vector_store.get_collection = lambda _session: None
+
+    assert PGVectorStoreComponent()._get_stored_ids(vector_store, ["a"]) == set()
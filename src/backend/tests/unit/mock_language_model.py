@@ -38,6 +38,10 @@ class MockLanguageModel(BaseLanguageModel, BaseModel):
             responses.append(mock_response)
         return responses
 
+    @override
+    async def ainvoke(self, messages, *args, **kwargs):
+        return (await self.abatch([messages], *args, **kwargs))[0]
+
     @override
     def invoke(self, *args, **kwargs):
         return self
@@ -344,3 +344,54 @@ class TestSerializationHypothesis:
         assert isinstance(result, dict)
         assert len(result) == MAX_ITEMS_LENGTH
         assert all(isinstance(v, int) for v in result.values())
+
+    def test_json_native_containers_are_copied_not_aliased(self) -> None:
+        """Flat JSON-native containers skip per-item dispatch but still return a new container."""
+        data = {"a": 1, "b": "text", "c": None, "d": 1.5, "e": True}
+        result = serialize(data)
+        assert result == data
+        assert result is not data
+
+        items = (1, "two", 3.0)
+        result = serialize(items)
+        assert result == [1, "two", 3.0]
+        assert isinstance(result, list)
+
+    def test_json_native_containers_still_truncate(self) -> None:
+        """The no-copy path does not bypass string or item truncation."""
+        result = serialize({"text": "x" * 20}, max_length=5)
+        assert result == {"text": "xxxxx..."}
+
+        result = serialize(list(range(10)), max_items=3)
+        assert result == [0, 1, 2, "... [truncated 7 items]"]
+
+    def test_dispatch_cache_keeps_subclass_behavior(self) -> None:
+        """Types resolved once through the dispatch cache serialize the same on later calls."""
+
+        class Model(PydanticBaseModel):
+            value: int
+
+        class Tagged(str):
+            __slots__ = ()
+
+        for _ in range(2):
+            assert serialize(Model(value=1)) == {"value": 1}
+            assert serialize(Tagged("x" * 20), max_length=5) == "xxxxx..."
+            assert serialize(np.int64(7)) == 7
+            assert serialize(Model) == repr(Model)
+
+    def test_dispatch_cache_does_not_keep_types_alive(self) -> None:
+        """Classes created at runtime can be garbage collected after being serialized."""
+        import gc
+        import weakref
+
+        from pydantic import create_model
+
+        model = create_model("DynamicModel", value=(int, ...))
+        assert serialize(model(value=1)) == {"value": 1}
+        model_ref = weakref.ref(model)
+
+        del model
+        gc.collect()
+
+        assert model_ref() is None
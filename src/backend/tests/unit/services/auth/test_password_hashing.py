@@ -0,0 +1,47 @@
+"""Test that password hashing runs off the event loop on the bounded auth executor."""
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+from aiexec.services.auth import utils as auth_utils
+from passlib.context import CryptContext
+
+
+@pytest.fixture
+def mock_settings_service():
+    mock_service = Mock()
+    mock_service.auth_settings.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    mock_service.auth_settings.PASSWORD_HASHING_MAX_WORKERS = 2
+    with patch("aiexec.services.auth.utils.get_settings_service", return_value=mock_service):
+        yield mock_service
+
+
+@pytest.mark.usefixtures("mock_settings_service")
+async def test_aget_password_hash_roundtrip():
+    hashed = await auth_utils.aget_password_hash("s3cret")
+
+    assert await auth_utils.averify_password("s3cret", hashed)
+    assert not await auth_utils.averify_password("wrong", hashed)
+
+
+@pytest.mark.usefixtures("mock_settings_service")
+async def test_run_in_auth_executor_uses_auth_threads():
+    thread_name = await auth_utils.run_in_auth_executor(lambda: threading.current_thread().name)
+
+    assert thread_name.startswith("aiexec-auth")
+    assert thread_name != threading.current_thread().name
+
+
+@pytest.mark.usefixtures("mock_settings_service")
+async def test_authenticate_user_counts_login_attempts():
+    user = Mock(is_active=True, password=auth_utils.get_password_hash("s3cret"))
+    with (
+        patch("aiexec.services.auth.utils.get_user_by_username", return_value=user),
+        patch("aiexec.services.auth.utils.increment_counter") as mock_increment,
+    ):
+        assert await auth_utils.authenticate_user("user", "s3cret", Mock()) is user
+        assert await auth_utils.authenticate_user("user", "wrong", Mock()) is None
+
+    results = [call.args[1]["result"] for call in mock_increment.call_args_list]
+    assert results == ["success", "invalid_password"]
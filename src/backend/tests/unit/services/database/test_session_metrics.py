@@ -0,0 +1,36 @@
+from unittest.mock import patch
+
+from aiexec.services.database.service import observe_connection_acquisition
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+async def test_connection_is_only_acquired_by_the_first_statement():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    with patch("aiexec.services.database.service.observe_histogram") as observe_histogram:
+        async with AsyncSession(engine) as session:
+            observe_connection_acquisition(session, "sqlite")
+            assert not session.in_transaction()
+            observe_histogram.assert_not_called()
+
+            await session.exec(text("SELECT 1"))
+            await session.commit()
+            await session.exec(text("SELECT 1"))
+
+    observe_histogram.assert_called_once()
+    name, duration, labels = observe_histogram.call_args.args
+    assert name == "db_session_acquisition_duration"
+    assert duration >= 0
+    assert labels == {"dialect": "sqlite"}
+    await engine.dispose()
+
+
+async def test_session_without_statements_records_nothing():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    with patch("aiexec.services.database.service.observe_histogram") as observe_histogram:
+        async with AsyncSession(engine) as session:
+            observe_connection_acquisition(session, "sqlite")
+
+    observe_histogram.assert_not_called()
+    await engine.dispose()
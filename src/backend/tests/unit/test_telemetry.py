@@ -16,8 +16,10 @@ def opentelemetry_instance():
 def test_init(opentelemetry_instance):
     assert isinstance(opentelemetry_instance, OpenTelemetry)
     assert len(opentelemetry_instance._metrics) > 1
-    assert len(opentelemetry_instance._metrics) == len(opentelemetry_instance._metrics_registry) == 2
+    assert len(opentelemetry_instance._metrics) == len(opentelemetry_instance._metrics_registry) == 10
     assert "file_uploads" in opentelemetry_instance._metrics
+    assert "vertex_build_duration" in opentelemetry_instance._metrics
+    assert "login_attempts" in opentelemetry_instance._metrics
 
 
 def test_gauge(opentelemetry_instance):
@@ -58,6 +60,24 @@ def test_increment_counter_unregisted_metric(opentelemetry_instance):
         opentelemetry_instance.increment_counter(metric_name="num_files_uploaded_1", value=5, labels=fixed_labels)
 
 
+def test_observe_histogram(opentelemetry_instance):
+    opentelemetry_instance.observe_histogram("vertex_build_duration", 0.25, {"component_type": "ChatInput"})
+    opentelemetry_instance.observe_histogram("graph_build_duration", 0.5, fixed_labels)
+
+
+def test_histogram_missing_mandatory_label(opentelemetry_instance):
+    with pytest.raises(ValueError, match=re.escape("Missing required labels: {'component_type'}")):
+        opentelemetry_instance.observe_histogram("vertex_build_duration", 0.25, {"success": "true"})
+
+
+def test_cache_requests_counter(opentelemetry_instance):
+    opentelemetry_instance.increment_counter(
+        metric_name="cache_requests", labels={"cache": "ThreadingInMemoryCache", "result": "hit"}
+    )
+    with pytest.raises(ValueError, match=re.escape("Missing required labels: {'result'}")):
+        opentelemetry_instance.increment_counter(metric_name="cache_requests", labels={"cache": "AsyncInMemoryCache"})
+
+
 def test_opentelementry_singleton(opentelemetry_instance):
     opentelemetry_instance_2 = OpenTelemetry()
     assert opentelemetry_instance is opentelemetry_instance_2
@@ -0,0 +1,55 @@
+import gzip
+import json
+
+from aiexec.utils.component_catalog import ComponentCatalog
+from wfx.interface.components import ComponentCache
+
+
+def _catalog_dict() -> dict:
+    return {
+        "inputs": {"ChatInput": {"display_name": "Chat Input"}},
+        "outputs": {"ChatOutput": {"display_name": "Chat Output"}},
+    }
+
+
+async def test_get_payload_matches_json_dumps():
+    cache = ComponentCache()
+    all_types = _catalog_dict()
+    cache.all_types_dict = all_types
+    cache.mark_changed()
+
+    payload = await ComponentCatalog(cache).get_payload(all_types)
+
+    assert payload.body == json.dumps(all_types).encode()
+    assert json.loads(gzip.decompress(payload.gzip_body)) == all_types
+
+
+async def test_get_payload_is_reused_until_cache_changes():
+    cache = ComponentCache()
+    all_types = _catalog_dict()
+    cache.mark_changed()
+    catalog = ComponentCatalog(cache)
+
+    first = await catalog.get_payload(all_types)
+    assert await catalog.get_payload(all_types) is first
+
+    all_types["inputs"]["ChatInput"]["display_name"] = "Renamed"
+    # Unreported in-place edits are not picked up
+    assert await catalog.get_payload(all_types) is first
+
+    cache.mark_changed("inputs")
+    updated = await catalog.get_payload(all_types)
+    assert updated.etag != first.etag
+    assert json.loads(updated.body) == all_types
+
+
+async def test_get_payload_rebuilds_for_new_catalog():
+    cache = ComponentCache()
+    catalog = ComponentCatalog(cache)
+    first = await catalog.get_payload(_catalog_dict())
+
+    replaced = {"inputs": {}}
+    payload = await catalog.get_payload(replaced)
+
+    assert payload is not first
+    assert json.loads(payload.body) == replaced
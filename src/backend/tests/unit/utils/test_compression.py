@@ -3,8 +3,8 @@ import json
 from datetime import date, datetime, timezone
 from unittest.mock import patch
 
-from aiexec.utils.compression import compress_response
-from fastapi import Response
+from aiexec.utils.compression import PrecompressedJSON, compress_response, precompressed_response
+from fastapi import Request, Response
 
 
 class TestCompressResponse:
@@ -286,3 +286,42 @@ class TestCompressResponse:
         except (TypeError, ValueError):
             # Expected behavior if jsonable_encoder can't handle the object
             pass
+
+
+def _request(headers: dict[str, str]) -> Request:
+    raw_headers = [(name.lower().encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw_headers})
+
+
+class TestPrecompressedResponse:
+    """Test cases for precompressed_response."""
+
+    def test_serves_gzip_with_etag(self):
+        payload = PrecompressedJSON.from_bytes(b'{"a": 1}')
+
+        response = precompressed_response(_request({"Accept-Encoding": "gzip, br"}), payload)
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] == payload.etag
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert gzip.decompress(response.body) == b'{"a": 1}'
+
+    def test_serves_identity_when_gzip_not_accepted(self):
+        payload = PrecompressedJSON.from_bytes(b'{"a": 1}')
+
+        response = precompressed_response(_request({"Accept-Encoding": "identity"}), payload)
+
+        assert "Content-Encoding" not in response.headers
+        assert response.body == b'{"a": 1}'
+
+    def test_not_modified_when_etag_matches(self):
+        payload = PrecompressedJSON.from_bytes(b'{"a": 1}')
+
+        response = precompressed_response(_request({"If-None-Match": f'"other", W/{payload.etag}'}), payload)
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["ETag"] == payload.etag
+
+    def test_etag_changes_with_content(self):
+        assert PrecompressedJSON.from_bytes(b"{}").etag != PrecompressedJSON.from_bytes(b"[]").etag
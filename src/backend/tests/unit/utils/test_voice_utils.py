@@ -10,7 +10,9 @@ from aiexec.utils.voice_utils import (
     FRAME_DURATION_MS,
     SAMPLE_RATE_24K,
     VAD_SAMPLE_RATE_16K,
+    VoiceActivityDetector,
     _write_bytes_to_file,
+    resample_24k_frames_to_16k,
     resample_24k_to_16k,
     write_audio_to_file,
 )
@@ -387,3 +389,50 @@ class TestWriteBytesToFile:
             assert mock_file.call_count == 2
             # Both calls should use append mode
             assert all(call[0] == ("ab",) for call in mock_file.call_args_list)
+
+
+class TestResample24kFramesTo16k:
+    """Test cases for resample_24k_frames_to_16k function."""
+
+    def test_matches_per_frame_resampling(self):
+        rng = np.random.default_rng(0)
+        frames = rng.integers(-3000, 3000, size=(5, BYTES_PER_24K_FRAME // 2), dtype=np.int16)
+
+        result = resample_24k_frames_to_16k(frames.tobytes())
+
+        assert result.shape == (5, BYTES_PER_16K_FRAME // 2)
+        for frame, resampled in zip(frames, result, strict=True):
+            assert resampled.tobytes() == resample_24k_to_16k(frame.tobytes())
+
+    def test_empty_input(self):
+        assert resample_24k_frames_to_16k(b"").shape == (0, BYTES_PER_16K_FRAME // 2)
+
+    def test_partial_frame_raises(self):
+        with pytest.raises(ValueError, match="multiple of"):
+            resample_24k_frames_to_16k(b"\x00" * (BYTES_PER_24K_FRAME + 2))
+
+
+class TestVoiceActivityDetector:
+    """Test cases for VoiceActivityDetector."""
+
+    def test_carries_partial_frames_between_calls(self):
+        vad = MagicMock()
+        vad.is_speech.return_value = False
+        detector = VoiceActivityDetector(vad)
+
+        assert detector.process([b"\x00" * (BYTES_PER_24K_FRAME // 2)]) is False
+        vad.is_speech.assert_not_called()
+
+        detector.process([b"\x00" * (BYTES_PER_24K_FRAME // 2), b"\x00" * BYTES_PER_24K_FRAME])
+        assert vad.is_speech.call_count == 2
+        frame, sample_rate = vad.is_speech.call_args.args
+        assert len(frame) == BYTES_PER_16K_FRAME
+        assert sample_rate == VAD_SAMPLE_RATE_16K
+
+    def test_reports_speech_and_survives_vad_errors(self):
+        vad = MagicMock()
+        vad.is_speech.side_effect = [ValueError("bad frame"), True]
+        detector = VoiceActivityDetector(vad)
+
+        assert detector.process([b"\x00" * (BYTES_PER_24K_FRAME * 3)]) is True
+        assert vad.is_speech.call_count == 2
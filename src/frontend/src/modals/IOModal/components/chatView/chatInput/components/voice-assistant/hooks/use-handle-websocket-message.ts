@@ -115,6 +115,10 @@ export const useHandleWebsocketMessage = (
         case "add_message":
           messagesStore.addMessage(buildData.data);
           break;
+
+        case "message_delta":
+          messagesStore.applyMessageDelta(buildData.data);
+          break;
       }
       break;
     }
@@ -67,6 +67,37 @@ export const useMessagesStore = create<MessagesStoreType>((set, get) => ({
       return { messages: updatedMessages };
     });
   },
+  applyMessageDelta: (delta) => {
+    set((state) => {
+      const updatedMessages = [...state.messages];
+      for (let i = state.messages.length - 1; i >= 0; i--) {
+        if (state.messages[i].id !== delta.id) continue;
+        const message = { ...updatedMessages[i] };
+        if (delta.text !== undefined) {
+          message.text = delta.text;
+        } else if (delta.text_append !== undefined) {
+          message.text = (message.text ?? "") + delta.text_append;
+        }
+        if (delta.state !== undefined) {
+          message.properties = { ...message.properties, state: delta.state };
+        }
+        if (delta.contents?.length && message.content_blocks) {
+          const blocks = [...message.content_blocks];
+          for (const change of delta.contents) {
+            const block = blocks[change.block];
+            if (!block) continue;
+            const contents = [...block.contents];
+            contents[change.index] = change.content;
+            blocks[change.block] = { ...block, contents };
+          }
+          message.content_blocks = blocks;
+        }
+        updatedMessages[i] = message;
+        break;
+      }
+      return { messages: updatedMessages };
+    });
+  },
   clearMessages: () => {
     set(() => ({ messages: [] }));
   },
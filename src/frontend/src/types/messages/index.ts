@@ -1,4 +1,4 @@
-import type { ContentBlock } from "../chat";
+import type { ContentBlock, ContentType } from "../chat";
 
 type Message = {
   flow_id: string;
@@ -17,4 +17,14 @@ type Message = {
   content_blocks?: ContentBlock[];
 };
 
-export type { Message };
+// Incremental update of a streaming message, sent as a "message_delta" event.
+type MessageDelta = {
+  id: string;
+  seq: number;
+  text?: string;
+  text_append?: string;
+  state?: string;
+  contents?: Array<{ block: number; index: number; content: ContentType }>;
+};
+
+export type { Message, MessageDelta };
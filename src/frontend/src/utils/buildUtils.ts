@@ -614,6 +614,10 @@ async function onEvent(
       useMessagesStore.getState().addMessage(data);
       return true;
     }
+    case "message_delta": {
+      useMessagesStore.getState().applyMessageDelta(data);
+      return true;
+    }
     case "token": {
       // Use flushSync with a timeout to avoid React batching issues.
       setTimeout(() => {
@@ -0,0 +1,69 @@
+"""Manifest of previously loaded files, used to load only new or changed files on re-runs."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import orjson
+
+from wfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(file_path: str | Path) -> str:
+    """Return the SHA-256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with Path(file_path).open("rb") as file:
+        while chunk := file.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class FileManifest:
+    """Records (size, mtime, content hash) for every loaded file.
+
+    A file is considered unchanged when its size and modification time match the manifest. When only the
+    modification time differs, the content hash decides, so touched-but-identical files are not reloaded.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.entries: dict[str, dict] = {}
+        if self.path.exists():
+            try:
+                self.entries = orjson.loads(self.path.read_bytes())
+            except orjson.JSONDecodeError:
+                logger.warning(f"Ignoring unreadable manifest {self.path}")
+
+    def is_unchanged(self, file_path: str) -> bool:
+        entry = self.entries.get(file_path)
+        if entry is None:
+            return False
+        stat = Path(file_path).stat()
+        if stat.st_size != entry["size"]:
+            return False
+        if stat.st_mtime_ns == entry["mtime_ns"]:
+            return True
+        if hash_file(file_path) != entry["sha256"]:
+            return False
+        entry["mtime_ns"] = stat.st_mtime_ns
+        return True
+
+    def record(self, file_path: str) -> None:
+        stat = Path(file_path).stat()
+        self.entries[file_path] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": hash_file(file_path)}
+
+    def save(self, file_paths: Iterable[str]) -> None:
+        """Write the manifest, keeping only `file_paths` so deleted files are forgotten."""
+        keep = set(file_paths)
+        entries = {file_path: entry for file_path, entry in self.entries.items() if file_path in keep}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_bytes(orjson.dumps(entries))
+        tmp_path.replace(self.path)
@@ -1,5 +1,6 @@
 import unicodedata
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
 from concurrent import futures
 from pathlib import Path
 
@@ -189,10 +190,31 @@ def parallel_load_data(
     max_concurrency: int,
     load_function: Callable = parse_text_file_to_data,
 ) -> list[Data | None]:
-    with futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
-        loaded_files = executor.map(
-            lambda file_path: load_function(file_path, silent_errors=silent_errors),
-            file_paths,
+    return list(
+        iter_load_data(
+            file_paths, silent_errors=silent_errors, max_concurrency=max_concurrency, load_function=load_function
         )
-    # loaded_files is an iterator, so we need to convert it to a list
-    return list(loaded_files)
+    )
+
+
+def iter_load_data(
+    file_paths: Iterable[str],
+    *,
+    silent_errors: bool,
+    max_concurrency: int,
+    load_function: Callable = parse_text_file_to_data,
+) -> Iterator[Data | None]:
+    """Yield loaded files in input order as soon as each one is parsed.
+
+    At most `2 * max_concurrency` files are loaded ahead of the consumer, so memory stays bounded
+    for large trees.
+    """
+    window = max(1, max_concurrency) * 2
+    with futures.ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+        pending: deque[futures.Future] = deque()
+        for file_path in file_paths:
+            pending.append(executor.submit(load_function, file_path, silent_errors=silent_errors))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
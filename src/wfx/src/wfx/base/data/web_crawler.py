@@ -0,0 +1,371 @@
+"""Recursive web crawler sharing one HTTP connection pool across crawls.
+
+Pages are fetched through a process-wide `httpx.Client`, so crawling hundreds of pages reuses keep-alive
+connections instead of opening one per request. Responses are streamed into an incremental HTML parser that
+extracts the text, metadata and links while the body arrives. An optional on-disk cache keeps pages that carry
+an `ETag` or `Last-Modified` header and revalidates them with conditional requests on the next crawl.
+"""
+
+from __future__ import annotations
+
+import codecs
+import hashlib
+import re
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urljoin, urlparse
+
+import httpx
+import orjson
+from langchain_core.documents import Document
+
+from wfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+MAX_CONNECTIONS = 64
+MAX_KEEPALIVE_CONNECTIONS = 32
+MAX_CONCURRENT_REQUESTS_PER_HOST = 2
+CACHE_DIR_NAME = "url_cache"
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+STREAM_CHUNK_SIZE = 64 * 1024
+# Tags whose content is code or markup rather than page text
+NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+# Same filters as langchain_core.utils.html.extract_sub_links
+LINK_PREFIXES_TO_IGNORE = ("javascript:", "mailto:", "#")
+LINK_SUFFIXES_TO_IGNORE = (
+    ".css",
+    ".js",
+    ".ico",
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".svg",
+    ".csv",
+    ".bz2",
+    ".zip",
+    ".epub",
+)
+_META_CHARSET = re.compile(rb"<meta[^>]+charset=[\"']?([\w-]+)", re.IGNORECASE)
+
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """Return the process-wide HTTP client used for crawling; it is thread safe and pools connections per host."""
+    global _client  # noqa: PLW0603
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS
+                ),
+            )
+        return _client
+
+
+class PageParser(HTMLParser):
+    """Incremental HTML parser collecting the page text, title, description, language and links.
+
+    The text is the concatenation of every text node, like `BeautifulSoup.get_text()`, which also leaves out
+    the content of `NON_TEXT_TAGS`.
+    """
+
+    def __init__(self, *, collect_links: bool) -> None:
+        super().__init__(convert_charrefs=True)
+        self.collect_links = collect_links
+        self.text_parts: list[str] = []
+        self.title_parts: list[str] = []
+        self.description: str | None = None
+        self.language: str | None = None
+        self.links: list[str] = []
+        self._in_title = False
+        self._title_done = False
+        self._non_text_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in NON_TEXT_TAGS:
+            self._non_text_depth += 1
+        elif tag == "title" and not self._title_done:
+            self._in_title = True
+        elif tag == "a" and self.collect_links:
+            href = dict(attrs).get("href")
+            if href:
+                self.links.append(href)
+        elif tag == "meta" and self.description is None:
+            attributes = dict(attrs)
+            if attributes.get("name") == "description":
+                self.description = attributes.get("content")
+        elif tag == "html" and self.language is None:
+            self.language = dict(attrs).get("lang")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in NON_TEXT_TAGS:
+            self._non_text_depth = max(0, self._non_text_depth - 1)
+        elif tag == "title" and self._in_title:
+            self._in_title = False
+            self._title_done = True
+
+    def handle_data(self, data: str) -> None:
+        if self._non_text_depth:
+            return
+        self.text_parts.append(data)
+        if self._in_title:
+            self.title_parts.append(data)
+
+    @property
+    def text(self) -> str:
+        return "".join(self.text_parts)
+
+    @property
+    def title(self) -> str | None:
+        return "".join(self.title_parts) if self._title_done or self.title_parts else None
+
+
+def sub_links(links: Iterable[str], url: str, base_url: str, *, prevent_outside: bool) -> list[str]:
+    """Resolve the links found on `url` to absolute URLs, keeping only those under `base_url` if requested."""
+    parsed_url = urlparse(url)
+    parsed_base_url = urlparse(base_url)
+    results: dict[str, None] = {}
+    for link in links:
+        path_end = link.split("#", 1)[0].split("?", 1)[0].lower()
+        if link.startswith(LINK_PREFIXES_TO_IGNORE) or path_end.endswith(LINK_SUFFIXES_TO_IGNORE):
+            continue
+        parsed_link = urlparse(link)
+        if parsed_link.scheme in {"http", "https"}:
+            absolute = link.split("#", 1)[0]
+        elif link.startswith("//"):
+            absolute = f"{parsed_url.scheme}:{link}".split("#", 1)[0]
+        elif parsed_link.scheme:
+            continue
+        else:
+            absolute = urljoin(url, parsed_link.path)
+            if parsed_link.query:
+                absolute += f"?{parsed_link.query}"
+        if prevent_outside and (
+            urlparse(absolute).netloc != parsed_base_url.netloc or not absolute.startswith(base_url)
+        ):
+            continue
+        results[absolute] = None
+    return list(results)
+
+
+@dataclass
+class CachedResponse:
+    etag: str | None
+    last_modified: str | None
+    content_type: str
+    encoding: str | None
+    body: bytes
+
+
+class HttpResponseCache:
+    """On-disk cache of response bodies with their validators, bounded in bytes.
+
+    Each entry is a body file and a JSON header file named after a hash of the URL. When the cache grows past
+    `max_bytes`, the least recently used entries are removed.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int = CACHE_MAX_BYTES) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._size = sum(path.stat().st_size for path in self.directory.glob("*.body"))
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return self.directory / f"{key}.json", self.directory / f"{key}.body"
+
+    def get(self, url: str) -> CachedResponse | None:
+        header_path, body_path = self._paths(url)
+        try:
+            header = orjson.loads(header_path.read_bytes())
+            body = body_path.read_bytes()
+        except (OSError, orjson.JSONDecodeError):
+            return None
+        # Mark the entry as recently used for eviction
+        body_path.touch()
+        return CachedResponse(body=body, **header)
+
+    def put(self, url: str, response: CachedResponse) -> None:
+        header_path, body_path = self._paths(url)
+        header = {
+            "etag": response.etag,
+            "last_modified": response.last_modified,
+            "content_type": response.content_type,
+            "encoding": response.encoding,
+        }
+        with self._lock:
+            try:
+                previous_size = body_path.stat().st_size if body_path.exists() else 0
+                for path, content in ((body_path, response.body), (header_path, orjson.dumps(header))):
+                    temporary = path.with_suffix(path.suffix + ".tmp")
+                    temporary.write_bytes(content)
+                    temporary.replace(path)
+            except OSError as e:
+                logger.warning(f"Could not write {url} to the HTTP cache: {e}")
+                return
+            self._size += len(response.body) - previous_size
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        bodies = sorted(self.directory.glob("*.body"), key=lambda path: path.stat().st_mtime_ns)
+        for body_path in bodies:
+            if self._size <= self.max_bytes * 0.9:
+                break
+            size = body_path.stat().st_size
+            body_path.unlink(missing_ok=True)
+            body_path.with_suffix(".json").unlink(missing_ok=True)
+            self._size -= size
+
+
+_cache: HttpResponseCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_http_response_cache() -> HttpResponseCache:
+    """Return the process-wide HTTP response cache, stored in the Aiexec config directory."""
+    global _cache  # noqa: PLW0603
+    with _cache_lock:
+        if _cache is None:
+            from wfx.services.cache.utils import CACHE_DIR
+            from wfx.services.deps import get_settings_service
+
+            settings = getattr(get_settings_service(), "settings", None)
+            _cache = HttpResponseCache(Path(getattr(settings, "config_dir", None) or CACHE_DIR) / CACHE_DIR_NAME)
+        return _cache
+
+
+@dataclass
+class WebCrawler:
+    """Crawls pages recursively from a root URL, following the links of each page up to `max_depth`.
+
+    `host_limits` can be shared between crawlers running in parallel threads so the number of requests in
+    flight to one host stays bounded across all of them.
+    """
+
+    max_depth: int = 1
+    prevent_outside: bool = True
+    as_html: bool = False
+    timeout: float = 30
+    headers: dict[str, str] = field(default_factory=dict)
+    check_response_status: bool = False
+    continue_on_failure: bool = True
+    autoset_encoding: bool = True
+    cache: HttpResponseCache | None = None
+    host_limits: defaultdict[str, threading.Semaphore] = field(
+        default_factory=lambda: defaultdict(lambda: threading.Semaphore(MAX_CONCURRENT_REQUESTS_PER_HOST))
+    )
+
+    def crawl(self, url: str) -> list[Document]:
+        return list(self.iter_documents(url))
+
+    def iter_documents(self, url: str) -> Iterator[Document]:
+        """Yields one document per page with content, depth first like `RecursiveUrlLoader`."""
+        visited: set[str] = set()
+        stack = [(url, 0)]
+        while stack:
+            page_url, depth = stack.pop()
+            if page_url in visited or depth >= self.max_depth:
+                continue
+            visited.add(page_url)
+            try:
+                document, links = self._fetch_page(page_url, collect_links=depth + 1 < self.max_depth)
+            except (httpx.HTTPError, ValueError) as e:
+                if not self.continue_on_failure:
+                    raise
+                logger.warning(f"Unable to load from {page_url}. Received error {e} of type {e.__class__.__name__}")
+                continue
+            if document is not None:
+                yield document
+            children = sub_links(links, page_url, url, prevent_outside=self.prevent_outside)
+            stack.extend((link, depth + 1) for link in reversed(children) if link not in visited)
+
+    def _fetch_page(self, url: str, *, collect_links: bool) -> tuple[Document | None, list[str]]:
+        cached = self.cache.get(url) if self.cache is not None else None
+        headers = dict(self.headers)
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        parser = PageParser(collect_links=collect_links)
+        html_parts: list[str] = []
+        with (
+            self.host_limits[urlparse(url).netloc],
+            get_http_client().stream("GET", url, headers=headers, timeout=self.timeout) as response,
+        ):
+            if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+                logger.debug(f"Using cached content for {url}")
+                content_type = cached.content_type
+                self._parse(parser, html_parts, [cached.body], cached.encoding)
+            else:
+                if self.check_response_status and response.is_error:
+                    msg = f"Received HTTP status {response.status_code}"
+                    raise ValueError(msg)
+                content_type = response.headers.get("Content-Type", "")
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                cacheable = self.cache is not None and response.is_success and bool(etag or last_modified)
+                body: list[bytes] = []
+                chunks = response.iter_bytes(STREAM_CHUNK_SIZE)
+                if cacheable:
+                    chunks = _tee(chunks, body)
+                encoding = self._parse(parser, html_parts, chunks, response.charset_encoding)
+                if cacheable:
+                    self.cache.put(url, CachedResponse(etag, last_modified, content_type, encoding, b"".join(body)))
+
+        content = "".join(html_parts) if self.as_html else parser.text
+        if not content:
+            return None, parser.links
+        metadata: dict[str, Any] = {"source": url, "content_type": content_type}
+        if parser.title is not None:
+            metadata["title"] = parser.title
+        if parser.description is not None:
+            metadata["description"] = parser.description
+        if parser.language is not None:
+            metadata["language"] = parser.language
+        return Document(page_content=content, metadata=metadata), parser.links
+
+    def _parse(
+        self, parser: PageParser, html_parts: list[str], chunks: Iterable[bytes], encoding: str | None
+    ) -> str | None:
+        """Decodes `chunks` incrementally into `parser` and returns the encoding that was used."""
+        decoder = None
+        for chunk in chunks:
+            if decoder is None:
+                if encoding is None and self.autoset_encoding and (match := _META_CHARSET.search(chunk)):
+                    encoding = match.group(1).decode("ascii")
+                try:
+                    decoder = codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+                except LookupError:
+                    encoding = None
+                    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            text = decoder.decode(chunk)
+            parser.feed(text)
+            if self.as_html:
+                html_parts.append(text)
+        if decoder is not None:
+            text = decoder.decode(b"", final=True)
+            parser.feed(text)
+            if self.as_html:
+                html_parts.append(text)
+        parser.close()
+        return encoding
+
+
+def _tee(chunks: Iterable[bytes], into: list[bytes]) -> Iterator[bytes]:
+    for chunk in chunks:
+        into.append(chunk)
+        yield chunk
@@ -0,0 +1,287 @@
+"""Process-wide cache of computed embeddings.
+
+`CachedEmbeddings` wraps any LangChain `Embeddings` and stores each vector under a hash of
+(model identity, text), so re-ingesting a mostly unchanged corpus or repeating a query only pays for the
+texts that were never embedded. Vectors are kept as float32 in an in-memory LRU and in a SQLite file in the
+Aiexec config directory, which survives restarts and is shared by every flow of the process. Both tiers are
+bounded by bytes, and the hit counters are logged periodically.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from cachetools import LRUCache
+from langchain_core.embeddings import Embeddings
+
+from wfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+MEMORY_MAX_BYTES = 64 * 1024 * 1024
+DISK_MAX_BYTES = 256 * 1024 * 1024
+DISK_FILE_NAME = "embeddings_cache.sqlite3"
+# Seconds between two log lines with the cache statistics
+STATS_LOG_INTERVAL = 600
+# Attributes that tell embedding models of one class apart; the first ones that are set form the identity.
+IDENTITY_ATTRIBUTES = ("model", "model_name", "model_id", "deployment", "dimensions", "base_url", "openai_api_base")
+
+
+def embeddings_identity(embeddings: Embeddings) -> str | None:
+    """Return a string identifying the model behind `embeddings`, or None when it has no model name."""
+    values = {}
+    for attribute in IDENTITY_ATTRIBUTES:
+        value = getattr(embeddings, attribute, None)
+        if isinstance(value, str | int) and not isinstance(value, bool) and value != "":
+            values[attribute] = value
+    if not any(key in values for key in ("model", "model_name", "model_id", "deployment")):
+        return None
+    parts = [type(embeddings).__qualname__, *(f"{key}={value}" for key, value in sorted(values.items()))]
+    return "|".join(parts)
+
+
+def _vector_size(vector: array) -> int:
+    return len(vector) * vector.itemsize
+
+
+class EmbeddingCacheStore:
+    """Two-tier (memory LRU, SQLite) store of float32 vectors by key, with hit counters.
+
+    The disk tier is trimmed to 90% of `disk_max_bytes`, dropping the least recently written vectors first,
+    whenever a write takes it over the limit.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None,
+        memory_max_bytes: int = MEMORY_MAX_BYTES,
+        disk_max_bytes: int = DISK_MAX_BYTES,
+    ) -> None:
+        self._memory: LRUCache[str, array] = LRUCache(maxsize=memory_max_bytes, getsizeof=_vector_size)
+        self._lock = threading.Lock()
+        self.disk_max_bytes = disk_max_bytes
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._last_stats_log = time.monotonic()
+        self._connection: sqlite3.Connection | None = None
+        self._disk_entries = 0
+        self._disk_bytes = 0
+        if path is not None:
+            try:
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+                self._connection = sqlite3.connect(str(path), check_same_thread=False)
+                self._connection.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB)")
+                self._connection.commit()
+                self._count_disk_usage()
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache on disk disabled, could not open {path}: {e}")
+                self._connection = None
+
+    def _count_disk_usage(self) -> None:
+        self._disk_entries, self._disk_bytes = self._connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings"
+        ).fetchone()
+
+    def _trim_disk(self) -> None:
+        # Rows are replaced on write, so the lowest rowids are the least recently written
+        excess = self._disk_bytes - int(self.disk_max_bytes * 0.9)
+        self._connection.execute(
+            "DELETE FROM embeddings WHERE rowid IN (SELECT rowid FROM (SELECT rowid, SUM(LENGTH(vector)) OVER "
+            "(ORDER BY rowid) - LENGTH(vector) AS written_before FROM embeddings) WHERE written_before < ?)",
+            (excess,),
+        )
+        self._count_disk_usage()
+
+    def _log_stats(self) -> None:
+        now = time.monotonic()
+        if now - self._last_stats_log >= STATS_LOG_INTERVAL:
+            self._last_stats_log = now
+            logger.info(f"Embedding cache: {self._stats()}")
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, list[float]]:
+        """Return the cached vectors of `keys`; missing keys are left out."""
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            missing = []
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is None:
+                    missing.append(key)
+                else:
+                    found[key] = vector.tolist()
+            self.memory_hits += len(found)
+            if missing and self._connection is not None:
+                for start in range(0, len(missing), 500):
+                    batch = missing[start : start + 500]
+                    placeholders = ",".join("?" * len(batch))
+                    rows = self._connection.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",  # noqa: S608
+                        batch,
+                    ).fetchall()
+                    for key, blob in rows:
+                        vector = array("f", blob)
+                        self._memory[key] = vector
+                        found[key] = vector.tolist()
+                        self.disk_hits += 1
+            self.misses += len(keys) - len(found)
+            self._log_stats()
+        return found
+
+    def set_many(self, vectors: dict[str, list[float]]) -> None:
+        packed = {key: array("f", vector) for key, vector in vectors.items()}
+        with self._lock:
+            for key, vector in packed.items():
+                self._memory[key] = vector
+            if self._connection is None or not packed:
+                return
+            try:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(key, vector.tobytes()) for key, vector in packed.items()],
+                )
+                # Replaced rows are counted twice until the next trim recounts the table
+                self._disk_entries += len(packed)
+                self._disk_bytes += sum(_vector_size(vector) for vector in packed.values())
+                if self._disk_bytes > self.disk_max_bytes:
+                    self._trim_disk()
+                self._connection.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Could not write embeddings to the disk cache: {e}")
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0
+
+    def _stats(self) -> dict[str, Any]:
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory.currsize,
+            "disk_entries": self._disk_entries,
+            "disk_bytes": self._disk_bytes,
+        }
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return self._stats()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self.memory_hits = self.disk_hits = self.misses = 0
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM embeddings")
+                self._connection.commit()
+                self._disk_entries = self._disk_bytes = 0
+
+
+class CachedEmbeddings(Embeddings):
+    """`Embeddings` that only sends texts missing from the cache to the wrapped model.
+
+    Documents and queries are cached separately because some models embed them differently. Texts repeated
+    within one call are embedded once. Other attributes are read from the wrapped model.
+    """
+
+    def __init__(self, embeddings: Embeddings, identity: str, store: EmbeddingCacheStore) -> None:
+        self.embeddings = embeddings
+        self.identity = identity
+        self.store = store
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found on the wrapper itself
+        if name in {"embeddings", "identity", "store"}:
+            raise AttributeError(name)
+        return getattr(self.embeddings, name)
+
+    def _key(self, kind: str, text: str) -> str:
+        return hashlib.sha256(f"{self.identity}\0{kind}\0{text}".encode()).hexdigest()
+
+    def _lookup(self, texts: list[str]) -> tuple[list[str], dict[str, list[float]], list[str]]:
+        keys = [self._key("document", text) for text in texts]
+        found = self.store.get_many(list(dict.fromkeys(keys)))
+        missing_texts = list(dict.fromkeys(text for text, key in zip(texts, keys, strict=True) if key not in found))
+        return keys, found, missing_texts
+
+    def _store(self, texts: list[str], vectors: list[list[float]], found: dict[str, list[float]]) -> None:
+        computed = {self._key("document", text): list(vector) for text, vector in zip(texts, vectors, strict=True)}
+        self.store.set_many(computed)
+        found.update(computed)
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        keys, found, missing_texts = self._lookup(texts)
+        if missing_texts:
+            self._store(missing_texts, self.embeddings.embed_documents(missing_texts), found)
+        return [found[key] for key in keys]
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        # The store does blocking SQLite I/O, keep it off the event loop
+        keys, found, missing_texts = await asyncio.to_thread(self._lookup, texts)
+        if missing_texts:
+            vectors = await self.embeddings.aembed_documents(missing_texts)
+            await asyncio.to_thread(self._store, missing_texts, vectors, found)
+        return [found[key] for key in keys]
+
+    def embed_query(self, text: str) -> list[float]:
+        key = self._key("query", text)
+        vector = self.store.get_many([key]).get(key)
+        if vector is None:
+            vector = list(self.embeddings.embed_query(text))
+            self.store.set_many({key: vector})
+        return vector
+
+    async def aembed_query(self, text: str) -> list[float]:
+        key = self._key("query", text)
+        vector = (await asyncio.to_thread(self.store.get_many, [key])).get(key)
+        if vector is None:
+            vector = list(await self.embeddings.aembed_query(text))
+            await asyncio.to_thread(self.store.set_many, {key: vector})
+        return vector
+
+
+_store: EmbeddingCacheStore | None = None
+_store_lock = threading.Lock()
+
+
+def _default_cache_path() -> Path:
+    from wfx.services.cache.utils import CACHE_DIR
+    from wfx.services.deps import get_settings_service
+
+    settings_service = get_settings_service()
+    config_dir = getattr(getattr(settings_service, "settings", None), "config_dir", None)
+    return Path(config_dir or CACHE_DIR) / DISK_FILE_NAME
+
+
+def get_embedding_cache() -> EmbeddingCacheStore:
+    """Return the process-wide embedding cache, opening its disk tier on first use."""
+    global _store  # noqa: PLW0603
+    with _store_lock:
+        if _store is None:
+            _store = EmbeddingCacheStore(_default_cache_path())
+        return _store
+
+
+def cached_embeddings(embeddings: Embeddings) -> Embeddings:
+    """Wrap `embeddings` with the process-wide cache.
+
+    Returns `embeddings` unchanged when it is already cached or when its model cannot be identified, since
+    vectors of different models must never be mixed.
+    """
+    if isinstance(embeddings, CachedEmbeddings):
+        return embeddings
+    identity = embeddings_identity(embeddings)
+    if identity is None:
+        return embeddings
+    return CachedEmbeddings(embeddings, identity, get_embedding_cache())
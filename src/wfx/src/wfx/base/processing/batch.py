@@ -0,0 +1,241 @@
+"""Execution engine for running a model over many rows.
+
+`BatchExecutor` runs one coroutine per row with bounded concurrency, optional requests/tokens per
+minute limits, per-row retries with exponential backoff, and an optional checkpoint file so an
+interrupted batch resumes where it stopped instead of starting over.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import random
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+from wfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+
+# Programming errors fail the whole batch instead of being retried row by row.
+NON_RETRYABLE_ERRORS: tuple[type[Exception], ...] = (KeyError, AttributeError, TypeError)
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(payload: Any) -> int:
+    """Rough token estimate of a row payload, used only for tokens-per-minute limiting."""
+    return max(1, len(orjson.dumps(payload, default=str)) // CHARS_PER_TOKEN)
+
+
+def fingerprint(payload: Any) -> str:
+    """Stable hash of a row payload, so a checkpoint is only reused for identical input."""
+    return hashlib.sha256(orjson.dumps(payload, default=str, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+class RateLimiter:
+    """Token bucket for requests per minute and (estimated) tokens per minute; 0 disables a limit."""
+
+    def __init__(self, requests_per_minute: int = 0, tokens_per_minute: int = 0) -> None:
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(self.requests_per_minute, self._requests + elapsed * self.requests_per_minute / 60)
+        self._tokens = min(self.tokens_per_minute, self._tokens + elapsed * self.tokens_per_minute / 60)
+
+    def _wait_time(self, tokens: int) -> float:
+        wait = 0.0
+        if self.requests_per_minute and self._requests < 1:
+            wait = (1 - self._requests) * 60 / self.requests_per_minute
+        if self.tokens_per_minute and self._tokens < tokens:
+            wait = max(wait, (tokens - self._tokens) * 60 / self.tokens_per_minute)
+        return wait
+
+    async def acquire(self, tokens: int = 1) -> None:
+        """Wait until one request of `tokens` tokens fits in both budgets, then consume it."""
+        if not self.requests_per_minute and not self.tokens_per_minute:
+            return
+        # A single request larger than the whole budget would never fit; let it through once the bucket is full.
+        tokens = min(tokens, self.tokens_per_minute) if self.tokens_per_minute else tokens
+        async with self._lock:
+            while True:
+                self._refill()
+                wait = self._wait_time(tokens)
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            if self.requests_per_minute:
+                self._requests -= 1
+            if self.tokens_per_minute:
+                self._tokens -= tokens
+
+
+class BatchCheckpoint:
+    """Append-only JSON lines file of completed rows, keyed by row index and input fingerprint."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.completed: dict[int, tuple[str, Any]] = {}
+        # Length of the file up to its last complete line, where new records are appended
+        self._valid_length: int | None = None
+        if self.path.exists():
+            content = self.path.read_bytes()
+            self._valid_length = content.rfind(b"\n") + 1
+            for line in content.splitlines():
+                try:
+                    entry = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    # A line cut short by an interrupted write; the row is simply run again.
+                    continue
+                self.completed[entry["index"]] = (entry["fingerprint"], entry["result"])
+        self._file = None
+
+    def get(self, index: int, row_fingerprint: str) -> tuple[bool, Any]:
+        entry = self.completed.get(index)
+        if entry is None or entry[0] != row_fingerprint:
+            return False, None
+        return True, entry[1]
+
+    def record(self, index: int, row_fingerprint: str, result: Any) -> None:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self.path.open("ab")
+            if self._valid_length is not None:
+                # Drop a trailing line cut short by an interrupted write so the next record starts on its own line
+                self._file.truncate(self._valid_length)
+        self._file.write(orjson.dumps({"index": index, "fingerprint": row_fingerprint, "result": result}) + b"\n")
+        self._file.flush()
+        self.completed[index] = (row_fingerprint, result)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+@dataclass
+class RowResult:
+    index: int
+    result: Any = None
+    error: str | None = None
+    attempts: int = 0
+    from_checkpoint: bool = False
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
+class BatchExecutor:
+    """Runs `process(payload)` for every row and returns the results in input order.
+
+    Args:
+        process: Coroutine function producing the result for one row payload. Results must be JSON
+            serializable when a checkpoint is used.
+        max_concurrency: Maximum number of rows in flight.
+        max_retries: Retries per row after the first attempt; errors in `NON_RETRYABLE_ERRORS` are raised.
+        backoff_base: Initial backoff in seconds, doubled on every retry (with jitter).
+        rate_limiter: Optional requests/tokens per minute limiter.
+        checkpoint_path: Optional file where completed rows are recorded and read back on the next run.
+        on_progress: Called with (completed, total) each time a row finishes.
+    """
+
+    def __init__(
+        self,
+        process: Callable[[Any], Awaitable[Any]],
+        *,
+        max_concurrency: int = 8,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        rate_limiter: RateLimiter | None = None,
+        checkpoint_path: str | Path | None = None,
+        on_progress: Callable[[int, int], Awaitable[None] | None] | None = None,
+    ) -> None:
+        self.process = process
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max(0, max_retries)
+        self.backoff_base = backoff_base
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.checkpoint_path = checkpoint_path
+        self.on_progress = on_progress
+
+    async def _run_row(self, index: int, payload: Any) -> RowResult:
+        tokens = estimate_tokens(payload) if self.rate_limiter.tokens_per_minute else 1
+        attempt = 0
+        while True:
+            attempt += 1
+            await self.rate_limiter.acquire(tokens)
+            try:
+                return RowResult(index=index, result=await self.process(payload), attempts=attempt)
+            except NON_RETRYABLE_ERRORS:
+                raise
+            except Exception as e:  # noqa: BLE001
+                if attempt > self.max_retries:
+                    await logger.awarning(f"Row {index} failed after {attempt} attempts: {e}")
+                    return RowResult(index=index, error=str(e), attempts=attempt)
+                delay = self.backoff_base * 2 ** (attempt - 1)
+                await logger.adebug(f"Row {index} failed ({e}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay * random.uniform(0.5, 1.0))  # noqa: S311
+
+    async def run(self, payloads: Sequence[Any]) -> list[RowResult]:
+        total = len(payloads)
+        results: list[RowResult | None] = [None] * total
+        checkpoint = BatchCheckpoint(self.checkpoint_path) if self.checkpoint_path else None
+        fingerprints = [fingerprint(payload) for payload in payloads] if checkpoint else []
+        completed = 0
+
+        async def report() -> None:
+            if self.on_progress is not None:
+                outcome = self.on_progress(completed, total)
+                if asyncio.iscoroutine(outcome):
+                    await outcome
+
+        pending: list[int] = []
+        for index in range(total):
+            if checkpoint is not None:
+                found, result = checkpoint.get(index, fingerprints[index])
+                if found:
+                    results[index] = RowResult(index=index, result=result, from_checkpoint=True)
+                    completed += 1
+                    continue
+            pending.append(index)
+        if completed:
+            await logger.ainfo(f"Resuming batch: {completed}/{total} rows restored from checkpoint")
+            await report()
+
+        queue: asyncio.Queue[int] = asyncio.Queue()
+        for index in pending:
+            queue.put_nowait(index)
+
+        async def worker() -> None:
+            nonlocal completed
+            while not queue.empty():
+                index = queue.get_nowait()
+                row_result = await self._run_row(index, payloads[index])
+                results[index] = row_result
+                if checkpoint is not None and row_result.success:
+                    checkpoint.record(index, fingerprints[index], row_result.result)
+                completed += 1
+                await report()
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.max_concurrency, len(pending)))]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+            if checkpoint is not None:
+                checkpoint.close()
+        return results  # type: ignore[return-value]
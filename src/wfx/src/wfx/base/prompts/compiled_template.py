@@ -0,0 +1,90 @@
+"""`str.format` templates parsed once and rendered many times.
+
+Components that fill a pattern for every row of a DataFrame used to iterate the rows and build a dict of
+the whole row for each of them. A `CompiledTemplate` knows which variables the pattern references, so it
+only extracts those columns, once per column, and renders the rows from them.
+"""
+
+from __future__ import annotations
+
+import re
+import string
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping, Sequence
+
+    import pandas as pd
+
+_FORMATTER = string.Formatter()
+_ROOT_NAME = re.compile(r"[^.\[]*")
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """A parsed `str.format` template.
+
+    Attributes:
+        template: The template text.
+        variables: Names of the values the template references, in order of first use.
+        simple: Whether every field is a plain name, without attribute access, indexing or positional fields.
+    """
+
+    template: str
+    variables: tuple[str, ...]
+    simple: bool
+
+    def format(self, **values: Any) -> str:
+        return self.template.format(**values)
+
+    def iter_rows(self, columns: Mapping[str, Sequence[Any]], length: int) -> Iterator[str]:
+        """Yields the template rendered for each of `length` rows, given one sequence of values per variable.
+
+        Raises:
+            KeyError: If a variable has no column.
+        """
+        if not self.variables:
+            text = self.template.format()
+            for _ in range(length):
+                yield text
+            return
+        render = self.template.format
+        names = self.variables
+        for values in zip(*(columns[name] for name in names), strict=True):
+            yield render(**dict(zip(names, values, strict=True)))
+
+    def render_dataframe(self, dataframe: pd.DataFrame, sep: str) -> str:
+        """Renders the template for every row of `dataframe` and joins the results with `sep`."""
+        columns = {name: dataframe[name].tolist() for name in self.variables}
+        return sep.join(self.iter_rows(columns, len(dataframe)))
+
+
+def _collect_fields(template: str, variables: dict[str, None]) -> bool:
+    simple = True
+    for _, field_name, format_spec, _ in _FORMATTER.parse(template):
+        if field_name is None:
+            continue
+        root = _ROOT_NAME.match(field_name).group()
+        if not root or root.isdigit():
+            # Positional field: rendering with keyword values raises, as str.format does
+            simple = False
+        else:
+            variables.setdefault(root, None)
+            simple = simple and root == field_name
+        if format_spec and "{" in format_spec:
+            simple = _collect_fields(format_spec, variables) and simple
+    return simple
+
+
+@lru_cache(maxsize=512)
+def compile_template(template: str) -> CompiledTemplate:
+    """Parses `template` once; repeated calls with the same text return the cached result.
+
+    Raises:
+        ValueError: If the template is not a valid `str.format` string.
+    """
+    variables: dict[str, None] = {}
+    simple = _collect_fields(template, variables)
+    return CompiledTemplate(template=template, variables=tuple(variables), simple=simple)
@@ -0,0 +1,50 @@
+"""Record of documents already split, used to skip them when the same corpus is split again."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import orjson
+
+from wfx.log.logger import logger
+
+
+class SplitManifest:
+    """Append-only JSON lines file of split keys.
+
+    A split key identifies a document content together with the splitter settings, so changing the
+    settings splits every document again.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.keys: set[str] = set()
+        # Length of the file up to its last complete line, where new keys are appended
+        self._valid_length: int | None = None
+        if self.path.exists():
+            content = self.path.read_bytes()
+            self._valid_length = content.rfind(b"\n") + 1
+            for line in content.splitlines():
+                try:
+                    self.keys.add(orjson.loads(line)["key"])
+                except (orjson.JSONDecodeError, KeyError, TypeError):
+                    logger.debug(f"Ignoring unreadable line in split manifest {self.path}")
+        self._file = None
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.keys
+
+    def record(self, key: str) -> None:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self.path.open("ab")
+            if self._valid_length is not None:
+                # Drop a trailing line cut short by an interrupted write so the next key starts on its own line
+                self._file.truncate(self._valid_length)
+        self._file.write(orjson.dumps({"key": key}) + b"\n")
+        self.keys.add(key)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -66,14 +66,37 @@ class RunFlowBaseComponent(Component):
     default_keys = ["code", "_type", "flow_name_selected", "session_id"]
     FLOW_INPUTS: list[dotdict] = []
     flow_tweak_data: dict = {}
+    # Set while the outputs of one build are computed, so all outputs share a single subflow run.
+    _shared_run_outputs: list | None = None
+    _sharing_run_outputs: bool = False
 
     @abstractmethod
     async def run_flow_with_tweaks(self) -> list[Data]:
         """Run the flow with tweaks."""
 
+    async def _build_results(self) -> tuple[dict, dict]:
+        self._sharing_run_outputs = True
+        self._shared_run_outputs = None
+        try:
+            return await super()._build_results()
+        finally:
+            self._sharing_run_outputs = False
+            self._shared_run_outputs = None
+
+    async def get_run_outputs(self) -> list:
+        """Run the subflow, at most once per build when several outputs are connected.
+
+        Outside a build (e.g. when called as a tool) every call runs the subflow.
+        """
+        if not self._sharing_run_outputs:
+            return await self.run_flow_with_tweaks()
+        if self._shared_run_outputs is None:
+            self._shared_run_outputs = await self.run_flow_with_tweaks()
+        return self._shared_run_outputs
+
     async def data_output(self) -> Data:
         """Return the data output."""
-        run_outputs = await self.run_flow_with_tweaks()
+        run_outputs = await self.get_run_outputs()
         first_output = run_outputs[0]
 
         if isinstance(first_output, Data):
@@ -86,7 +109,7 @@ class RunFlowBaseComponent(Component):
 
     async def dataframe_output(self) -> DataFrame:
         """Return the dataframe output."""
-        run_outputs = await self.run_flow_with_tweaks()
+        run_outputs = await self.get_run_outputs()
         first_output = run_outputs[0]
 
         if isinstance(first_output, DataFrame):
@@ -99,7 +122,7 @@ class RunFlowBaseComponent(Component):
 
     async def message_output(self) -> Message:
         """Return the message output."""
-        run_outputs = await self.run_flow_with_tweaks()
+        run_outputs = await self.get_run_outputs()
         _, message_result = next(iter(run_outputs[0].outputs[0].results.items()))
         if isinstance(message_result, Message):
             return message_result
@@ -0,0 +1,80 @@
+"""Process-wide cache of vector store indexes loaded from local files.
+
+Loading a file-based index (such as FAISS) reads and deserializes the whole index, so components that
+query the same index on every run keep it in memory here. An entry is tied to the size and modification
+time of the index files and is dropped as soon as they change on disk, e.g. when another process rewrote
+the index.
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from cachetools import LRUCache
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Sequence
+
+MAX_LOADED_INDEXES = 8
+
+FileSignature = tuple[tuple[int, int], ...]
+
+
+def file_signature(files: Sequence[str | Path]) -> FileSignature | None:
+    """Return the (mtime_ns, size) of each file, or None when one of them does not exist."""
+    signature = []
+    for file in files:
+        try:
+            stat = Path(file).stat()
+        except FileNotFoundError:
+            return None
+        signature.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+class LoadedIndexCache:
+    """LRU cache of loaded indexes, validated against the signature of their files on every lookup.
+
+    Cached indexes are shared by every flow of the process and must not be modified in place. Writers take
+    `lock(key)`, change a copy, save it and `put` the copy in place of the cached one.
+    """
+
+    def __init__(self, maxsize: int = MAX_LOADED_INDEXES) -> None:
+        self._entries: LRUCache[Hashable, tuple[FileSignature, Any]] = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._key_locks: dict[Hashable, threading.Lock] = {}
+
+    def lock(self, key: Hashable) -> threading.Lock:
+        """Return the lock serializing the updates of the index stored under `key`."""
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def get(self, key: Hashable, files: Sequence[str | Path]) -> Any | None:
+        """Return the index cached under `key`, unless its files changed since it was stored."""
+        signature = file_signature(files)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] != signature:
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def put(self, key: Hashable, files: Sequence[str | Path], index: Any) -> None:
+        """Cache `index` for the current state of its files; call it right after loading or saving them."""
+        signature = file_signature(files)
+        with self._lock:
+            if signature is None:
+                self._entries.pop(key, None)
+            else:
+                self._entries[key] = (signature, index)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+loaded_index_cache = LoadedIndexCache()
@@ -2,6 +2,7 @@ from abc import abstractmethod
 from functools import wraps
 from typing import TYPE_CHECKING, Any
 
+from wfx.base.vectorstores.utils import CONTENT_HASH_KEY, content_hash_to_id, document_content_hash, get_stored_ids
 from wfx.custom.custom_component.component import Component
 from wfx.field_typing import Text, VectorStore
 from wfx.helpers.data import docs_to_data
@@ -13,6 +14,15 @@ from wfx.schema.dataframe import DataFrame
 if TYPE_CHECKING:
     from langchain_core.documents import Document
 
+    from wfx.inputs.inputs import InputTypes
+
+# Ingest Data info of the stores that always skip documents they already hold
+DEDUPLICATED_INGEST_INFO = (
+    "Documents to store. Each one is stored under an id derived from a hash of its text and metadata, so "
+    "unchanged documents are skipped when ingested again. An edited document is stored as a new entry; its "
+    "previous version is not removed."
+)
+
 
 def check_cached_vector_store(f):
     """Decorator to check for cached vector stores, and returns them if they exist.
@@ -60,6 +70,7 @@ class LCVectorStoreComponent(Component):
         HandleInput(
             name="ingest_data",
             display_name="Ingest Data",
+            info="Documents to store in the vector store.",
             input_types=["Data", "DataFrame"],
             is_list=True,
         ),
@@ -89,6 +100,14 @@ class LCVectorStoreComponent(Component):
         Output(display_name="DataFrame", name="dataframe", method="as_dataframe"),
     ]
 
+    @classmethod
+    def inputs_with_ingest_info(cls, info: str) -> list["InputTypes"]:
+        """Return the base inputs with `info` on Ingest Data, for stores that describe how they ingest."""
+        return [
+            input_.model_copy(update={"info": info}) if input_.name == "ingest_data" else input_
+            for input_ in LCVectorStoreComponent.inputs
+        ]
+
     def _validate_outputs(self) -> None:
         # At least these three outputs must be defined
         required_output_methods = [
@@ -122,6 +141,43 @@ class LCVectorStoreComponent(Component):
                 result.append(_input)
         return result
 
+    def _hash_documents(self, documents: list["Document"]) -> tuple[list["Document"], list[str]]:
+        """Stamps each document with its content hash and drops repeated documents.
+
+        Returns the unique documents together with their ids. The ids are derived from the content hash, so
+        the same document always gets the same id and re-ingesting it updates the stored entry in place.
+        """
+        unique_documents: list[Document] = []
+        ids: list[str] = []
+        seen: set[str] = set()
+        for document in documents:
+            content_hash = document_content_hash(document)
+            if content_hash in seen:
+                continue
+            seen.add(content_hash)
+            document.metadata[CONTENT_HASH_KEY] = content_hash
+            document.id = content_hash_to_id(content_hash)
+            unique_documents.append(document)
+            ids.append(document.id)
+        return unique_documents, ids
+
+    def _get_stored_ids(self, vector_store: VectorStore, ids: list[str]) -> set[str]:
+        """Returns the ids already present in the vector store. Override for stores without `get_by_ids`."""
+        return get_stored_ids(vector_store, ids)
+
+    def _filter_stored_documents(
+        self, vector_store: VectorStore, documents: list["Document"], ids: list[str]
+    ) -> tuple[list["Document"], list[str]]:
+        """Drops the documents already in the vector store, so unchanged documents are not embedded again."""
+        if not ids:
+            return documents, ids
+        stored_ids = self._get_stored_ids(vector_store, ids)
+        if not stored_ids:
+            return documents, ids
+        self.log(f"Skipping {len(stored_ids)} documents already in the Vector Store.")
+        kept = [(document, id_) for document, id_ in zip(documents, ids, strict=True) if id_ not in stored_ids]
+        return [document for document, _ in kept], [id_ for _, id_ in kept]
+
     def search_with_vector_store(
         self,
         input_value: Text,
@@ -1,5 +1,22 @@
+import hashlib
+import uuid
+from typing import TYPE_CHECKING
+
+import orjson
+
 from wfx.schema.data import Data
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from langchain_core.documents import Document
+    from langchain_core.vectorstores import VectorStore
+
+# Metadata key holding the hash `LCVectorStoreComponent` uses to recognize documents that are already stored.
+CONTENT_HASH_KEY = "content_hash"
+# Number of ids looked up per `get_by_ids` call, to stay below the stores' query parameter limits.
+ID_LOOKUP_BATCH_SIZE = 500
+
 
 def chroma_collection_to_data(collection_dict: dict):
     """Converts a collection of chroma vectors into a list of data.
@@ -20,3 +37,42 @@ def chroma_collection_to_data(collection_dict: dict):
             data_dict.update(collection_dict["metadatas"][i].items())
         data.append(Data(**data_dict))
     return data
+
+
+def document_content_hash(document: "Document") -> str:
+    """Return a stable SHA-256 hash of a document's text and metadata.
+
+    A `CONTENT_HASH_KEY` entry already present in the metadata is ignored, so documents read back from a
+    vector store hash to the same value as when they were ingested.
+    """
+    metadata = {key: value for key, value in document.metadata.items() if key != CONTENT_HASH_KEY}
+    payload = orjson.dumps(
+        {"text": document.page_content, "metadata": metadata},
+        default=str,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+def content_hash_to_id(content_hash: str) -> str:
+    """Return the document id stored for a content hash.
+
+    The id is formatted as a UUID so it is accepted by every store, including those (like Qdrant) that only
+    take UUIDs or integers as point ids.
+    """
+    return str(uuid.UUID(content_hash[:32]))
+
+
+def get_stored_ids(vector_store: "VectorStore", ids: "Sequence[str]") -> set[str]:
+    """Return the subset of `ids` already present in `vector_store`.
+
+    Stores that do not implement `get_by_ids` report nothing as stored, so their documents are always added.
+    """
+    stored: set[str] = set()
+    for start in range(0, len(ids), ID_LOOKUP_BATCH_SIZE):
+        try:
+            documents = vector_store.get_by_ids(ids[start : start + ID_LOOKUP_BATCH_SIZE])
+        except NotImplementedError:
+            return set()
+        stored.update(document.id for document in documents if document.id is not None)
+    return stored
@@ -1,8 +1,13 @@
+import copy
 from pathlib import Path
 
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.faiss import dependable_faiss_import
 
-from wfx.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
+from wfx.base.embeddings.cache import embeddings_identity
+from wfx.base.vectorstores.index_cache import loaded_index_cache
+from wfx.base.vectorstores.model import DEDUPLICATED_INGEST_INFO, LCVectorStoreComponent, check_cached_vector_store
 from wfx.helpers.data import docs_to_data
 from wfx.io import BoolInput, HandleInput, IntInput, StrInput
 from wfx.schema.data import Data
@@ -27,7 +32,7 @@ class FaissVectorStoreComponent(LCVectorStoreComponent):
             display_name="Persist Directory",
             info="Path to save the FAISS index. It will be relative to where Aiexec is running.",
         ),
-        *LCVectorStoreComponent.inputs,
+        *LCVectorStoreComponent.inputs_with_ingest_info(DEDUPLICATED_INGEST_INFO),
         BoolInput(
             name="allow_dangerous_deserialization",
             display_name="Allow Dangerous Deserialization",
@@ -36,6 +41,14 @@ class FaissVectorStoreComponent(LCVectorStoreComponent):
             advanced=True,
             value=True,
         ),
+        BoolInput(
+            name="remove_missing_documents",
+            display_name="Remove Missing Documents",
+            info="If true, documents of the index that are not in the ingested data are deleted. Leave it off when "
+            "the ingested data is only part of the corpus, e.g. when a manifest skips unchanged files.",
+            advanced=True,
+            value=False,
+        ),
         HandleInput(name="embedding", display_name="Embedding", input_types=["Embeddings"]),
         IntInput(
             name="number_of_results",
@@ -63,9 +76,82 @@ class FaissVectorStoreComponent(LCVectorStoreComponent):
             return Path(self.resolve_path(self.persist_directory))
         return Path()
 
+    def _index_files(self, path: Path) -> list[Path]:
+        return [path / f"{self.index_name}.faiss", path / f"{self.index_name}.pkl"]
+
+    def _embedding_file(self, path: Path) -> Path:
+        return path / f"{self.index_name}.embedding"
+
+    def _embedding_identity(self) -> str:
+        """Returns the identity of the embedding model, falling back to its class when it has no model name."""
+        return embeddings_identity(self.embedding) or type(self.embedding).__qualname__
+
+    def _stored_embedding_identity(self, path: Path) -> str | None:
+        """Returns the identity of the model that embedded the saved index, None when it was not recorded."""
+        try:
+            return self._embedding_file(path).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def _index_key(self, path: Path) -> tuple[str, str, bool]:
+        return (str(path), self.index_name, bool(self.allow_dangerous_deserialization))
+
+    def _load_index(self, path: Path) -> FAISS | None:
+        """Returns the index saved in `path`, reusing the in-memory copy while its files are unchanged.
+
+        The returned object is shared with other flows: read it, but modify only a `_copy_index` of it.
+        """
+        files = self._index_files(path)
+        key = self._index_key(path)
+        faiss = loaded_index_cache.get(key, files)
+        if faiss is None:
+            if not all(file.exists() for file in files):
+                return None
+            faiss = FAISS.load_local(
+                folder_path=str(path),
+                embeddings=self.embedding,
+                index_name=self.index_name,
+                allow_dangerous_deserialization=self.allow_dangerous_deserialization,
+            )
+            loaded_index_cache.put(key, files, faiss)
+        return faiss
+
+    def _with_embedding(self, faiss: FAISS) -> FAISS:
+        """Returns a view of a shared index that embeds queries with this component's embedding model."""
+        view = copy.copy(faiss)
+        view.embedding_function = self.embedding
+        return view
+
+    def _copy_index(self, faiss: FAISS) -> FAISS:
+        """Returns an independent copy of `faiss` that can be modified while other flows search the original."""
+        return FAISS(
+            embedding_function=self.embedding,
+            index=dependable_faiss_import().clone_index(faiss.index),
+            docstore=InMemoryDocstore(dict(faiss.docstore._dict)),
+            index_to_docstore_id=dict(faiss.index_to_docstore_id),
+            relevance_score_fn=faiss.override_relevance_score_fn,
+            normalize_L2=faiss._normalize_L2,
+            distance_strategy=faiss.distance_strategy,
+        )
+
+    def _save_index(self, faiss: FAISS, path: Path) -> None:
+        faiss.save_local(str(path), self.index_name)
+        self._embedding_file(path).write_text(self._embedding_identity(), encoding="utf-8")
+        loaded_index_cache.put(self._index_key(path), self._index_files(path), faiss)
+
+    def _get_stored_ids(self, vector_store: FAISS, ids: list[str]) -> set[str]:
+        return set(vector_store.index_to_docstore_id.values()).intersection(ids)
+
     @check_cached_vector_store
     def build_vector_store(self) -> FAISS:
-        """Builds the FAISS object."""
+        """Builds the FAISS object.
+
+        The index on disk is updated incrementally: documents are identified by their content hash, so only
+        new documents are embedded. Documents no longer in the ingested data are only deleted when
+        `remove_missing_documents` is set. When the index was built with another embedding model, every document
+        is embedded again. Without ingested data the existing index is used as is. Updates of one index are
+        serialized across the process.
+        """
         path = self.get_persist_directory()
         path.mkdir(parents=True, exist_ok=True)
 
@@ -79,28 +165,65 @@ class FaissVectorStoreComponent(LCVectorStoreComponent):
             else:
                 documents.append(_input)
 
-        faiss = FAISS.from_documents(documents=documents, embedding=self.embedding)
-        faiss.save_local(str(path), self.index_name)
+        if not documents:
+            faiss = self._load_index(path)
+            if faiss is None:
+                msg = "The FAISS index does not exist yet and there is no data to ingest."
+                raise ValueError(msg)
+            stored_identity = self._stored_embedding_identity(path)
+            if stored_identity is not None and stored_identity != self._embedding_identity():
+                self.log(
+                    f"The FAISS index was built with another embedding model ({stored_identity}); "
+                    "ingest the data again to rebuild it."
+                )
+            return self._with_embedding(faiss)
+
+        documents, ids = self._hash_documents(documents)
+        with loaded_index_cache.lock(self._index_key(path)):
+            return self._update_index(path, documents, ids)
+
+    def _update_index(self, path: Path, documents: list, ids: list[str]) -> FAISS:
+        faiss = self._load_index(path)
+        if faiss is not None and self._stored_embedding_identity(path) != self._embedding_identity():
+            return self._rebuild_index(path, faiss, documents, ids)
+        if faiss is None:
+            faiss = FAISS.from_documents(documents=documents, embedding=self.embedding, ids=ids)
+            self._save_index(faiss, path)
+            return faiss
+
+        stale_ids = []
+        if self.remove_missing_documents:
+            ingested_ids = set(ids)
+            stale_ids = [id_ for id_ in faiss.index_to_docstore_id.values() if id_ not in ingested_ids]
+        documents, ids = self._filter_stored_documents(faiss, documents, ids)
+        if not stale_ids and not documents:
+            return self._with_embedding(faiss)
+
+        faiss = self._copy_index(faiss)
+        if stale_ids:
+            self.log(f"Deleting {len(stale_ids)} documents that are no longer ingested.")
+            faiss.delete(stale_ids)
+        if documents:
+            self.log(f"Adding {len(documents)} documents to the FAISS index.")
+            faiss.add_documents(documents, ids=ids)
+        self._save_index(faiss, path)
+        return faiss
+
+    def _rebuild_index(self, path: Path, faiss: FAISS, documents: list, ids: list[str]) -> FAISS:
+        """Embeds the ingested documents, and the stored ones unless they are removed, with the current model."""
+        kept_ids = []
+        if not self.remove_missing_documents:
+            ingested_ids = set(ids)
+            kept_ids = [id_ for id_ in faiss.index_to_docstore_id.values() if id_ not in ingested_ids]
+        kept_documents = [faiss.docstore.search(id_) for id_ in kept_ids]
+        self.log(f"The embedding model changed, embedding {len(kept_documents) + len(documents)} documents again.")
+        faiss = FAISS.from_documents(documents=kept_documents + documents, embedding=self.embedding, ids=kept_ids + ids)
+        self._save_index(faiss, path)
         return faiss
 
     def search_documents(self) -> list[Data]:
         """Search for documents in the FAISS vector store."""
-        path = self.get_persist_directory()
-        index_path = path / f"{self.index_name}.faiss"
-
-        if not index_path.exists():
-            vector_store = self.build_vector_store()
-        else:
-            vector_store = FAISS.load_local(
-                folder_path=str(path),
-                embeddings=self.embedding,
-                index_name=self.index_name,
-                allow_dangerous_deserialization=self.allow_dangerous_deserialization,
-            )
-
-        if not vector_store:
-            msg = "Failed to load the FAISS index."
-            raise ValueError(msg)
+        vector_store = self.build_vector_store()
 
         if self.search_query and isinstance(self.search_query, str) and self.search_query.strip():
             docs = vector_store.similarity_search(
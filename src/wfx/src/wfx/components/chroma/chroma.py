@@ -1,4 +1,3 @@
-from copy import deepcopy
 from typing import TYPE_CHECKING
 
 from chromadb.config import Settings
@@ -63,7 +62,9 @@ class ChromaVectorStoreComponent(LCVectorStoreComponent):
             name="allow_duplicates",
             display_name="Allow Duplicates",
             advanced=True,
-            info="If false, will not add documents that are already in the Vector Store.",
+            info="If false, will not add documents that are already in the Vector Store. "
+            "Documents are matched by a hash of their text and metadata, so an edited document is stored as a "
+            "new entry and its previous version is not removed.",
         ),
         DropdownInput(
             name="search_type",
@@ -83,7 +84,7 @@ class ChromaVectorStoreComponent(LCVectorStoreComponent):
             name="limit",
             display_name="Limit",
             advanced=True,
-            info="Limit the number of records to compare when Allow Duplicates is False.",
+            info="Limit the number of stored records shown in the component status.",
         ),
     ]
 
@@ -135,25 +136,19 @@ class ChromaVectorStoreComponent(LCVectorStoreComponent):
         # Convert DataFrame to Data if needed using parent's method
         ingest_data = self._prepare_ingest_data()
 
-        stored_documents_without_id = []
-        if self.allow_duplicates:
-            stored_data = []
-        else:
-            limit = int(self.limit) if self.limit is not None and str(self.limit).strip() else None
-            stored_data = chroma_collection_to_data(vector_store.get(limit=limit))
-            for value in deepcopy(stored_data):
-                del value.id
-                stored_documents_without_id.append(value)
-
         documents = []
         for _input in ingest_data or []:
             if isinstance(_input, Data):
-                if _input not in stored_documents_without_id:
-                    documents.append(_input.to_lc_document())
+                documents.append(_input.to_lc_document())
             else:
                 msg = "Vector Store Inputs must be Data objects."
                 raise TypeError(msg)
 
+        ids = None
+        if not self.allow_duplicates:
+            documents, ids = self._hash_documents(documents)
+            documents, ids = self._filter_stored_documents(vector_store, documents, ids)
+
         if documents and self.embedding is not None:
             self.log(f"Adding {len(documents)} documents to the Vector Store.")
             # Filter complex metadata to prevent ChromaDB errors
@@ -161,9 +156,9 @@ class ChromaVectorStoreComponent(LCVectorStoreComponent):
                 from langchain_community.vectorstores.utils import filter_complex_metadata
 
                 filtered_documents = filter_complex_metadata(documents)
-                vector_store.add_documents(filtered_documents)
+                vector_store.add_documents(filtered_documents, ids=ids)
             except ImportError:
                 self.log("Warning: Could not import filter_complex_metadata. Adding documents without filtering.")
-                vector_store.add_documents(documents)
+                vector_store.add_documents(documents, ids=ids)
         else:
             self.log("No documents to add to the Vector Store.")
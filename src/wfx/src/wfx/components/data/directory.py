@@ -1,6 +1,7 @@
+from wfx.base.data.manifest import FileManifest
 from wfx.base.data.utils import TEXT_FILE_TYPES, parallel_load_data, parse_text_file_to_data, retrieve_file_paths
 from wfx.custom.custom_component.component import Component
-from wfx.io import BoolInput, IntInput, MessageTextInput, MultiselectInput
+from wfx.io import BoolInput, IntInput, MessageTextInput, MultiselectInput, StrInput
 from wfx.schema.data import Data
 from wfx.schema.dataframe import DataFrame
 from wfx.template.field.base import Output
@@ -65,6 +66,15 @@ class DirectoryComponent(Component):
             advanced=True,
             info="If true, multithreading will be used.",
         ),
+        StrInput(
+            name="manifest_path",
+            display_name="Manifest Path",
+            advanced=True,
+            info=(
+                "Optional path to a manifest of loaded files. When set, only new or changed files are loaded "
+                "and the manifest is updated after each run."
+            ),
+        ),
     ]
 
     outputs = [
@@ -99,13 +109,28 @@ class DirectoryComponent(Component):
             resolved_path, load_hidden=load_hidden, recursive=recursive, depth=depth, types=valid_types
         )
 
+        manifest = FileManifest(self.resolve_path(self.manifest_path)) if self.manifest_path else None
+        paths_to_load = [p for p in file_paths if not manifest.is_unchanged(p)] if manifest else file_paths
+
         loaded_data = []
         if use_multithreading:
-            loaded_data = parallel_load_data(file_paths, silent_errors=silent_errors, max_concurrency=max_concurrency)
+            loaded_data = parallel_load_data(
+                paths_to_load, silent_errors=silent_errors, max_concurrency=max_concurrency
+            )
         else:
-            loaded_data = [parse_text_file_to_data(file_path, silent_errors=silent_errors) for file_path in file_paths]
+            loaded_data = [
+                parse_text_file_to_data(file_path, silent_errors=silent_errors) for file_path in paths_to_load
+            ]
 
-        valid_data = [x for x in loaded_data if x is not None and isinstance(x, Data)]
+        valid_data = []
+        for data in loaded_data:
+            if data is None or not isinstance(data, Data):
+                continue
+            valid_data.append(data)
+            if manifest:
+                manifest.record(data.data["file_path"])
+        if manifest:
+            manifest.save(file_paths)
         self.status = valid_data
         return valid_data
 
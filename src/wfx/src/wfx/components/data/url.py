@@ -1,10 +1,10 @@
 import importlib
 import re
+from concurrent.futures import ThreadPoolExecutor
 
-import requests
-from bs4 import BeautifulSoup
-from langchain_community.document_loaders import RecursiveUrlLoader
+import httpx
 
+from wfx.base.data.web_crawler import WebCrawler, get_http_response_cache
 from wfx.custom.custom_component.component import Component
 from wfx.field_typing.range_spec import RangeSpec
 from wfx.helpers.data import safe_convert
@@ -18,6 +18,7 @@ from wfx.utils.request_utils import get_user_agent
 DEFAULT_TIMEOUT = 30
 DEFAULT_MAX_DEPTH = 1
 DEFAULT_FORMAT = "Text"
+MAX_CONCURRENT_URLS = 8
 
 
 URL_REGEX = re.compile(
@@ -41,7 +42,7 @@ class URLComponent(Component):
     This component allows fetching content from one or more URLs, with options to:
     - Control crawl depth
     - Prevent crawling outside the root domain
-    - Use async loading for better performance
+    - Cache pages on disk and revalidate them on later runs
     - Extract either raw HTML or clean text
     - Configure request headers and timeouts
     """
@@ -97,8 +98,8 @@ class URLComponent(Component):
             name="use_async",
             display_name="Use Async",
             info=(
-                "If enabled, uses asynchronous loading which can be significantly faster "
-                "but might use more system resources."
+                "Kept for compatibility with existing flows. URLs are always crawled concurrently over a "
+                "shared connection pool."
             ),
             value=True,
             required=False,
@@ -142,6 +143,17 @@ class URLComponent(Component):
             advanced=True,
             input_types=["DataFrame"],
         ),
+        BoolInput(
+            name="use_cache",
+            display_name="Cache Pages",
+            info=(
+                "If enabled, pages that send an ETag or Last-Modified header are cached on disk and only "
+                "downloaded again when the server reports a change."
+            ),
+            value=False,
+            required=False,
+            advanced=True,
+        ),
         BoolInput(
             name="filter_text_html",
             display_name="Filter Text/HTML",
@@ -215,32 +227,24 @@ class URLComponent(Component):
 
         return url
 
-    def _create_loader(self, url: str) -> RecursiveUrlLoader:
-        """Creates a RecursiveUrlLoader instance with the configured settings.
-
-        Args:
-            url: The URL to load
+    def _create_crawler(self) -> WebCrawler:
+        """Creates a WebCrawler with the configured settings.
 
         Returns:
-            RecursiveUrlLoader: Configured loader instance
+            WebCrawler: Configured crawler, shared by every URL of the run
         """
         headers_dict = {header["key"]: header["value"] for header in self.headers if header["value"] is not None}
-        extractor = (lambda x: x) if self.format == "HTML" else (lambda x: BeautifulSoup(x, "lxml").get_text())
 
-        return RecursiveUrlLoader(
-            url=url,
+        return WebCrawler(
             max_depth=self.max_depth,
             prevent_outside=self.prevent_outside,
-            use_async=self.use_async,
-            extractor=extractor,
+            as_html=self.format == "HTML",
             timeout=self.timeout,
             headers=headers_dict,
             check_response_status=self.check_response_status,
             continue_on_failure=self.continue_on_failure,
-            base_url=url,  # Add base_url to ensure consistent domain crawling
-            autoset_encoding=self.autoset_encoding,  # Enable automatic encoding detection
-            exclude_dirs=[],  # Allow customization of excluded directories
-            link_regex=None,  # Allow customization of link filtering
+            autoset_encoding=self.autoset_encoding,
+            cache=get_http_response_cache() if self.use_cache else None,
         )
 
     def fetch_url_contents(self) -> list[dict]:
@@ -253,31 +257,32 @@ class URLComponent(Component):
             ValueError: If no valid URLs are provided or if there's an error loading documents
         """
         try:
-            urls = list({self.ensure_url(url) for url in self.urls if url.strip()})
+            urls = list(dict.fromkeys(self.ensure_url(url) for url in self.urls if url.strip()))
             logger.debug(f"URLs: {urls}")
             if not urls:
                 msg = "No valid URLs provided."
                 raise ValueError(msg)
 
-            all_docs = []
-            for url in urls:
-                logger.debug(f"Loading documents from {url}")
+            # Crawl the URLs concurrently; the crawler bounds the requests in flight to each host
+            crawler = self._create_crawler()
+            with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_URLS, len(urls))) as executor:
+                futures = [executor.submit(crawler.crawl, url) for url in urls]
 
+            all_docs = []
+            for url, future in zip(urls, futures, strict=True):
                 try:
-                    loader = self._create_loader(url)
-                    docs = loader.load()
-
-                    if not docs:
-                        logger.warning(f"No documents found for {url}")
-                        continue
-
-                    logger.debug(f"Found {len(docs)} documents from {url}")
-                    all_docs.extend(docs)
-
-                except requests.exceptions.RequestException as e:
+                    docs = future.result()
+                except httpx.HTTPError as e:
                     logger.exception(f"Error loading documents from {url}: {e}")
                     continue
 
+                if not docs:
+                    logger.warning(f"No documents found for {url}")
+                    continue
+
+                logger.debug(f"Found {len(docs)} documents from {url}")
+                all_docs.extend(docs)
+
             if not all_docs:
                 msg = "No documents were successfully loaded from any URL"
                 raise ValueError(msg)
@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING
 
+from wfx.base.embeddings.cache import cached_embeddings
 from wfx.custom.custom_component.component import Component
 from wfx.io import HandleInput, MessageInput, Output
 from wfx.log.logger import logger
@@ -50,7 +51,7 @@ class TextEmbedderComponent(Component):
                 msg = "No text content found in message"
                 raise ValueError(msg)
 
-            embeddings = embedding_model.embed_documents([text_content])
+            embeddings = cached_embeddings(embedding_model).embed_documents([text_content])
             if not embeddings or not isinstance(embeddings, list):
                 msg = "Invalid embeddings generated"
                 raise ValueError(msg)
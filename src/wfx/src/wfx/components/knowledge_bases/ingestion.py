@@ -17,6 +17,7 @@ from aiexec.services.database.models.user.crud import get_user_by_id
 from cryptography.fernet import InvalidToken
 from langchain_chroma import Chroma
 
+from wfx.base.embeddings.cache import cached_embeddings
 from wfx.base.knowledge_bases.knowledge_base_utils import get_knowledge_bases
 from wfx.base.models.openai_constants import OPENAI_EMBEDDING_MODEL_NAMES
 from wfx.components.processing.converter import convert_to_dataframe
@@ -375,8 +376,8 @@ class KnowledgeIngestionComponent(Component):
                 raise ValueError(msg)
             vector_store_dir.mkdir(parents=True, exist_ok=True)
 
-            # Create embeddings model
-            embedding_function = self._build_embeddings(embedding_model, api_key)
+            # Create embeddings model; texts embedded by an earlier ingestion are read from the cache
+            embedding_function = cached_embeddings(self._build_embeddings(embedding_model, api_key))
 
             # Convert DataFrame to Data objects (following Local DB pattern)
             data_objects = await self._convert_df_to_data_objects(df_source, config_list)
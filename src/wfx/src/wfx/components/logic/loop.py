@@ -1,7 +1,7 @@
 from wfx.custom.custom_component.component import Component
 from wfx.inputs.inputs import HandleInput
 from wfx.schema.data import Data
-from wfx.schema.dataframe import DataFrame
+from wfx.schema.dataframe import DataFrame, DataFrameBuilder
 from wfx.template.field.base import Output
 
 
@@ -98,9 +98,9 @@ class LoopComponent(Component):
             self.stop("item")
             self.start("done")
 
-            aggregated = self.ctx.get(f"{self._id}_aggregated", [])
-
-            return DataFrame(aggregated)
+            builder = DataFrameBuilder()
+            builder.add_rows(self.ctx.get(f"{self._id}_aggregated", []))
+            return builder.build()
         self.stop("done")
         return DataFrame([])
 
@@ -2,6 +2,7 @@ from typing import Any
 
 from langchain_openai import OpenAIEmbeddings
 
+from wfx.base.embeddings.cache import cached_embeddings
 from wfx.base.embeddings.model import LCEmbeddingsModel
 from wfx.base.models.openai_constants import OPENAI_EMBEDDING_MODEL_NAMES
 from wfx.field_typing import Embeddings
@@ -73,6 +74,13 @@ class EmbeddingModelComponent(LCEmbeddingsModel):
             advanced=True,
             info="Additional keyword arguments to pass to the model.",
         ),
+        BoolInput(
+            name="cache_embeddings",
+            display_name="Cache Embeddings",
+            info="Reuse embeddings already computed for the same text and model, in memory and on disk.",
+            value=True,
+            advanced=True,
+        ),
     ]
 
     def build_embeddings(self) -> Embeddings:
@@ -91,7 +99,7 @@ class EmbeddingModelComponent(LCEmbeddingsModel):
             if not api_key:
                 msg = "OpenAI API key is required when using OpenAI provider"
                 raise ValueError(msg)
-            return OpenAIEmbeddings(
+            embeddings = OpenAIEmbeddings(
                 model=model,
                 dimensions=dimensions or None,
                 base_url=api_base or None,
@@ -102,6 +110,7 @@ class EmbeddingModelComponent(LCEmbeddingsModel):
                 show_progress_bar=show_progress_bar,
                 model_kwargs=model_kwargs,
             )
+            return cached_embeddings(embeddings) if self.cache_embeddings else embeddings
         msg = f"Unknown provider: {provider}"
         raise ValueError(msg)
 
@@ -1,6 +1,9 @@
 from langchain_community.vectorstores import PGVector
+from sqlalchemy import select
+from sqlalchemy.orm import Session
 
-from wfx.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
+from wfx.base.vectorstores.model import DEDUPLICATED_INGEST_INFO, LCVectorStoreComponent, check_cached_vector_store
+from wfx.base.vectorstores.utils import ID_LOOKUP_BATCH_SIZE
 from wfx.helpers.data import docs_to_data
 from wfx.io import HandleInput, IntInput, SecretStrInput, StrInput
 from wfx.schema.data import Data
@@ -16,7 +19,7 @@ class PGVectorStoreComponent(LCVectorStoreComponent):
     inputs = [
         SecretStrInput(name="pg_server_url", display_name="PostgreSQL Server Connection String", required=True),
         StrInput(name="collection_name", display_name="Table", required=True),
-        *LCVectorStoreComponent.inputs,
+        *LCVectorStoreComponent.inputs_with_ingest_info(DEDUPLICATED_INGEST_INFO),
         HandleInput(name="embedding", display_name="Embedding", input_types=["Embeddings"], required=True),
         IntInput(
             name="number_of_results",
@@ -41,22 +44,35 @@ class PGVectorStoreComponent(LCVectorStoreComponent):
 
         connection_string_parsed = transform_connection_string(self.pg_server_url)
 
+        pgvector = PGVector.from_existing_index(
+            embedding=self.embedding,
+            collection_name=self.collection_name,
+            connection_string=connection_string_parsed,
+        )
         if documents:
-            pgvector = PGVector.from_documents(
-                embedding=self.embedding,
-                documents=documents,
-                collection_name=self.collection_name,
-                connection_string=connection_string_parsed,
-            )
-        else:
-            pgvector = PGVector.from_existing_index(
-                embedding=self.embedding,
-                collection_name=self.collection_name,
-                connection_string=connection_string_parsed,
-            )
+            documents, ids = self._hash_documents(documents)
+            documents, ids = self._filter_stored_documents(pgvector, documents, ids)
+        if documents:
+            pgvector.add_documents(documents, ids=ids)
 
         return pgvector
 
+    def _get_stored_ids(self, vector_store: PGVector, ids: list[str]) -> set[str]:
+        """Returns the ids already stored in this collection; PGVector does not implement `get_by_ids`."""
+        stored: set[str] = set()
+        with Session(vector_store._bind) as session:
+            collection = vector_store.get_collection(session)
+            if collection is None:
+                return stored
+            embedding_store = vector_store.EmbeddingStore
+            for start in range(0, len(ids), ID_LOOKUP_BATCH_SIZE):
+                statement = select(embedding_store.custom_id).where(
+                    embedding_store.collection_id == collection.uuid,
+                    embedding_store.custom_id.in_(ids[start : start + ID_LOOKUP_BATCH_SIZE]),
+                )
+                stored.update(session.scalars(statement))
+        return stored
+
     def search_documents(self) -> list[Data]:
         vector_store = self.build_vector_store()
 
@@ -4,10 +4,11 @@ from typing import TYPE_CHECKING, Any, cast
 
 import toml  # type: ignore[import-untyped]
 
+from wfx.base.processing.batch import BatchExecutor, RateLimiter
 from wfx.custom.custom_component.component import Component
-from wfx.io import BoolInput, DataFrameInput, HandleInput, MessageTextInput, MultilineInput, Output
+from wfx.io import BoolInput, DataFrameInput, HandleInput, IntInput, MessageTextInput, MultilineInput, Output, StrInput
 from wfx.log.logger import logger
-from wfx.schema.dataframe import DataFrame
+from wfx.schema.dataframe import DataFrame, DataFrameBuilder
 
 if TYPE_CHECKING:
     from langchain_core.runnables import Runnable
@@ -65,6 +66,47 @@ class BatchRunComponent(Component):
             required=False,
             advanced=True,
         ),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrency",
+            info="Maximum number of rows sent to the model at the same time.",
+            value=8,
+            advanced=True,
+        ),
+        IntInput(
+            name="requests_per_minute",
+            display_name="Requests per Minute",
+            info="Maximum model requests per minute. 0 means no limit.",
+            value=0,
+            advanced=True,
+        ),
+        IntInput(
+            name="tokens_per_minute",
+            display_name="Tokens per Minute",
+            info="Maximum estimated input tokens per minute. 0 means no limit.",
+            value=0,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_retries",
+            display_name="Max Retries",
+            info=(
+                "Number of times a failing row is retried, with exponential backoff, before its error is written "
+                "to the '<Output Column Name>_error' column."
+            ),
+            value=3,
+            advanced=True,
+        ),
+        StrInput(
+            name="checkpoint_path",
+            display_name="Checkpoint Path",
+            info=(
+                "Optional file where completed rows are recorded. Re-running the batch with the same path "
+                "skips rows that already completed with identical input."
+            ),
+            value="",
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -72,7 +114,10 @@ class BatchRunComponent(Component):
             display_name="LLM Results",
             name="batch_results",
             method="run_batch",
-            info="A DataFrame with all original columns plus the model's response column.",
+            info=(
+                "A DataFrame with all original columns plus the model's response column and a "
+                "'<Output Column Name>_error' column holding the error of each failed row."
+            ),
         ),
     ]
 
@@ -118,11 +163,13 @@ class BatchRunComponent(Component):
                 - All original columns
                 - The model's response column (customizable name)
                 - 'batch_index' column for processing order
+                - '<response column>_error' column, None unless the row failed after retries
                 - 'metadata' (optional)
 
         Raises:
             ValueError: If the specified column is not found in the DataFrame
             TypeError: If the model is not compatible or input types are wrong
+            RuntimeError: If every row failed after retries
         """
         model: Runnable = self.model
         system_msg = self.system_message or ""
@@ -166,36 +213,52 @@ class BatchRunComponent(Component):
                     "callbacks": self.get_langchain_callbacks(),
                 }
             )
-            # Process batches and track progress
-            responses_with_idx = list(
-                zip(
-                    range(len(conversations)),
-                    await model.abatch(list(conversations)),
-                    strict=True,
-                )
-            )
 
-            # Sort by index to maintain order
-            responses_with_idx.sort(key=lambda x: x[0])
+            async def process_row(conversation: list[dict[str, str]]) -> str:
+                response = await model.ainvoke(conversation)
+                return response.content if hasattr(response, "content") else str(response)
+
+            progress_step = max(1, total_rows // 10)
+
+            async def report_progress(completed: int, total: int) -> None:
+                if completed % progress_step == 0 or completed == total:
+                    self.log(f"Processed {completed}/{total} rows", name="progress")
+                    await logger.ainfo(f"Processed {completed}/{total} rows")
+
+            executor = BatchExecutor(
+                process_row,
+                max_concurrency=self.max_concurrency,
+                max_retries=self.max_retries,
+                rate_limiter=RateLimiter(self.requests_per_minute, self.tokens_per_minute),
+                checkpoint_path=self.checkpoint_path or None,
+                on_progress=report_progress,
+            )
+            row_results = await executor.run(conversations)
 
             # Build the final data with enhanced metadata
-            rows: list[dict[str, Any]] = []
-            for idx, (original_row, response) in enumerate(
-                zip(df.to_dict(orient="records"), responses_with_idx, strict=False)
+            builder = DataFrameBuilder()
+            for idx, (original_row, row_result) in enumerate(
+                zip(df.to_dict(orient="records"), row_results, strict=True)
             ):
-                response_text = response[1].content if hasattr(response[1], "content") else str(response[1])
                 row = self._create_base_row(
-                    cast("dict[str, Any]", original_row), model_response=response_text, batch_index=idx
+                    cast("dict[str, Any]", original_row), model_response=row_result.result or "", batch_index=idx
                 )
-                self._add_metadata(row, success=True, system_msg=system_msg)
-                rows.append(row)
-
-                # Log progress
-                if (idx + 1) % max(1, total_rows // 10) == 0:
-                    await logger.ainfo(f"Processed {idx + 1}/{total_rows} rows")
+                # Written regardless of enable_metadata so a failed row never looks like an empty response
+                row[f"{self.output_column_name}_error"] = row_result.error
+                if row_result.success:
+                    self._add_metadata(row, success=True, system_msg=system_msg)
+                else:
+                    self._add_metadata(row, success=False, error=row_result.error)
+                builder.add_row(row)
 
+            failed = [row_result for row_result in row_results if not row_result.success]
+            if failed and len(failed) == total_rows:
+                msg = f"All {total_rows} rows failed after retries: {failed[0].error}"
+                raise RuntimeError(msg)
+            if failed:
+                await logger.awarning(f"{len(failed)}/{total_rows} rows failed after retries")
             await logger.ainfo("Batch processing completed successfully")
-            return DataFrame(rows)
+            return builder.build()
 
         except (KeyError, AttributeError) as e:
             # Handle data structure and attribute access errors
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import re
 from typing import TYPE_CHECKING, Any
 
+from cachetools import LRUCache
+
 from wfx.custom.custom_component.component import Component
 from wfx.io import DataInput, HandleInput, IntInput, MultilineInput, Output
 from wfx.schema.data import Data
@@ -12,6 +15,51 @@ from wfx.schema.dataframe import DataFrame
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+# Compiled lambdas by ((user, flow), instruction, data structure hash, model identity). The prompt includes a
+# sample of the data, so a lambda is only reused within the flow (and user) it was generated for.
+_generated_lambda_cache: LRUCache[
+    tuple[tuple[str | None, str | None], str, str, tuple[str, ...]], Callable[[Any], Any]
+] = LRUCache(maxsize=256)
+MODEL_NAME_ATTRIBUTES = ("model_name", "model", "model_id", "deployment_name")
+
+
+def _model_identity(llm: Any) -> tuple[str, ...]:
+    names = (getattr(llm, attribute, None) for attribute in MODEL_NAME_ATTRIBUTES)
+    return (type(llm).__qualname__, *(name for name in names if isinstance(name, str)))
+
+
+def _json_head(value: Any, size: int) -> tuple[str, bool]:
+    """Return the start of `json.dumps(value)`, encoding just past `size` characters, and whether it was cut."""
+    chunks: list[str] = []
+    length = 0
+    for chunk in json.JSONEncoder().iterencode(value):
+        chunks.append(chunk)
+        length += len(chunk)
+        if length > size:
+            return "".join(chunks), True
+    return "".join(chunks), False
+
+
+def _json_tail(value: Any, size: int) -> str:
+    """Return the last `size` characters of `json.dumps(value)`, encoding only the end of containers."""
+    if isinstance(value, list):
+        opening, closing, items = "[", "]", [(None, item) for item in value]
+    elif isinstance(value, dict):
+        opening, closing, items = "{", "}", list(value.items())
+    else:
+        return json.dumps(value)[-size:]
+    text = closing
+    for key, item in reversed(items):
+        if len(text) >= size:
+            break
+        part = _json_tail(item, size - len(text))
+        if isinstance(value, dict):
+            part = f"{json.dumps(key if isinstance(key, str) else str(key))}: {part}"
+        text = part + (text if text == closing else ", " + text)
+    else:
+        text = opening + text
+    return text[-size:]
+
 
 class LambdaFilterComponent(Component):
     display_name = "Smart Transform"
@@ -87,14 +135,19 @@ class LambdaFilterComponent(Component):
         # For primitive types, return the type name
         return type(data).__name__
 
+    def _cache_scope(self) -> tuple[str | None, str | None]:
+        """Return the (user id, flow id) generated lambdas are shared within; both are None outside a flow."""
+        if getattr(self, "_vertex", None) is None:
+            return None, None
+        user_id, flow_id = self.user_id, self.flow_id
+        return (str(user_id) if user_id else None, str(flow_id) if flow_id else None)
+
     def _validate_lambda(self, lambda_text: str) -> bool:
         """Validate the provided lambda function text."""
         # Return False if the lambda function does not start with 'lambda' or does not contain a colon
         return lambda_text.strip().startswith("lambda") and ":" in lambda_text
 
     async def _execute_lambda(self) -> Any:
-        self.log(str(self.data))
-
         # Convert input to a unified format
         if isinstance(self.data, list):
             # Handle list of Data or DataFrame objects
@@ -126,23 +179,45 @@ class LambdaFilterComponent(Component):
         else:
             data = self.data
 
-        dump = json.dumps(data)
-        self.log(str(data))
-
-        llm = self.llm
         instruction = self.filter_instruction
-        sample_size = self.sample_size
 
         # Get data structure and samples
         data_structure = self.get_data_structure(data)
         dump_structure = json.dumps(data_structure)
         self.log(dump_structure)
 
-        # For large datasets, sample from head and tail
-        if len(dump) > self.max_size:
+        cache_key = (
+            self._cache_scope(),
+            instruction,
+            hashlib.sha256(dump_structure.encode()).hexdigest(),
+            _model_identity(self.llm),
+        )
+        fn = _generated_lambda_cache.get(cache_key)
+        if fn is None:
+            fn = await self._generate_lambda(data, dump_structure)
+            _generated_lambda_cache[cache_key] = fn
+        else:
+            self.log("Reusing the lambda generated earlier for this instruction and data structure.")
+
+        try:
+            return fn(data)
+        except Exception:
+            # The cached lambda does not fit this data; generate a new one next time
+            _generated_lambda_cache.pop(cache_key, None)
+            raise
+
+    async def _generate_lambda(self, data: Any, dump_structure: str) -> Callable[[Any], Any]:
+        """Ask the model for a lambda implementing the instruction and compile it."""
+        llm = self.llm
+        instruction = self.filter_instruction
+        sample_size = self.sample_size
+
+        # For large datasets, sample from head and tail without serializing everything in between
+        dump, is_large = _json_head(data, self.max_size)
+        if is_large:
             data_sample = (
                 f"Data is too long to display... \n\n First lines (head): {dump[:sample_size]} \n\n"
-                f" Last lines (tail): {dump[-sample_size:]})"
+                f" Last lines (tail): {_json_tail(data, sample_size)})"
             )
         else:
             data_sample = dump
@@ -182,11 +257,8 @@ class LambdaFilterComponent(Component):
             msg = f"Invalid lambda format: {lambda_text}"
             raise ValueError(msg)
 
-        # Create and apply the function
-        fn: Callable[[Any], Any] = eval(lambda_text)  # noqa: S307
-
-        # Apply the lambda function to the data
-        return fn(data)
+        # Create the function
+        return eval(lambda_text)  # noqa: S307
 
     async def process_as_data(self) -> Data:
         """Process the data and return as a Data object."""
@@ -1,3 +1,4 @@
+from wfx.base.prompts.compiled_template import compile_template
 from wfx.custom.custom_component.component import Component
 from wfx.io import DataFrameInput, MultilineInput, Output, StrInput
 from wfx.schema.message import Message
@@ -56,14 +57,7 @@ class ParseDataFrameComponent(Component):
         """
         dataframe, template, sep = self._clean_args()
 
-        lines = []
-        # For each row in the DataFrame, build a dict and format
-        for _, row in dataframe.iterrows():
-            row_dict = row.to_dict()
-            text_line = template.format(**row_dict)  # e.g. template="{text}", row_dict={"text": "Hello"}
-            lines.append(text_line)
-
-        # Join all lines with the provided separator
-        result_string = sep.join(lines)
+        # Render the template column-wise, e.g. template="{text}" with a "text" column, and join with `sep`
+        result_string = compile_template(template).render_dataframe(dataframe, sep)
         self.status = result_string  # store in self.status for UI logs
         return Message(text=result_string)
@@ -1,3 +1,4 @@
+from wfx.base.prompts.compiled_template import compile_template
 from wfx.custom.custom_component.component import Component
 from wfx.helpers.data import safe_convert
 from wfx.inputs.inputs import BoolInput, HandleInput, MessageTextInput, MultilineInput, TabInput
@@ -116,16 +117,12 @@ class ParserComponent(Component):
 
         df, data = self._clean_args()
 
-        lines = []
+        combined_text = ""
         if df is not None:
-            for _, row in df.iterrows():
-                formatted_text = self.pattern.format(**row.to_dict())
-                lines.append(formatted_text)
+            combined_text = compile_template(self.pattern).render_dataframe(df, self.sep)
         elif data is not None:
-            formatted_text = self.pattern.format(**data.data)
-            lines.append(formatted_text)
+            combined_text = self.pattern.format(**data.data)
 
-        combined_text = self.sep.join(lines)
         self.status = combined_text
         return Message(text=combined_text)
 
@@ -1,12 +1,28 @@
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING
+
+import orjson
 from langchain_text_splitters import CharacterTextSplitter
 
+from wfx.base.textsplitters.manifest import SplitManifest
+from wfx.base.vectorstores.utils import document_content_hash
 from wfx.custom.custom_component.component import Component
-from wfx.io import DropdownInput, HandleInput, IntInput, MessageTextInput, Output
+from wfx.io import BoolInput, DropdownInput, HandleInput, IntInput, MessageTextInput, Output, StrInput
 from wfx.schema.data import Data
 from wfx.schema.dataframe import DataFrame
 from wfx.schema.message import Message
 from wfx.utils.util import unescape_string
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from langchain_core.documents import Document
+
+# Rows of a DataFrame input converted to documents at a time
+DATAFRAME_BATCH_SIZE = 1000
+
 
 class SplitTextComponent(Component):
     display_name: str = "Split Text"
@@ -63,6 +79,27 @@ class SplitTextComponent(Component):
             value="False",
             advanced=True,
         ),
+        BoolInput(
+            name="stream_chunks",
+            display_name="Stream Chunks",
+            info=(
+                "Split documents one at a time instead of all at once, to keep memory low on large inputs. "
+                "Chunks also get their start index, chunk index and a stable chunk ID."
+            ),
+            value=False,
+            advanced=True,
+        ),
+        StrInput(
+            name="split_manifest_path",
+            display_name="Split Manifest Path",
+            info=(
+                "Optional file recording the documents already split. When Stream Chunks is enabled, documents "
+                "split before with the same content and settings are skipped. The file only tracks splitting: "
+                "documents are recorded once all chunks are produced, before later components use them, so "
+                "delete it after a failed downstream run to process every document again."
+            ),
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -80,62 +117,139 @@ class SplitTextComponent(Component):
             return "\t"
         return separator
 
-    def split_text_base(self):
+    def _keep_separator(self) -> bool | str:
+        # Convert string 'False'/'True' to boolean
+        keep_sep = self.keep_separator
+        if isinstance(keep_sep, str):
+            if keep_sep.lower() == "false":
+                keep_sep = False
+            elif keep_sep.lower() == "true":
+                keep_sep = True
+            # 'start' and 'end' are kept as strings
+        return keep_sep
+
+    def _build_splitter(self, *, add_start_index: bool = False) -> CharacterTextSplitter:
         separator = self._fix_separator(self.separator)
         separator = unescape_string(separator)
+        return CharacterTextSplitter(
+            chunk_overlap=self.chunk_overlap,
+            chunk_size=self.chunk_size,
+            separator=separator,
+            keep_separator=self._keep_separator(),
+            add_start_index=add_start_index,
+        )
+
+    def _iter_documents(self) -> Iterator[Document]:
+        """Yields the inputs as documents, converting DataFrames a slice of rows at a time."""
+        if isinstance(self.data_inputs, Message):
+            self.data_inputs = [self.data_inputs.to_data()]
 
         if isinstance(self.data_inputs, DataFrame):
-            if not len(self.data_inputs):
+            dataframe = self.data_inputs
+            if not len(dataframe):
                 msg = "DataFrame is empty"
                 raise TypeError(msg)
 
+            dataframe.text_key = self.text_key
+            for start in range(0, len(dataframe), DATAFRAME_BATCH_SIZE):
+                rows = DataFrame(
+                    dataframe.iloc[start : start + DATAFRAME_BATCH_SIZE],
+                    text_key=self.text_key,
+                    default_value=dataframe.default_value,
+                )
+                try:
+                    documents = rows.to_lc_documents()
+                except Exception as e:
+                    msg = f"Error converting DataFrame to documents: {e}"
+                    raise TypeError(msg) from e
+                yield from documents
+            return
+
+        if not self.data_inputs:
+            msg = "No data inputs provided"
+            raise TypeError(msg)
+
+        if isinstance(self.data_inputs, Data):
             self.data_inputs.text_key = self.text_key
+            yield self.data_inputs.to_lc_document()
+            return
+
+        found = False
+        for input_ in self.data_inputs:
+            if not isinstance(input_, Data):
+                continue
             try:
-                documents = self.data_inputs.to_lc_documents()
-            except Exception as e:
-                msg = f"Error converting DataFrame to documents: {e}"
+                document = input_.to_lc_document()
+            except AttributeError as e:
+                msg = f"Invalid input type in collection: {e}"
                 raise TypeError(msg) from e
-        elif isinstance(self.data_inputs, Message):
-            self.data_inputs = [self.data_inputs.to_data()]
-            return self.split_text_base()
-        else:
-            if not self.data_inputs:
-                msg = "No data inputs provided"
-                raise TypeError(msg)
+            found = True
+            yield document
+        if not found:
+            msg = f"No valid Data inputs found in {type(self.data_inputs)}"
+            raise TypeError(msg)
+
+    def _settings_fingerprint(self) -> str:
+        settings = {
+            "chunk_size": self.chunk_size,
+            "chunk_overlap": self.chunk_overlap,
+            "separator": self.separator,
+            "keep_separator": self.keep_separator,
+            "text_key": self.text_key,
+        }
+        return hashlib.sha256(orjson.dumps(settings, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+    def iter_chunks(self) -> Iterator[dict]:
+        """Splits the inputs one document at a time and yields each chunk's row as soon as it is produced.
 
-            documents = []
-            if isinstance(self.data_inputs, Data):
-                self.data_inputs.text_key = self.text_key
-                documents = [self.data_inputs.to_lc_document()]
-            else:
+        Every chunk carries its `start_index` in the document, its `chunk_index` and a `chunk_id` that stays
+        the same as long as the document content and the split settings do not change. With a split
+        manifest, documents already split with the same settings are skipped. Their keys are only recorded once
+        every chunk has been consumed, so a consumer that fails or stops early leaves the manifest unchanged.
+        """
+        splitter = self._build_splitter(add_start_index=True)
+        settings = self._settings_fingerprint()
+        manifest = SplitManifest(self.split_manifest_path) if self.split_manifest_path else None
+        skipped = 0
+        split_keys: list[str] = []
+        try:
+            for document in self._iter_documents():
+                key = hashlib.sha256(f"{settings}:{document_content_hash(document)}".encode()).hexdigest()
+                if manifest is not None and key in manifest:
+                    skipped += 1
+                    continue
                 try:
-                    documents = [input_.to_lc_document() for input_ in self.data_inputs if isinstance(input_, Data)]
-                    if not documents:
-                        msg = f"No valid Data inputs found in {type(self.data_inputs)}"
-                        raise TypeError(msg)
-                except AttributeError as e:
-                    msg = f"Invalid input type in collection: {e}"
+                    chunks = splitter.split_documents([document])
+                except Exception as e:
+                    msg = f"Error splitting text: {e}"
                     raise TypeError(msg) from e
+                for chunk_index, chunk in enumerate(chunks):
+                    yield {
+                        "text": chunk.page_content,
+                        **chunk.metadata,
+                        "chunk_index": chunk_index,
+                        "chunk_id": f"{key[:16]}-{chunk_index}",
+                    }
+                split_keys.append(key)
+            if manifest is not None:
+                for key in split_keys:
+                    manifest.record(key)
+        finally:
+            if manifest is not None:
+                manifest.close()
+            if skipped:
+                self.log(f"Skipped {skipped} documents already split with the same settings.")
+
+    def split_text_base(self):
+        documents = list(self._iter_documents())
         try:
-            # Convert string 'False'/'True' to boolean
-            keep_sep = self.keep_separator
-            if isinstance(keep_sep, str):
-                if keep_sep.lower() == "false":
-                    keep_sep = False
-                elif keep_sep.lower() == "true":
-                    keep_sep = True
-                # 'start' and 'end' are kept as strings
-
-            splitter = CharacterTextSplitter(
-                chunk_overlap=self.chunk_overlap,
-                chunk_size=self.chunk_size,
-                separator=separator,
-                keep_separator=keep_sep,
-            )
+            splitter = self._build_splitter()
             return splitter.split_documents(documents)
         except Exception as e:
             msg = f"Error splitting text: {e}"
             raise TypeError(msg) from e
 
     def split_text(self) -> DataFrame:
+        if self.stream_chunks:
+            return DataFrame(list(self.iter_chunks()))
         return DataFrame(self._docs_to_data(self.split_text_base()))
@@ -1,20 +1,49 @@
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from cachetools import LRUCache
 from pydantic import BaseModel, Field, create_model
 from trustcall import create_extractor
 
-from wfx.base.models.chat_result import get_chat_result
+from wfx.base.models.chat_result import build_messages_and_runnable, get_chat_result
+from wfx.base.processing.batch import BatchExecutor
 from wfx.custom.custom_component.component import Component
 from wfx.helpers.base_model import build_model_from_schema
 from wfx.io import (
     HandleInput,
+    IntInput,
     MessageTextInput,
     MultilineInput,
     Output,
     TableInput,
 )
+from wfx.log.logger import logger
 from wfx.schema.data import Data
-from wfx.schema.dataframe import DataFrame
+from wfx.schema.dataframe import DataFrame, DataFrameBuilder
 from wfx.schema.table import EditMode
 
+# Output models by (schema name, serialized schema), shared by every instance, row and run
+_output_model_cache: LRUCache[tuple[str, bytes], type[BaseModel]] = LRUCache(maxsize=128)
+# Columns the Batch Output adds to every extracted object, so output schema fields cannot use these names
+BATCH_COLUMNS = ("row_index", "error")
+
+
+def _get_output_model(schema_name: str, output_schema: list[dict[str, Any]]) -> type[BaseModel]:
+    """Return the model wrapping a list of `output_schema` objects, building it only once per schema."""
+    key = (schema_name, orjson.dumps(output_schema, option=orjson.OPT_SORT_KEYS, default=str))
+    output_model = _output_model_cache.get(key)
+    if output_model is None:
+        output_model_ = build_model_from_schema(output_schema)
+        output_model = create_model(
+            schema_name,
+            __doc__=f"A list of {schema_name}.",
+            objects=(list[output_model_], Field(description=f"A list of {schema_name}.")),  # type: ignore[valid-type]
+        )
+        _output_model_cache[key] = output_model
+    return output_model
+
 
 class StructuredOutputComponent(Component):
     display_name = "Structured Output"
@@ -34,9 +63,8 @@ class StructuredOutputComponent(Component):
         MultilineInput(
             name="input_value",
             display_name="Input Message",
-            info="The input message to the language model.",
+            info="The input message to the language model. Not used by the Batch Output.",
             tool_mode=True,
-            required=True,
         ),
         MultilineInput(
             name="system_prompt",
@@ -110,6 +138,38 @@ class StructuredOutputComponent(Component):
                 }
             ],
         ),
+        HandleInput(
+            name="batch_input",
+            display_name="Batch Input",
+            info=(
+                "Rows to extract from in the Batch Output. Each DataFrame row or Data object is sent to the "
+                "model as its own input message."
+            ),
+            input_types=["DataFrame", "Data"],
+            is_list=True,
+            required=False,
+        ),
+        MessageTextInput(
+            name="text_key",
+            display_name="Text Key",
+            info=("Column or key holding the text of each batch row. Rows without it are sent with all their values."),
+            value="text",
+            advanced=True,
+        ),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrency",
+            info="Maximum number of batch rows sent to the model at the same time.",
+            value=8,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_retries",
+            display_name="Max Retries",
+            info="Number of times a failing batch row is retried before its error is reported.",
+            value=1,
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -123,9 +183,15 @@ class StructuredOutputComponent(Component):
             display_name="Structured Output",
             method="build_structured_dataframe",
         ),
+        Output(
+            name="batch_output",
+            display_name="Batch Output",
+            method="build_batch_dataframe",
+            info="One row per extracted object, with the index of the batch row it came from and an error column.",
+        ),
     ]
 
-    def build_structured_output_base(self):
+    def _build_extractor(self):
         schema_name = self.schema_name or "OutputModel"
 
         if not hasattr(self.llm, "with_structured_output"):
@@ -135,20 +201,20 @@ class StructuredOutputComponent(Component):
             msg = "Output schema cannot be empty"
             raise ValueError(msg)
 
-        output_model_ = build_model_from_schema(self.output_schema)
-
-        output_model = create_model(
-            schema_name,
-            __doc__=f"A list of {schema_name}.",
-            objects=(list[output_model_], Field(description=f"A list of {schema_name}.")),  # type: ignore[valid-type]
-        )
+        output_model = _get_output_model(schema_name, self.output_schema)
 
         try:
-            llm_with_structured_output = create_extractor(self.llm, tools=[output_model])
+            return create_extractor(self.llm, tools=[output_model])
         except NotImplementedError as exc:
             msg = f"{self.llm.__class__.__name__} does not support structured output."
             raise TypeError(msg) from exc
 
+    def build_structured_output_base(self):
+        if not self.input_value:
+            msg = "Input Message cannot be empty"
+            raise ValueError(msg)
+        llm_with_structured_output = self._build_extractor()
+
         config_dict = {
             "run_name": self.display_name,
             "project_name": self.get_project_name(),
@@ -160,7 +226,10 @@ class StructuredOutputComponent(Component):
             input_value=self.input_value,
             config=config_dict,
         )
+        return self._parse_result(result)
 
+    @staticmethod
+    def _parse_result(result: Any) -> Any:
         # OPTIMIZATION NOTE: Simplified processing based on trustcall response structure
         # Handle non-dict responses (shouldn't happen with trustcall, but defensive)
         if not isinstance(result, dict):
@@ -204,3 +273,83 @@ class StructuredOutputComponent(Component):
             # Multiple outputs - convert to DataFrame directly
             return DataFrame(output)
         return DataFrame()
+
+    def _batch_texts(self) -> list[str]:
+        """Return the input message of every batch row, in order."""
+        items = self.batch_input if isinstance(self.batch_input, list) else [self.batch_input]
+        rows: list[dict[str, Any]] = []
+        for item in items:
+            if isinstance(item, DataFrame):
+                rows.extend(item.to_dict(orient="records"))
+            elif isinstance(item, Data):
+                rows.append(item.data)
+            elif item is not None:
+                msg = f"Unsupported batch input type: {type(item).__name__}"
+                raise TypeError(msg)
+        text_key = self.text_key or "text"
+        texts = []
+        for row in rows:
+            value = row.get(text_key)
+            texts.append(str(value) if value is not None else orjson.dumps(row, default=str).decode())
+        return texts
+
+    async def build_batch_dataframe(self) -> DataFrame:
+        """Extract objects from every batch row concurrently.
+
+        The extractor is built once for the whole batch. A row that fails or yields nothing produces a single
+        row holding its error instead of failing the batch. Output schema fields named like one of the
+        `BATCH_COLUMNS` are rejected, since those columns would overwrite them.
+        """
+        reserved = {field.get("name") for field in self.output_schema} & set(BATCH_COLUMNS)
+        if reserved:
+            msg = f"Output schema fields {sorted(reserved)} clash with the columns the Batch Output adds"
+            raise ValueError(msg)
+
+        texts = self._batch_texts()
+        if not texts:
+            return DataFrame()
+
+        extractor = self._build_extractor().with_config(
+            {
+                "run_name": self.display_name,
+                "project_name": self.get_project_name(),
+                "callbacks": self.get_langchain_callbacks(),
+            }
+        )
+
+        async def process_row(text: str) -> list[dict[str, Any]]:
+            messages, runnable = build_messages_and_runnable(
+                input_value=text, system_message=self.system_prompt, original_runnable=extractor
+            )
+            output = self._parse_result(await runnable.ainvoke(messages))
+            if not isinstance(output, list) or not output:
+                msg = "No structured output returned"
+                raise ValueError(msg)
+            return output
+
+        total = len(texts)
+        progress_step = max(1, total // 10)
+
+        async def report_progress(completed: int, total: int) -> None:
+            if completed % progress_step == 0 or completed == total:
+                self.log(f"Processed {completed}/{total} rows", name="progress")
+
+        executor = BatchExecutor(
+            process_row,
+            max_concurrency=self.max_concurrency,
+            max_retries=self.max_retries,
+            on_progress=report_progress,
+        )
+        row_results = await executor.run(texts)
+
+        builder = DataFrameBuilder()
+        for row_result in row_results:
+            if row_result.success:
+                builder.add_rows({**item, "row_index": row_result.index, "error": None} for item in row_result.result)
+            else:
+                builder.add_row({"row_index": row_result.index, "error": row_result.error})
+
+        failed = sum(not row_result.success for row_result in row_results)
+        if failed:
+            await logger.awarning(f"{failed}/{total} batch rows failed")
+        return builder.build()
@@ -1,7 +1,7 @@
 from langchain.embeddings.base import Embeddings
 from langchain_community.vectorstores import Qdrant
 
-from wfx.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
+from wfx.base.vectorstores.model import DEDUPLICATED_INGEST_INFO, LCVectorStoreComponent, check_cached_vector_store
 from wfx.helpers.data import docs_to_data
 from wfx.io import (
     DropdownInput,
@@ -37,7 +37,7 @@ class QdrantVectorStoreComponent(LCVectorStoreComponent):
         ),
         StrInput(name="content_payload_key", display_name="Content Payload Key", value="page_content", advanced=True),
         StrInput(name="metadata_payload_key", display_name="Metadata Payload Key", value="metadata", advanced=True),
-        *LCVectorStoreComponent.inputs,
+        *LCVectorStoreComponent.inputs_with_ingest_info(DEDUPLICATED_INGEST_INFO),
         HandleInput(name="embedding", display_name="Embedding", input_types=["Embeddings"]),
         IntInput(
             name="number_of_results",
@@ -84,16 +84,32 @@ class QdrantVectorStoreComponent(LCVectorStoreComponent):
             msg = "Invalid embedding object"
             raise TypeError(msg)
 
-        if documents:
-            qdrant = Qdrant.from_documents(documents, embedding=self.embedding, **qdrant_kwargs, **server_kwargs)
-        else:
-            from qdrant_client import QdrantClient
+        from qdrant_client import QdrantClient
 
-            client = QdrantClient(**server_kwargs)
-            qdrant = Qdrant(embeddings=self.embedding, client=client, **qdrant_kwargs)
+        client = QdrantClient(**server_kwargs)
+        qdrant = Qdrant(embeddings=self.embedding, client=client, **qdrant_kwargs)
+        if documents:
+            documents, ids = self._hash_documents(documents)
+            if client.collection_exists(self.collection_name):
+                documents, ids = self._filter_stored_documents(qdrant, documents, ids)
+                if documents:
+                    qdrant.add_documents(documents, ids=ids)
+            else:
+                # from_documents creates the collection with the embedding size; release the client first
+                # because a local (path based) Qdrant storage only accepts one client at a time.
+                client.close()
+                qdrant = Qdrant.from_documents(
+                    documents, embedding=self.embedding, ids=ids, **qdrant_kwargs, **server_kwargs
+                )
 
         return qdrant
 
+    def _get_stored_ids(self, vector_store: Qdrant, ids: list[str]) -> set[str]:
+        points = vector_store.client.retrieve(
+            collection_name=self.collection_name, ids=ids, with_payload=False, with_vectors=False
+        )
+        return {str(point.id) for point in points}
+
     def search_documents(self) -> list[Data]:
         vector_store = self.build_vector_store()
 
@@ -22,6 +22,7 @@ from wfx.base.tools.constants import (
     TOOLS_METADATA_INPUT_NAME,
 )
 from wfx.custom.tree_visitor import RequiredInputsVisitor
+from wfx.events.message_delta import MessageDeltaTracker
 from wfx.exceptions.component import StreamingError
 from wfx.field_typing import Tool  # noqa: TC001
 
@@ -120,6 +121,7 @@ class Component(CustomComponent):
         self._edges: list[EdgeData] = []
         self._components: list[Component] = []
         self._event_manager: EventManager | None = None
+        self._message_delta_trackers: dict[str, MessageDeltaTracker] = {}
         self._state_model = None
 
         # Process input kwargs
@@ -1570,13 +1572,21 @@ class Component(CustomComponent):
         # If skip_db_update is True and message already has an ID, skip the DB write
         # This path is used during agent streaming to avoid excessive DB round-trips
         if skip_db_update and message.id:
+            if await self._send_message_delta(message):
+                self._stored_message_id = message.id
+                self.status = message
+                return message
             # Create a fresh Message instance for consistency with normal flow
             stored_message = await Message.create(**message.model_dump())
             self._stored_message_id = stored_message.id
             # Still send the event to update the client in real-time
             # Note: If this fails, we don't need DB cleanup since we didn't write to DB
             await self._send_message_event(stored_message, id_=id_)
+            if self._supports_message_deltas():
+                tracker = self._message_delta_trackers.setdefault(str(stored_message.id), MessageDeltaTracker())
+                tracker.snapshot(stored_message)
         else:
+            self._message_delta_trackers.pop(str(getattr(message, "id", None)), None)
             # Normal flow: store/update in database
             stored_message = await self._store_message(message)
 
@@ -1638,6 +1648,27 @@ class Component(CustomComponent):
 
             await asyncio.to_thread(_send_event)
 
+    def _supports_message_deltas(self) -> bool:
+        return self._event_manager is not None and "on_message_delta" in self._event_manager.events
+
+    async def _send_message_delta(self, message: Message) -> bool:
+        """Send only what changed in `message` since it was last sent, as a `message_delta` event.
+
+        Returns False when the client needs a full snapshot instead (first send, structural change,
+        periodic resync, or an event manager without delta support).
+        """
+        if not self._supports_message_deltas():
+            return False
+        tracker = self._message_delta_trackers.get(str(message.id))
+        if tracker is None:
+            return False
+        delta = tracker.diff(message)
+        if delta is None:
+            return False
+        if delta:
+            await asyncio.to_thread(self._event_manager.on_message_delta, data=delta)
+        return True
+
     def _should_stream_message(self, stored_message: Message, original_message: Message) -> bool:
         return bool(
             hasattr(self, "_event_manager")
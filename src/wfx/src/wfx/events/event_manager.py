@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
+import itertools
 import json
 import time
 import uuid
+from dataclasses import dataclass
 from functools import partial
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from fastapi.encoders import jsonable_encoder
 from typing_extensions import Protocol
@@ -88,6 +91,47 @@ class EventManager:
         return self.events.get(name, self.noop)
 
 
+@dataclass(slots=True)
+class FlowEvent:
+    """An event delivered in process: the event type and its data exactly as produced."""
+
+    type: str
+    data: Any
+
+
+class InProcessEventManager(EventManager):
+    """Event manager for consumers in the same process.
+
+    Instead of JSON-encoded bytes, queue items carry a `FlowEvent` with the original data, so the consumer
+    skips the encode/decode round trip and encodes only what it forwards. The data is not copied, so
+    producers must not mutate it after sending. Events sent from worker threads are handed to the queue's
+    event loop thread-safely.
+    """
+
+    def __init__(self, queue, loop: asyncio.AbstractEventLoop | None = None):
+        super().__init__(queue)
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+        self._loop = loop
+        self._event_ids = itertools.count()
+
+    def send_event(self, *, event_type: str, data: LoggableType):
+        if not self.queue:
+            return
+        item = (f"{event_type}-{next(self._event_ids)}", FlowEvent(type=event_type, data=data), time.time())
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if self._loop is None or running_loop is self._loop:
+            self.queue.put_nowait(item)
+        else:
+            self._loop.call_soon_threadsafe(self.queue.put_nowait, item)
+
+
 def create_default_event_manager(queue=None):
     manager = EventManager(queue)
     manager.register_event("on_token", "token")
@@ -95,6 +139,7 @@ def create_default_event_manager(queue=None):
     manager.register_event("on_error", "error")
     manager.register_event("on_end", "end")
     manager.register_event("on_message", "add_message")
+    manager.register_event("on_message_delta", "message_delta")
     manager.register_event("on_remove_message", "remove_message")
     manager.register_event("on_end_vertex", "end_vertex")
     manager.register_event("on_build_start", "build_start")
@@ -108,3 +153,13 @@ def create_stream_tokens_event_manager(queue=None):
     manager.register_event("on_token", "token")
     manager.register_event("on_end", "end")
     return manager
+
+
+def create_in_process_stream_event_manager(queue, loop: asyncio.AbstractEventLoop | None = None):
+    """Stream tokens event manager that delivers `FlowEvent` objects, including message deltas."""
+    manager = InProcessEventManager(queue, loop)
+    manager.register_event("on_message", "add_message")
+    manager.register_event("on_message_delta", "message_delta")
+    manager.register_event("on_token", "token")
+    manager.register_event("on_end", "end")
+    return manager
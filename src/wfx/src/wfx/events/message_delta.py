@@ -0,0 +1,135 @@
+"""Incremental updates for messages that are re-sent while they stream, such as agent steps.
+
+Instead of sending the whole message (text and every content block) as an `add_message` event on each
+update, the sender emits `message_delta` events holding only what changed since the previous event:
+
+    {
+        "id": "<message id>",
+        "seq": 3,                       # increases by one per delta; reset by every snapshot
+        "text_append": "...",           # text appended to the message (or "text" to replace it)
+        "state": "partial",             # properties.state, when it changed
+        "contents": [                   # new or updated entries of content_blocks[block].contents
+            {"block": 0, "index": 2, "content": {...}},
+        ],
+    }
+
+A full `add_message` snapshot is sent first, whenever the change cannot be expressed as a delta (e.g. a
+content block was added or removed) and every `snapshot_interval` deltas, so clients that missed an
+event resynchronize. `MessageDeltaTracker` produces deltas on the sending side and `MessageStateReducer`
+rebuilds the full message on the receiving side.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from wfx.schema.message import Message
+
+MESSAGE_DELTA_EVENT = "message_delta"
+SNAPSHOT_INTERVAL = 50
+
+
+def _message_state(message: Message) -> str | None:
+    properties = message.properties
+    return properties.get("state") if isinstance(properties, dict) else getattr(properties, "state", None)
+
+
+class MessageDeltaTracker:
+    """Remembers what was last sent for one message and computes the next delta."""
+
+    def __init__(self, snapshot_interval: int = SNAPSHOT_INTERVAL) -> None:
+        self.snapshot_interval = snapshot_interval
+        self._text: str = ""
+        self._state: str | None = None
+        self._block_headers: list[dict[str, Any]] = []
+        self._contents: list[list[dict[str, Any]]] = []
+        self._seq = 0
+
+    def snapshot(self, message: Message) -> None:
+        """Record `message` as sent in full."""
+        self._text = message.text if isinstance(message.text, str) else ""
+        self._state = _message_state(message)
+        self._block_headers = [block.model_dump(exclude={"contents"}) for block in message.content_blocks]
+        self._contents = [[content.model_dump() for content in block.contents] for block in message.content_blocks]
+        self._seq = 0
+
+    def diff(self, message: Message) -> dict[str, Any] | None:
+        """Return the delta from the last sent state to `message`, or None when a snapshot is required.
+
+        Returns an empty dict when nothing changed. The tracker assumes the returned delta is sent.
+        """
+        if self._seq >= self.snapshot_interval or not isinstance(message.text, str):
+            return None
+        if len(message.content_blocks) != len(self._block_headers):
+            return None
+        if any(
+            block.model_dump(exclude={"contents"}) != header
+            for block, header in zip(message.content_blocks, self._block_headers, strict=True)
+        ):
+            return None
+
+        delta: dict[str, Any] = {}
+        if message.text != self._text:
+            if message.text.startswith(self._text):
+                delta["text_append"] = message.text[len(self._text) :]
+            else:
+                delta["text"] = message.text
+        state = _message_state(message)
+        if state != self._state:
+            delta["state"] = state
+
+        changed_contents = []
+        for block_index, block in enumerate(message.content_blocks):
+            sent = self._contents[block_index]
+            if len(block.contents) < len(sent):
+                return None
+            for index, content in enumerate(block.contents):
+                dumped = content.model_dump()
+                if index >= len(sent):
+                    sent.append(dumped)
+                elif dumped == sent[index]:
+                    continue
+                else:
+                    sent[index] = dumped
+                changed_contents.append({"block": block_index, "index": index, "content": dumped})
+        if changed_contents:
+            delta["contents"] = changed_contents
+        if not delta:
+            return delta
+
+        self._text = message.text
+        self._state = state
+        self._seq += 1
+        return {"id": str(message.id), "seq": self._seq, **delta}
+
+
+class MessageStateReducer:
+    """Rebuilds full message dicts from `add_message` snapshots and `message_delta` events."""
+
+    def __init__(self) -> None:
+        self.messages: dict[str, dict[str, Any]] = {}
+
+    def apply_snapshot(self, data: dict[str, Any]) -> dict[str, Any]:
+        if message_id := data.get("id"):
+            self.messages[str(message_id)] = data
+        return data
+
+    def apply_delta(self, delta: dict[str, Any]) -> dict[str, Any] | None:
+        """Apply `delta` to the message it refers to and return the updated message, if known."""
+        message = self.messages.get(str(delta.get("id")))
+        if message is None:
+            return None
+        if "text" in delta:
+            message["text"] = delta["text"]
+        elif "text_append" in delta:
+            message["text"] = (message.get("text") or "") + delta["text_append"]
+        if "state" in delta:
+            message.setdefault("properties", {})["state"] = delta["state"]
+        for change in delta.get("contents", []):
+            contents = message["content_blocks"][change["block"]]["contents"]
+            if change["index"] < len(contents):
+                contents[change["index"]] = change["content"]
+            else:
+                contents.append(change["content"])
+        return message
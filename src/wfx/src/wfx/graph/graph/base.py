@@ -110,6 +110,13 @@ class Graph:
         self.run_manager = RunnableVerticesManager()
         self._vertices: list[NodeData] = []
         self._edges: list[EdgeData] = []
+        # Lookup structures derived from `self.edges` and the adjacency maps.
+        # They are built lazily and reset by `_invalidate_topology_caches` on structural edits.
+        self._edges_by_source: dict[str, list[CycleEdge]] | None = None
+        self._edges_by_target: dict[str, list[CycleEdge]] | None = None
+        self._edge_by_pair: dict[tuple[str, str], CycleEdge] | None = None
+        self._successors_cache: dict[str, list[Vertex]] = {}
+        self._predecessors_cache: dict[str, list[Vertex]] = {}
 
         self.top_level_vertices: list[str] = []
         self.vertex_map: dict[str, Vertex] = {}
@@ -495,6 +502,7 @@ class Graph:
         self.successor_map[source_id].append(target_id)
         self.in_degree_map[target_id] += 1
         self.parent_child_map[source_id].append(target_id)
+        self._invalidate_topology_caches()
 
     def add_node(self, node: NodeData) -> None:
         self._vertices.append(node)
@@ -909,6 +917,7 @@ class Graph:
             vertices = self.vertices
 
         self.predecessor_map, self.successor_map = self.build_adjacency_maps(edges)
+        self._invalidate_topology_caches()
 
         self.in_degree_map = self.build_in_degree(edges)
         self.parent_child_map = self.build_parent_child_map(vertices)
@@ -1024,10 +1033,31 @@ class Graph:
 
     def get_edge(self, source_id: str, target_id: str) -> CycleEdge | None:
         """Returns the edge between two vertices."""
+        self._ensure_edge_index()
+        return self._edge_by_pair.get((source_id, target_id))
+
+    def _ensure_edge_index(self) -> None:
+        """Indexes `self.edges` by source, by target and by (source, target) if not indexed yet."""
+        if self._edge_by_pair is not None:
+            return
+        edges_by_source: dict[str, list[CycleEdge]] = defaultdict(list)
+        edges_by_target: dict[str, list[CycleEdge]] = defaultdict(list)
+        edge_by_pair: dict[tuple[str, str], CycleEdge] = {}
         for edge in self.edges:
-            if edge.source_id == source_id and edge.target_id == target_id:
-                return edge
-        return None
+            edges_by_source[edge.source_id].append(edge)
+            edges_by_target[edge.target_id].append(edge)
+            edge_by_pair.setdefault((edge.source_id, edge.target_id), edge)
+        self._edges_by_source = edges_by_source
+        self._edges_by_target = edges_by_target
+        self._edge_by_pair = edge_by_pair
+
+    def _invalidate_topology_caches(self) -> None:
+        """Drops the edge index and the cached neighbor lists after the graph structure changed."""
+        self._edges_by_source = None
+        self._edges_by_target = None
+        self._edge_by_pair = None
+        self._successors_cache = {}
+        self._predecessors_cache = {}
 
     def build_parent_child_map(self, vertices: list[Vertex]):
         parent_child_map = defaultdict(list)
@@ -1116,6 +1146,7 @@ class Graph:
             state["run_manager"] = RunnableVerticesManager.from_dict(run_manager)
         self.__dict__.update(state)
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
+        self._invalidate_topology_caches()
         # Tracing service will be lazily initialized via property when needed
         self.set_run_id(self._run_id)
 
@@ -1178,6 +1209,7 @@ class Graph:
             new_edges.append(edge)
         new_edges += other_vertex.edges
         self.edges = new_edges
+        self._invalidate_topology_caches()
 
     def vertex_data_is_identical(self, vertex: Vertex, other_vertex: Vertex) -> bool:
         data_is_equivalent = vertex == other_vertex
@@ -1276,6 +1308,7 @@ class Graph:
         """Adds a vertex to the graph."""
         self.vertices.append(vertex)
         self.vertex_map[vertex.id] = vertex
+        self._invalidate_topology_caches()
 
     def add_vertex(self, vertex: Vertex) -> None:
         """Adds a new vertex to the graph."""
@@ -1285,15 +1318,20 @@ class Graph:
     def _update_edges(self, vertex: Vertex) -> None:
         """Updates the edges of a vertex."""
         # Vertex has edges, so we need to update the edges
+        edges_added = False
         for edge in vertex.edges:
             if edge not in self.edges and edge.source_id in self.vertex_map and edge.target_id in self.vertex_map:
                 self.edges.append(edge)
+                edges_added = True
+        if edges_added:
+            self._invalidate_topology_caches()
 
     def _build_graph(self) -> None:
         """Builds the graph from the vertices and edges."""
         self.vertices = self._build_vertices()
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
         self.edges = self._build_edges()
+        self._invalidate_topology_caches()
 
         # This is a hack to make sure that the LLM vertex is sent to
         # the toolkit vertex
@@ -1350,6 +1388,7 @@ class Graph:
         self.vertices.remove(vertex)
         self.vertex_map.pop(vertex_id)
         self.edges = [edge for edge in self.edges if vertex_id not in {edge.source_id, edge.target_id}]
+        self._invalidate_topology_caches()
 
     def _build_vertex_params(self) -> None:
         """Identifies and handles the LLM vertex within the graph."""
@@ -1598,23 +1637,23 @@ class Graph:
         """Returns a list of edges for a given vertex."""
         # The idea here is to return the edges that have the vertex_id as source or target
         # or both
-        return [
-            edge
-            for edge in self.edges
-            if (edge.source_id == vertex_id and is_source is not False)
-            or (edge.target_id == vertex_id and is_target is not False)
-        ]
+        self._ensure_edge_index()
+        edges: list[CycleEdge] = []
+        if is_source is not False:
+            edges.extend(self._edges_by_source.get(vertex_id, []))
+        if is_target is not False:
+            # Self-loops are already included as outgoing edges
+            edges.extend(
+                edge
+                for edge in self._edges_by_target.get(vertex_id, [])
+                if is_source is False or edge.source_id != vertex_id
+            )
+        return edges
 
     def get_vertices_with_target(self, vertex_id: str) -> list[Vertex]:
         """Returns the vertices connected to a vertex."""
-        vertices: list[Vertex] = []
-        for edge in self.edges:
-            if edge.target_id == vertex_id:
-                vertex = self.get_vertex(edge.source_id)
-                if vertex is None:
-                    continue
-                vertices.append(vertex)
-        return vertices
+        self._ensure_edge_index()
+        return [self.get_vertex(edge.source_id) for edge in self._edges_by_target.get(vertex_id, [])]
 
     async def process(
         self,
@@ -1689,9 +1728,11 @@ class Graph:
         predecessors; otherwise, includes the successor itself. Returns a sorted list of all such vertex IDs.
         """
         next_runnable_vertices = set()
-        for v_id in sorted(vertex_successors_ids):
+        # Successors of the same vertex often share pending predecessors, so the walk is shared
+        visited: set[str] = set()
+        for v_id in sorted(set(vertex_successors_ids)):
             if not self.is_vertex_runnable(v_id):
-                next_runnable_vertices.update(self.find_runnable_predecessors_for_successor(v_id))
+                next_runnable_vertices.update(self.find_runnable_predecessors_for_successor(v_id, visited=visited))
             else:
                 next_runnable_vertices.add(v_id)
 
@@ -1846,9 +1887,8 @@ class Graph:
                 raise ValueError(msg)
             if state[vertex] == 0:
                 state[vertex] = 1
-                for edge in vertex.edges:
-                    if edge.source_id == vertex.id:
-                        dfs(self.get_vertex(edge.target_id))
+                for edge in self.get_vertex_edges(vertex.id, is_target=False):
+                    dfs(self.get_vertex(edge.target_id))
                 state[vertex] = 2
                 sorted_vertices.append(vertex)
 
@@ -1867,7 +1907,11 @@ class Graph:
 
     def get_predecessors(self, vertex):
         """Returns the predecessors of a vertex."""
-        return [self.get_vertex(source_id) for source_id in self.predecessor_map.get(vertex.id, [])]
+        predecessors = self._predecessors_cache.get(vertex.id)
+        if predecessors is None:
+            predecessors = [self.get_vertex(source_id) for source_id in self.predecessor_map.get(vertex.id, [])]
+            self._predecessors_cache[vertex.id] = predecessors
+        return predecessors
 
     def get_all_successors(self, vertex: Vertex, *, recursive=True, flat=True, visited=None):
         """Returns all successors of a given vertex, optionally recursively and as a flat or nested list.
@@ -1922,7 +1966,11 @@ class Graph:
         Returns:
             A list of vertices that are direct successors of the specified vertex.
         """
-        return [self.get_vertex(target_id) for target_id in self.successor_map.get(vertex.id, set())]
+        successors = self._successors_cache.get(vertex.id)
+        if successors is None:
+            successors = [self.get_vertex(target_id) for target_id in self.successor_map.get(vertex.id, [])]
+            self._successors_cache[vertex.id] = successors
+        return successors
 
     def get_all_predecessors(self, vertex: Vertex, *, recursive: bool = True) -> list[Vertex]:
         """Retrieves all predecessor vertices of a given vertex.
@@ -1946,21 +1994,12 @@ class Graph:
         The count reflects the number of edges between the input vertex and each neighbor.
         """
         neighbors: dict[Vertex, int] = {}
-        for edge in self.edges:
-            if edge.source_id == vertex.id:
-                neighbor = self.get_vertex(edge.target_id)
-                if neighbor is None:
-                    continue
-                if neighbor not in neighbors:
-                    neighbors[neighbor] = 0
-                neighbors[neighbor] += 1
-            elif edge.target_id == vertex.id:
-                neighbor = self.get_vertex(edge.source_id)
-                if neighbor is None:
-                    continue
-                if neighbor not in neighbors:
-                    neighbors[neighbor] = 0
-                neighbors[neighbor] += 1
+        for edge in self.get_vertex_edges(vertex.id):
+            neighbor_id = edge.target_id if edge.source_id == vertex.id else edge.source_id
+            neighbor = self.get_vertex(neighbor_id)
+            if neighbor not in neighbors:
+                neighbors[neighbor] = 0
+            neighbors[neighbor] += 1
         return neighbors
 
     @property
@@ -2194,9 +2233,11 @@ class Graph:
         # Check if vertex is conditionally excluded (for conditional routing)
         if vertex_id in self.conditionally_excluded_vertices:
             return False
-        is_active = self.get_vertex(vertex_id).is_active()
-        is_loop = self.get_vertex(vertex_id).is_loop
-        return self.run_manager.is_vertex_runnable(vertex_id, is_active=is_active, is_loop=is_loop)
+        # Vertices that are running or not scheduled can be rejected without resolving the vertex
+        if vertex_id in self.run_manager.vertices_being_run or vertex_id not in self.run_manager.vertices_to_run:
+            return False
+        vertex = self.get_vertex(vertex_id)
+        return self.run_manager.is_vertex_runnable(vertex_id, is_active=vertex.is_active(), is_loop=vertex.is_loop)
 
     def build_run_map(self) -> None:
         """Builds the run map for the graph.
@@ -2218,23 +2259,28 @@ class Graph:
 
         return sorted(runnable_vertices)
 
-    def find_runnable_predecessors_for_successor(self, vertex_id: str) -> list[str]:
-        runnable_vertices = []
-        visited = set()
+    def find_runnable_predecessors_for_successor(self, vertex_id: str, visited: set[str] | None = None) -> list[str]:
+        """Walks the pending predecessors of a vertex and returns the ones that can run now.
 
-        def find_runnable_predecessors(predecessor_id: str) -> None:
+        The walk only follows predecessors that are still pending in the run manager, so it stays
+        proportional to the unfinished part of the graph. Passing the same `visited` set across calls
+        avoids walking shared ancestors more than once.
+        """
+        runnable_vertices = []
+        if visited is None:
+            visited = set()
+        run_predecessors = self.run_manager.run_predecessors
+        stack = list(reversed(run_predecessors.get(vertex_id, [])))
+        while stack:
+            predecessor_id = stack.pop()
             if predecessor_id in visited:
-                return
+                continue
             visited.add(predecessor_id)
 
             if self.is_vertex_runnable(predecessor_id):
                 runnable_vertices.append(predecessor_id)
             else:
-                for pred_pred_id in self.run_manager.run_predecessors.get(predecessor_id, []):
-                    find_runnable_predecessors(pred_pred_id)
-
-        for predecessor_id in self.run_manager.run_predecessors.get(vertex_id, []):
-            find_runnable_predecessors(predecessor_id)
+                stack.extend(reversed(run_predecessors.get(predecessor_id, [])))
         return runnable_vertices
 
     def remove_from_predecessors(self, vertex_id: str) -> None:
@@ -101,18 +101,25 @@ class RunnableVerticesManager:
 
     def remove_from_predecessors(self, vertex_id: str) -> None:
         """Removes a vertex from the predecessor list of its successors."""
-        predecessors = self.run_map.get(vertex_id, [])
-        for predecessor in predecessors:
-            if vertex_id in self.run_predecessors[predecessor]:
-                self.run_predecessors[predecessor].remove(vertex_id)
+        successors = self.run_map.get(vertex_id, [])
+        for successor in successors:
+            pending = self.run_predecessors.get(successor)
+            if pending and vertex_id in pending:
+                pending.remove(vertex_id)
 
     def build_run_map(self, predecessor_map, vertices_to_run) -> None:
-        """Builds a map of vertices and their runnable successors."""
+        """Builds a map of vertices and their runnable successors.
+
+        The pending predecessor lists are copied so that fulfilling a dependency during a run does not
+        drain the graph's `predecessor_map`, which is reused when the graph is sorted again.
+        """
         self.run_map = defaultdict(list)
+        run_predecessors: dict[str, list[str]] = defaultdict(list)
         for vertex_id, predecessors in predecessor_map.items():
+            run_predecessors[vertex_id] = list(predecessors)
             for predecessor in predecessors:
                 self.run_map[predecessor].append(vertex_id)
-        self.run_predecessors = predecessor_map.copy()
+        self.run_predecessors = run_predecessors
         self.vertices_to_run = vertices_to_run
 
     def update_vertex_run_state(self, vertex_id: str, *, is_runnable: bool) -> None:
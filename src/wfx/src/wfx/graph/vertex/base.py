@@ -12,7 +12,9 @@ from wfx.exceptions.component import ComponentBuildError
 from wfx.graph.schema import INPUT_COMPONENTS, OUTPUT_COMPONENTS, InterfaceComponentTypes, ResultData
 from wfx.graph.utils import UnbuiltObject, UnbuiltResult, log_transaction
 from wfx.graph.vertex.param_handler import ParameterHandler
+from wfx.graph.vertex.template_interning import template_interner
 from wfx.interface import initialize
+from wfx.interface.components import component_cache
 from wfx.interface.listing import lazy_load_dict
 from wfx.log.logger import logger
 from wfx.schema.artifact import ArtifactType
@@ -109,8 +111,6 @@ class Vertex:
         self.output_names: list[str] = [
             output["name"] for output in self.outputs if isinstance(output, dict) and "name" in output
         ]
-        self._incoming_edges: list[CycleEdge] | None = None
-        self._outgoing_edges: list[CycleEdge] | None = None
 
     @property
     def lock(self):
@@ -191,15 +191,11 @@ class Vertex:
 
     @property
     def outgoing_edges(self) -> list[CycleEdge]:
-        if self._outgoing_edges is None:
-            self._outgoing_edges = [edge for edge in self.edges if edge.source_id == self.id]
-        return self._outgoing_edges
+        return self.graph.get_vertex_edges(self.id, is_target=False)
 
     @property
     def incoming_edges(self) -> list[CycleEdge]:
-        if self._incoming_edges is None:
-            self._incoming_edges = [edge for edge in self.edges if edge.target_id == self.id]
-        return self._incoming_edges
+        return self.graph.get_vertex_edges(self.id, is_source=False)
 
     # Get edge connected to an output of a certain name
     def get_incoming_edge_by_target_param(self, target_param: str) -> str | None:
@@ -277,12 +273,13 @@ class Vertex:
             or template_dict["_type"].islower()
             else template_dict["_type"]
         )
+        template_interner.intern_node(self.data["type"], self.data["node"])
 
         if self.base_type is None:
-            for base_type, value in lazy_load_dict.all_types_dict.items():
-                if self.vertex_type in value:
-                    self.base_type = base_type
-                    break
+            # Prefer the already loaded component catalog over building the listing dict
+            self.base_type = component_cache.get_base_type(self.vertex_type) or lazy_load_dict.get_base_type(
+                self.vertex_type
+            )
 
     def get_value_from_output_names(self, key: str):
         if key in self.output_names:
@@ -0,0 +1,68 @@
+"""Sharing of static template metadata between vertices of the same component.
+
+Every vertex keeps the node template it was loaded from, so a flow with many instances of one component
+holds many equal copies of its field metadata and, above all, of its source code. `TemplateInterner`
+keeps one canonical string per (component type, code hash, field, key) and points matching vertex
+templates at it, so the copies share memory and pickling the graph writes each string once.
+
+Only strings are shared: they are immutable, so a vertex that overrides a value simply holds its own.
+Lists such as `options` stay per vertex because components update them in place from `update_build_config`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from typing import Any
+
+from cachetools import LRUCache
+
+# Per field, the only value shared across vertices is the component code; other values are user input.
+SHARED_VALUE_FIELDS = frozenset({"code"})
+MAX_INTERNED_COMPONENTS = 512
+
+
+class TemplateInterner:
+    """Deduplicates static string metadata of node templates per (component type, code hash)."""
+
+    def __init__(self, maxsize: int = MAX_INTERNED_COMPONENTS) -> None:
+        self._tables: LRUCache[tuple[str, str], dict[tuple[str, str], str]] = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _code_hash(node: dict[str, Any]) -> str | None:
+        metadata = node.get("metadata")
+        if isinstance(metadata, dict) and metadata.get("code_hash"):
+            return metadata["code_hash"]
+        code_field = node.get("template", {}).get("code")
+        if isinstance(code_field, dict) and isinstance(code_field.get("value"), str):
+            return hashlib.sha256(code_field["value"].encode("utf-8")).hexdigest()[:12]
+        return None
+
+    def intern_node(self, component_type: str, node: dict[str, Any]) -> None:
+        """Replace static strings of `node["template"]` in place with the shared instances."""
+        code_hash = self._code_hash(node)
+        template = node.get("template")
+        if code_hash is None or not isinstance(template, dict):
+            return
+        with self._lock:
+            table = self._tables.get((component_type, code_hash))
+            if table is None:
+                table = self._tables[component_type, code_hash] = {}
+
+        for field_name, field in template.items():
+            if not isinstance(field, dict):
+                continue
+            for key, value in field.items():
+                if not isinstance(value, str) or (key == "value" and field_name not in SHARED_VALUE_FIELDS):
+                    continue
+                shared = table.setdefault((field_name, key), value)
+                if shared is not value and shared == value:
+                    field[key] = shared
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tables.clear()
+
+
+template_interner = TemplateInterner()
@@ -31,6 +31,51 @@ class ComponentCache:
         """
         self.all_types_dict: dict[str, Any] | None = None
         self.fully_loaded_components: dict[str, bool] = {}
+        self.version = 0
+        self._base_version = 0
+        self._type_versions: dict[str, int] = {}
+        self._base_type_index: dict[str, str] = {}
+        self._base_type_index_key: tuple[dict[str, Any], int] | None = None
+
+    def mark_changed(self, component_type: str | None = None) -> None:
+        """Record a change to `all_types_dict` so derived data (e.g. serialized responses) can be refreshed.
+
+        Args:
+            component_type: The category that changed, or None when the whole dictionary changed.
+        """
+        self.version += 1
+        if component_type is None:
+            self._base_version = self.version
+            self._type_versions.clear()
+        else:
+            self._type_versions[component_type] = self.version
+
+    def get_type_version(self, component_type: str) -> int:
+        """Return the version at which a component category last changed."""
+        return self._type_versions.get(component_type, self._base_version)
+
+    def get_base_type(self, component_type: str) -> str | None:
+        """Return the category of a component type, or None if the catalog is not loaded or lacks it.
+
+        The reverse index is rebuilt when the catalog is replaced or `mark_changed` is called.
+        """
+        all_types = self.all_types_dict
+        if not all_types:
+            return None
+        key = self._base_type_index_key
+        if key is None or key[0] is not all_types or key[1] != self.version:
+            self._base_type_index = build_base_type_index(all_types)
+            self._base_type_index_key = (all_types, self.version)
+        return self._base_type_index.get(component_type)
+
+
+def build_base_type_index(all_types: dict[str, Any]) -> dict[str, str]:
+    """Map every component type to the first category that lists it."""
+    index: dict[str, str] = {}
+    for base_type, component_types in all_types.items():
+        for component_type in component_types:
+            index.setdefault(component_type, base_type)
+    return index
 
 
 # Singleton instance
@@ -531,6 +576,7 @@ async def get_and_cache_all_types_dict(
             **aiexec_components["components"],
             **custom_flat,
         }
+        component_cache.mark_changed()
         component_count = sum(len(comps) for comps in component_cache.all_types_dict.values())
         await logger.adebug(f"Loaded {component_count} components")
     return component_cache.all_types_dict
@@ -709,6 +755,7 @@ async def ensure_component_loaded(component_type: str, component_name: str, sett
 
             # Mark as fully loaded
             component_cache.fully_loaded_components[component_key] = True
+            component_cache.mark_changed(component_type)
             await logger.adebug(f"Component {component_type}:{component_name} fully loaded")
         else:
             await logger.awarning(f"Failed to fully load component {component_type}:{component_name}")
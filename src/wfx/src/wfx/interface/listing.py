@@ -7,6 +7,15 @@ from wfx.utils.lazy_load import LazyLoadDictBase
 class AllTypesDict(LazyLoadDictBase):
     def __init__(self) -> None:
         self._all_types_dict = None
+        self._base_type_index: dict[str, str] | None = None
+
+    def get_base_type(self, component_type: str) -> str | None:
+        """Return the category that lists `component_type`, if any."""
+        if self._base_type_index is None:
+            from wfx.interface.components import build_base_type_index
+
+            self._base_type_index = build_base_type_index(self.all_types_dict)
+        return self._base_type_index.get(component_type)
 
     def _build_dict(self):
         langchain_types_dict = self.get_type_dict()
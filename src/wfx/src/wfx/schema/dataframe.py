@@ -1,8 +1,10 @@
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, cast
 
 import pandas as pd
 from langchain_core.documents import Document
 from pandas import DataFrame as pandas_DataFrame
+from pandas.api.extensions import ExtensionDtype
 
 from wfx.schema.data import Data
 
@@ -88,11 +90,28 @@ class DataFrame(pandas_DataFrame):
     def default_value(self, value: str) -> None:
         self._default_value = value
 
+    def _records(self) -> list[dict]:
+        """Returns the rows as dictionaries, built column by column.
+
+        Equivalent to `to_dict(orient="records")` but converts each column to Python objects in one pass
+        instead of boxing every cell individually.
+        """
+        if not self.columns.is_unique:
+            return self.to_dict(orient="records")
+        columns = list(self.columns)
+        values = []
+        for column in columns:
+            series = self[column]
+            column_values = series.tolist()
+            if isinstance(series.dtype, ExtensionDtype):
+                # Nullable extension arrays yield pd.NA where to_dict returns None
+                column_values = [None if value is pd.NA else value for value in column_values]
+            values.append(column_values)
+        return [dict(zip(columns, row, strict=True)) for row in zip(*values, strict=True)]
+
     def to_data_list(self) -> list[Data]:
         """Converts the DataFrame back to a list of Data objects."""
-        list_of_dicts = self.to_dict(orient="records")
-        # suggested change: [Data(**row) for row in list_of_dicts]
-        return [Data(data=row) for row in list_of_dicts]
+        return [Data(data=row) for row in self._records()]
 
     def add_row(self, data: dict | Data) -> "DataFrame":
         """Adds a single row to the dataset.
@@ -106,6 +125,8 @@ class DataFrame(pandas_DataFrame):
         Example:
             >>> dataset = DataFrame([{"name": "John"}])
             >>> dataset = dataset.add_row({"name": "Jane"})
+
+        Each call copies the whole frame; use `DataFrameBuilder` to accumulate rows in a loop.
         """
         if isinstance(data, Data):
             data = data.data
@@ -152,7 +173,7 @@ class DataFrame(pandas_DataFrame):
         Returns:
             list[Document]: The converted list of Documents.
         """
-        list_of_dicts = self.to_dict(orient="records")
+        list_of_dicts = self._records()
         documents = []
         for row in list_of_dicts:
             data_copy = row.copy()
@@ -190,8 +211,7 @@ class DataFrame(pandas_DataFrame):
         Returns:
             Data: A Data object containing the DataFrame records under 'results' key.
         """
-        dict_list = self.to_dict(orient="records")
-        return Data(data={"results": dict_list})
+        return Data(data={"results": self._records()})
 
     def to_message(self) -> "Message":
         from wfx.schema.message import Message
@@ -208,3 +228,37 @@ class DataFrame(pandas_DataFrame):
         processed_df = processed_df.map(lambda x: str(x).replace("\n", "<br/>") if isinstance(x, str) else x)
         # Convert to markdown and wrap in a Message
         return Message(text=processed_df.to_markdown(index=False))
+
+
+class DataFrameBuilder:
+    """Collects rows and materializes a DataFrame once.
+
+    `DataFrame.add_row` returns a new frame on every call, which makes row-by-row accumulation quadratic.
+    The builder only buffers the rows and builds the frame in a single step.
+
+    Example:
+        >>> builder = DataFrameBuilder()
+        >>> for item in items:
+        ...     builder.add_row({"name": item.name})
+        >>> dataset = builder.build()
+    """
+
+    def __init__(self, text_key: str = "text", default_value: str = "") -> None:
+        self.text_key = text_key
+        self.default_value = default_value
+        self._rows: list[dict] = []
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add_row(self, data: dict | Data) -> None:
+        self._rows.append(data.data if isinstance(data, Data) else data)
+
+    def add_rows(self, data: Iterable[dict | Data]) -> None:
+        self._rows.extend(item.data if isinstance(item, Data) else item for item in data)
+
+    def build(self) -> DataFrame:
+        """Returns a DataFrame with every row added so far."""
+        if not self._rows:
+            return DataFrame(text_key=self.text_key, default_value=self.default_value)
+        return DataFrame(self._rows, text_key=self.text_key, default_value=self.default_value)
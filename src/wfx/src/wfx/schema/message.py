@@ -16,6 +16,7 @@ from langchain_core.prompts.chat import BaseChatPromptTemplate, ChatPromptTempla
 from langchain_core.prompts.prompt import PromptTemplate
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_serializer, field_validator
 
+from wfx.base.prompts.compiled_template import compile_template
 from wfx.base.prompts.utils import dict_values_to_string
 from wfx.log.logger import logger
 from wfx.schema.content_block import ContentBlock
@@ -251,9 +252,13 @@ class Message(Data):
         return cls(prompt=prompt_json)
 
     def format_text(self):
-        prompt_template = PromptTemplate.from_template(self.template)
         variables_with_str_values = dict_values_to_string(self.variables)
-        formatted_prompt = prompt_template.format(**variables_with_str_values)
+        compiled_template = compile_template(self.template)
+        if compiled_template.simple:
+            formatted_prompt = compiled_template.format(**variables_with_str_values)
+        else:
+            # Let LangChain reject attribute access and indexing in prompt variables
+            formatted_prompt = PromptTemplate.from_template(self.template).format(**variables_with_str_values)
         self.text = formatted_prompt
         return formatted_prompt
 
@@ -1,8 +1,9 @@
-from collections.abc import AsyncIterator, Generator, Iterator
+from collections.abc import AsyncIterator, Callable, Generator, Iterator
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any, cast
 from uuid import UUID
+from weakref import WeakKeyDictionary
 
 import numpy as np
 import pandas as pd
@@ -99,17 +100,36 @@ def _serialize_pydantic_v1(obj: BaseModelV1, max_length: int | None, max_items:
     return serialize(obj.dict(), max_length, max_items)
 
 
+_JSON_SCALAR_TYPES = (int, float, bool, type(None))
+
+
+def _is_json_native(values: Any, max_length: int | None) -> bool:
+    """Whether every value is a JSON scalar (or a string within `max_length`) that serializes to itself."""
+    for value in values:
+        value_type = type(value)
+        if value_type is str:
+            if max_length is not None and len(value) > max_length:
+                return False
+        elif value_type not in _JSON_SCALAR_TYPES:
+            return False
+    return True
+
+
 def _serialize_dict(obj: dict, max_length: int | None, max_items: int | None) -> dict:
     """Recursively process dictionary values."""
+    if _is_json_native(obj.values(), max_length):
+        return dict(obj)
     return {k: serialize(v, max_length, max_items) for k, v in obj.items()}
 
 
 def _serialize_list_tuple(obj: list | tuple, max_length: int | None, max_items: int | None) -> list:
     """Truncate long lists and process items recursively."""
     if max_items is not None and len(obj) > max_items:
-        truncated = list(obj)[:max_items]
+        truncated = list(obj[:max_items])
         truncated.append(f"... [truncated {len(obj) - max_items} items]")
         obj = truncated
+    if _is_json_native(obj, max_length):
+        return list(obj)
     return [serialize(item, max_length, max_items) for item in obj]
 
 
@@ -181,11 +201,57 @@ def _serialize_numpy_type(obj: Any, max_length: int | None, max_items: int | Non
     return UNSERIALIZABLE_SENTINEL
 
 
+def _serialize_unchanged(obj: Any, *_) -> Any:
+    return obj
+
+
+def _resolve_instance_serializer(obj: Any) -> Callable[[Any, int | None, int | None], Any]:
+    """Pick the serializer for an instance (not a class); the choice depends only on `type(obj)`.
+
+    The order mirrors the `match` in `_serialize_dispatcher`.
+    """
+    if isinstance(obj, int | float | bool | complex):
+        return _serialize_unchanged
+    for types, serializer in (
+        (str, _serialize_str),
+        (bytes, _serialize_bytes),
+        (datetime, _serialize_datetime),
+        (Decimal, _serialize_decimal),
+        (UUID, _serialize_uuid),
+        (Document, _serialize_document),
+        ((AsyncIterator, Generator, Iterator), _serialize_iterator),
+        (BaseModel, _serialize_pydantic),
+        (BaseModelV1, _serialize_pydantic_v1),
+        (dict, _serialize_dict),
+        (pd.DataFrame, _serialize_dataframe),
+        (pd.Series, _serialize_series),
+        ((list, tuple), _serialize_list_tuple),
+    ):
+        if isinstance(obj, types):
+            return serializer
+    if _is_numpy_type(obj):
+        return _serialize_numpy_type
+    return _serialize_instance
+
+
+# Serializer per concrete type, filled on first use so each object costs a single dict lookup. Types are held
+# weakly so classes created at runtime (per-schema models, custom components) can still be garbage collected.
+_SERIALIZERS_BY_TYPE: WeakKeyDictionary[type, Callable[[Any, int | None, int | None], Any]] = WeakKeyDictionary(
+    {type(None): _serialize_unchanged}
+)
+
+
 def _serialize_dispatcher(obj: Any, max_length: int | None, max_items: int | None) -> Any | _UnserializableSentinel:
     """Dispatch object to appropriate serializer."""
-    # Handle primitive types first
-    if obj is None:
-        return obj
+    obj_type = type(obj)
+    serializer = _SERIALIZERS_BY_TYPE.get(obj_type)
+    if serializer is not None:
+        return serializer(obj, max_length, max_items)
+    if not isinstance(obj, type):
+        serializer = _SERIALIZERS_BY_TYPE[obj_type] = _resolve_instance_serializer(obj)
+        return serializer(obj, max_length, max_items)
+
+    # Classes, enums, type variables and generic aliases go through the full chain
     primitive = _serialize_primitive(obj, max_length, max_items)
     if primitive is not UNSERIALIZABLE_SENTINEL:
         return primitive
@@ -72,6 +72,8 @@ class AuthSettings(BaseSettings):
     """The domain attribute of the cookies. If None, the domain is not set."""
 
     pwd_context: CryptContext = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    PASSWORD_HASHING_MAX_WORKERS: int = Field(default=4, ge=1)
+    """Maximum number of password hashes/verifications run concurrently, off the event loop."""
 
     model_config = SettingsConfigDict(validate_assignment=True, extra="ignore", env_prefix="AIEXEC_")
 
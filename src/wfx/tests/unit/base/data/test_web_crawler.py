@@ -0,0 +1,103 @@
+"""Tests for the pooled, streaming web crawler."""
+
+import os
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from wfx.base.data.web_crawler import CachedResponse, HttpResponseCache, PageParser, WebCrawler, sub_links
+
+PAGES = {
+    "https://example.com/docs/": (
+        '<html lang="en"><head><title>Docs</title><meta name="description" content="Root page"></head>'
+        '<body>Welcome <a href="intro">Intro</a> <a href="https://other.com/">Other</a>'
+        ' <a href="style.css">Style</a></body></html>'
+    ),
+    "https://example.com/docs/intro": "<html><body>Introduction</body></html>",
+}
+
+
+@pytest.fixture
+def requests_seen():
+    return []
+
+
+@pytest.fixture
+def client(requests_seen):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        url = str(request.url)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        if url not in PAGES:
+            return httpx.Response(404, text="missing")
+        return httpx.Response(
+            200, text=PAGES[url], headers={"Content-Type": "text/html; charset=utf-8", "ETag": '"v1"'}
+        )
+
+    with (
+        httpx.Client(transport=httpx.MockTransport(handler)) as client,
+        patch("wfx.base.data.web_crawler.get_http_client", return_value=client),
+    ):
+        yield client
+
+
+def test_crawl_follows_links_and_extracts_metadata(client):  # noqa: ARG001
+    documents = WebCrawler(max_depth=2).crawl("https://example.com/docs/")
+
+    assert [document.metadata["source"] for document in documents] == [
+        "https://example.com/docs/",
+        "https://example.com/docs/intro",
+    ]
+    root = documents[0]
+    assert root.page_content.startswith("DocsWelcome Intro")
+    assert root.metadata["title"] == "Docs"
+    assert root.metadata["description"] == "Root page"
+    assert root.metadata["language"] == "en"
+    assert root.metadata["content_type"] == "text/html; charset=utf-8"
+
+
+def test_page_text_leaves_out_scripts_and_styles():
+    parser = PageParser(collect_links=False)
+    parser.feed("<style>body{color:red}</style><script>var x=1;</script>Hello<template><p>Row</p></template> world")
+    parser.close()
+
+    assert parser.text == "Hello world"
+
+
+def test_crawl_returns_raw_html_when_requested(client):  # noqa: ARG001
+    documents = WebCrawler(as_html=True).crawl("https://example.com/docs/")
+
+    assert documents[0].page_content == PAGES["https://example.com/docs/"]
+
+
+def test_cached_pages_are_revalidated(client, requests_seen, tmp_path):  # noqa: ARG001
+    cache = HttpResponseCache(tmp_path)
+    crawler = WebCrawler(cache=cache)
+
+    first = crawler.crawl("https://example.com/docs/")
+    second = crawler.crawl("https://example.com/docs/")
+
+    assert requests_seen[1].headers["If-None-Match"] == '"v1"'
+    assert second[0].page_content == first[0].page_content
+    assert second[0].metadata == first[0].metadata
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path):
+    cache = HttpResponseCache(tmp_path, max_bytes=10)
+    cache.put("https://example.com/a", CachedResponse('"a"', None, "text/html", None, b"123456"))
+    for body_path in tmp_path.glob("*.body"):
+        os.utime(body_path, ns=(0, 0))
+    cache.put("https://example.com/b", CachedResponse('"b"', None, "text/html", None, b"123456"))
+
+    assert cache.get("https://example.com/a") is None
+    assert cache.get("https://example.com/b").body == b"123456"
+
+
+def test_sub_links_stay_under_the_base_url():
+    links = ["intro", "/other/page", "https://other.com/", "mailto:me@example.com", "logo.png", "guide?x=1#top"]
+
+    result = sub_links(links, "https://example.com/docs/", "https://example.com/docs/", prevent_outside=True)
+
+    assert result == ["https://example.com/docs/intro", "https://example.com/docs/guide?x=1"]
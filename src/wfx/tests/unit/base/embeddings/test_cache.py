@@ -0,0 +1,106 @@
+"""Tests for the process-wide embedding cache."""
+
+from langchain_core.embeddings import Embeddings
+
+from wfx.base.embeddings import cache
+from wfx.base.embeddings.cache import CachedEmbeddings, EmbeddingCacheStore, cached_embeddings, embeddings_identity
+
+
+class CountingEmbeddings(Embeddings):
+    def __init__(self, model: str = "fake-model"):
+        self.model = model
+        self.embedded: list[str] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.embedded.extend(texts)
+        return [[float(len(text)), 0.5] for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        self.embedded.append(text)
+        return [float(len(text)), 1.5]
+
+
+def test_only_missing_texts_are_embedded(tmp_path):
+    model = CountingEmbeddings()
+    cached = CachedEmbeddings(model, embeddings_identity(model), EmbeddingCacheStore(tmp_path / "cache.sqlite3"))
+
+    first = cached.embed_documents(["a", "bb", "a"])
+    second = cached.embed_documents(["bb", "ccc"])
+
+    assert first == [[1.0, 0.5], [2.0, 0.5], [1.0, 0.5]]
+    assert second == [[2.0, 0.5], [3.0, 0.5]]
+    assert model.embedded == ["a", "bb", "ccc"]
+    assert cached.store.stats()["misses"] == 3
+
+
+def test_vectors_survive_a_new_store_on_the_same_file(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    model = CountingEmbeddings()
+    CachedEmbeddings(model, embeddings_identity(model), EmbeddingCacheStore(path)).embed_documents(["text"])
+
+    store = EmbeddingCacheStore(path)
+    other = CountingEmbeddings()
+    vectors = CachedEmbeddings(other, embeddings_identity(other), store).embed_documents(["text"])
+
+    assert vectors == [[4.0, 0.5]]
+    assert other.embedded == []
+    assert store.disk_hits == 1
+    assert store.hit_rate == 1.0
+
+
+async def test_queries_and_models_are_cached_separately(tmp_path):
+    store = EmbeddingCacheStore(tmp_path / "cache.sqlite3")
+    model = CountingEmbeddings()
+    cached = CachedEmbeddings(model, embeddings_identity(model), store)
+    other_model = CountingEmbeddings("other-model")
+    other = CachedEmbeddings(other_model, embeddings_identity(other_model), store)
+
+    assert await cached.aembed_documents(["text"]) == [[4.0, 0.5]]
+    assert await cached.aembed_query("text") == [4.0, 1.5]
+    assert cached.embed_query("text") == [4.0, 1.5]
+    other.embed_documents(["text"])
+
+    assert model.embedded == ["text", "text"]
+    assert other_model.embedded == ["text"]
+
+
+def test_models_without_a_name_are_not_cached():
+    class Anonymous(CountingEmbeddings):
+        def __init__(self):
+            super().__init__()
+            self.model = None
+
+    model = Anonymous()
+    assert cached_embeddings(model) is model
+
+
+def test_wrapper_exposes_the_wrapped_model_attributes(tmp_path):
+    cached = CachedEmbeddings(CountingEmbeddings(), "identity", EmbeddingCacheStore(tmp_path / "cache.sqlite3"))
+
+    assert cached.model == "fake-model"
+
+
+def test_disk_tier_is_bounded_by_bytes(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    # Two-dimensional float32 vectors take 8 bytes each
+    store = EmbeddingCacheStore(path, disk_max_bytes=40)
+    for index in range(6):
+        store.set_many({f"key-{index}": [float(index), 0.5]})
+
+    stats = store.stats()
+    assert stats["disk_bytes"] <= 40
+    reopened = EmbeddingCacheStore(path)
+    assert reopened.get_many(["key-0"]) == {}
+    assert reopened.get_many(["key-5"]) == {"key-5": [5.0, 0.5]}
+    assert reopened.stats()["disk_bytes"] == stats["disk_bytes"]
+
+
+def test_stats_are_logged_periodically(tmp_path, monkeypatch):
+    store = EmbeddingCacheStore(tmp_path / "cache.sqlite3")
+    logged = []
+    monkeypatch.setattr(cache.logger, "info", logged.append)
+    monkeypatch.setattr(cache, "STATS_LOG_INTERVAL", 0)
+
+    store.get_many(["missing"])
+
+    assert logged == [f"Embedding cache: {store.stats()}"]
@@ -0,0 +1,85 @@
+"""Tests for the batch execution engine."""
+
+from unittest.mock import patch
+
+import pytest
+
+from wfx.base.processing.batch import BatchCheckpoint, BatchExecutor, RateLimiter
+
+
+async def test_rate_limiter_waits_when_request_budget_is_spent():
+    limiter = RateLimiter(requests_per_minute=60)
+    sleeps: list[float] = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        limiter._requests += 1
+
+    with patch("wfx.base.processing.batch.asyncio.sleep", fake_sleep):
+        for _ in range(61):
+            await limiter.acquire()
+
+    assert len(sleeps) == 1
+    assert 0 < sleeps[0] <= 1
+
+
+async def test_unlimited_rate_limiter_never_waits():
+    with patch("wfx.base.processing.batch.asyncio.sleep") as sleep:
+        limiter = RateLimiter()
+        for _ in range(100):
+            await limiter.acquire(10_000)
+    sleep.assert_not_called()
+
+
+def test_checkpoint_ignores_truncated_lines(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    checkpoint = BatchCheckpoint(path)
+    checkpoint.record(0, "fp0", "first")
+    checkpoint.close()
+    with path.open("ab") as file:
+        file.write(b'{"index": 1, "finger')
+
+    restored = BatchCheckpoint(path)
+    assert restored.get(0, "fp0") == (True, "first")
+    assert restored.get(0, "other") == (False, None)
+    assert restored.get(1, "fp1") == (False, None)
+
+
+def test_checkpoint_appends_after_a_truncated_line(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    checkpoint = BatchCheckpoint(path)
+    checkpoint.record(0, "fp0", "first")
+    checkpoint.close()
+    with path.open("ab") as file:
+        file.write(b'{"index": 1, "finger')
+
+    resumed = BatchCheckpoint(path)
+    resumed.record(1, "fp1", "second")
+    resumed.close()
+
+    restored = BatchCheckpoint(path)
+    assert restored.get(0, "fp0") == (True, "first")
+    assert restored.get(1, "fp1") == (True, "second")
+
+
+async def test_non_retryable_error_fails_the_batch():
+    async def process(_):
+        msg = "bad payload"
+        raise KeyError(msg)
+
+    with pytest.raises(KeyError):
+        await BatchExecutor(process).run(["a", "b"])
+
+
+async def test_results_keep_input_order_and_report_progress():
+    progress: list[tuple[int, int]] = []
+
+    async def process(payload):
+        return payload.upper()
+
+    results = await BatchExecutor(
+        process, max_concurrency=2, on_progress=lambda done, total: progress.append((done, total))
+    ).run(["a", "b", "c"])
+
+    assert [result.result for result in results] == ["A", "B", "C"]
+    assert progress == [(1, 3), (2, 3), (3, 3)]
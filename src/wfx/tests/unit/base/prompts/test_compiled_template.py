@@ -0,0 +1,41 @@
+"""Tests for templates compiled once and rendered column-wise."""
+
+import pandas as pd
+import pytest
+
+from wfx.base.prompts.compiled_template import compile_template
+
+
+def test_compile_collects_variables_in_order_of_use():
+    compiled = compile_template("{b} and {a} then {b:>{width}} {{escaped}}")
+
+    assert compiled.variables == ("b", "a", "width")
+    assert compiled.simple
+    assert compile_template("{b} and {a} then {b:>{width}} {{escaped}}") is compiled
+
+
+def test_attribute_access_and_positional_fields_are_not_simple():
+    assert compile_template("{item.name}").variables == ("item",)
+    assert not compile_template("{item.name}").simple
+    assert not compile_template("{row[0]}").simple
+    assert not compile_template("{}").simple
+
+
+def test_render_dataframe_matches_formatting_each_row():
+    dataframe = pd.DataFrame({"name": ["Ann", "Bob"], "age": [30, 40], "unused": [[1], [2]]})
+    pattern = "Name: {name}, Age: {age:03d}"
+
+    rendered = compile_template(pattern).render_dataframe(dataframe, "\n")
+
+    assert rendered == "Name: Ann, Age: 030\nName: Bob, Age: 040"
+
+
+def test_render_dataframe_without_variables_repeats_the_text():
+    dataframe = pd.DataFrame({"name": ["Ann", "Bob"]})
+
+    assert compile_template("{{row}}").render_dataframe(dataframe, ",") == "{row},{row}"
+
+
+def test_missing_column_raises_key_error():
+    with pytest.raises(KeyError, match="missing"):
+        compile_template("{missing}").render_dataframe(pd.DataFrame({"name": ["Ann"]}), "\n")
@@ -0,0 +1,41 @@
+"""Tests for RunFlowBaseComponent."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from wfx.base.tools.run_flow import RunFlowBaseComponent
+from wfx.schema.message import Message
+
+
+class CountingRunFlowComponent(RunFlowBaseComponent):
+    inputs = RunFlowBaseComponent.get_base_inputs()
+    outputs = RunFlowBaseComponent.get_base_outputs()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.runs = 0
+
+    async def run_flow_with_tweaks(self):
+        self.runs += 1
+        message = Message(text=f"run {self.runs}")
+        return [SimpleNamespace(outputs=[SimpleNamespace(results={"message": message})])]
+
+
+async def test_outputs_of_one_build_share_a_single_subflow_run():
+    component = CountingRunFlowComponent()
+    with patch.object(component, "_handle_tool_mode"):
+        results, _ = await component._build_results()
+
+    assert component.runs == 1
+    assert results["flow_outputs_message"].text == "run 1"
+    assert results["flow_outputs_data"].data["text"] == "run 1"
+    assert len(results["flow_outputs_dataframe"]) == 1
+
+
+async def test_calls_outside_a_build_run_the_subflow_every_time():
+    component = CountingRunFlowComponent()
+    with patch.object(component, "_handle_tool_mode"):
+        await component._build_results()
+
+    assert (await component.message_output()).text == "run 2"
+    assert (await component.message_output()).text == "run 3"
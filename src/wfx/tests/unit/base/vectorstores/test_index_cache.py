@@ -0,0 +1,36 @@
+"""Tests for the process-wide cache of loaded vector store indexes."""
+
+import os
+
+from wfx.base.vectorstores.index_cache import LoadedIndexCache
+
+
+def test_cached_index_is_reused_while_its_files_are_unchanged(tmp_path):
+    index_file = tmp_path / "index.faiss"
+    index_file.write_bytes(b"index")
+    cache = LoadedIndexCache()
+    index = object()
+
+    cache.put("key", [index_file], index)
+
+    assert cache.get("key", [index_file]) is index
+    assert cache.get("other", [index_file]) is None
+
+
+def test_cached_index_is_dropped_when_its_files_change(tmp_path):
+    index_file = tmp_path / "index.faiss"
+    index_file.write_bytes(b"index")
+    cache = LoadedIndexCache()
+    cache.put("key", [index_file], object())
+
+    stat = index_file.stat()
+    os.utime(index_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert cache.get("key", [index_file]) is None
+
+
+def test_missing_files_are_never_cached(tmp_path):
+    cache = LoadedIndexCache()
+    cache.put("key", [tmp_path / "missing.faiss"], object())
+
+    assert cache.get("key", [tmp_path / "missing.faiss"]) is None
@@ -0,0 +1,63 @@
+"""Tests for the content-hash deduplication of LCVectorStoreComponent."""
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.vectorstores import InMemoryVectorStore
+
+from wfx.base.vectorstores.model import DEDUPLICATED_INGEST_INFO, LCVectorStoreComponent, check_cached_vector_store
+from wfx.base.vectorstores.utils import CONTENT_HASH_KEY, content_hash_to_id, document_content_hash
+
+
+class InMemoryVectorStoreComponent(LCVectorStoreComponent):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.store = InMemoryVectorStore(embedding=DeterministicFakeEmbedding(size=8))
+
+    @check_cached_vector_store
+    def build_vector_store(self) -> InMemoryVectorStore:
+        return self.store
+
+
+def test_document_hash_ignores_a_stored_hash():
+    document = Document(page_content="text", metadata={"source": "a.txt"})
+    content_hash = document_content_hash(document)
+    stored = Document(page_content="text", metadata={"source": "a.txt", CONTENT_HASH_KEY: content_hash})
+
+    assert document_content_hash(stored) == content_hash
+    assert document_content_hash(Document(page_content="text", metadata={"source": "b.txt"})) != content_hash
+
+
+def test_hash_documents_drops_repeats_and_assigns_stable_ids():
+    component = InMemoryVectorStoreComponent()
+    documents = [Document(page_content="one"), Document(page_content="two"), Document(page_content="one")]
+
+    unique, ids = component._hash_documents(documents)
+
+    assert [document.page_content for document in unique] == ["one", "two"]
+    assert ids == [content_hash_to_id(document.metadata[CONTENT_HASH_KEY]) for document in unique]
+    assert all(document.id == id_ for document, id_ in zip(unique, ids, strict=True))
+
+
+def test_filter_stored_documents_only_keeps_new_documents():
+    component = InMemoryVectorStoreComponent()
+    store = component.build_vector_store()
+    stored, stored_ids = component._hash_documents([Document(page_content="one"), Document(page_content="two")])
+    store.add_documents(stored, ids=stored_ids)
+
+    documents, ids = component._hash_documents(
+        [Document(page_content="one"), Document(page_content="two"), Document(page_content="three")]
+    )
+    documents, ids = component._filter_stored_documents(store, documents, ids)
+
+    assert [document.page_content for document in documents] == ["three"]
+    assert ids == [documents[0].id]
+
+
+def test_inputs_with_ingest_info_only_changes_the_ingest_data_info():
+    inputs = LCVectorStoreComponent.inputs_with_ingest_info(DEDUPLICATED_INGEST_INFO)
+
+    assert [input_.name for input_ in inputs] == [input_.name for input_ in LCVectorStoreComponent.inputs]
+    ingest_data = next(input_ for input_ in inputs if input_.name == "ingest_data")
+    assert ingest_data.info == DEDUPLICATED_INGEST_INFO
+    base_ingest_data = next(input_ for input_ in LCVectorStoreComponent.inputs if input_.name == "ingest_data")
+    assert "skipped" not in base_ingest_data.info
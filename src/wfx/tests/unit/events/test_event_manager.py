@@ -8,7 +8,9 @@ import pytest
 
 from wfx.events.event_manager import (
     EventManager,
+    FlowEvent,
     create_default_event_manager,
+    create_in_process_stream_event_manager,
     create_stream_tokens_event_manager,
 )
 
@@ -369,3 +371,37 @@ class TestEventManagerAsync:
         for sent, received in zip(events_to_send, received_events, strict=False):
             assert sent[0] == received[0]  # event type
             assert sent[1] == received[1]  # data
+
+
+class TestInProcessEventManager:
+    """Test cases for the in-process event manager."""
+
+    @pytest.mark.asyncio
+    async def test_events_are_queued_as_objects(self):
+        queue = asyncio.Queue()
+        manager = create_in_process_stream_event_manager(queue)
+        payload = {"chunk": "hello", "id": "msg-1"}
+
+        manager.on_token(data=payload)
+
+        event_id, event, _ = queue.get_nowait()
+        assert event_id.startswith("token-")
+        assert isinstance(event, FlowEvent)
+        assert event.type == "token"
+        assert event.data is payload
+
+    @pytest.mark.asyncio
+    async def test_events_from_worker_threads_reach_the_loop(self):
+        queue = asyncio.Queue()
+        manager = create_in_process_stream_event_manager(queue)
+
+        await asyncio.to_thread(manager.on_message, data={"text": "from thread"})
+
+        _, event, _ = await asyncio.wait_for(queue.get(), timeout=1)
+        assert event.type == "add_message"
+        assert event.data == {"text": "from thread"}
+
+    def test_registers_message_deltas(self):
+        manager = create_in_process_stream_event_manager(asyncio.Queue())
+        for event_name in ["on_message", "on_message_delta", "on_token", "on_end"]:
+            assert event_name in manager.events
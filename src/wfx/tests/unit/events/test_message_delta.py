@@ -0,0 +1,123 @@
+"""Unit tests for wfx.events.message_delta and the delta path of Component.send_message."""
+
+import asyncio
+import json
+
+from wfx.custom.custom_component.component import Component
+from wfx.events.event_manager import create_default_event_manager, create_stream_tokens_event_manager
+from wfx.events.message_delta import MessageDeltaTracker, MessageStateReducer
+from wfx.schema.content_block import ContentBlock
+from wfx.schema.content_types import TextContent, ToolContent
+from wfx.schema.message import Message
+
+
+def _agent_message() -> Message:
+    return Message(
+        id="msg-1",
+        text="",
+        sender="Machine",
+        sender_name="Agent",
+        session_id="session",
+        properties={"state": "partial"},
+        content_blocks=[ContentBlock(title="Agent Steps", contents=[TextContent(type="text", text="input")])],
+    )
+
+
+def _drain(queue: asyncio.Queue) -> list[dict]:
+    events = []
+    while not queue.empty():
+        _, payload, _ = queue.get_nowait()
+        events.append(json.loads(payload))
+    return events
+
+
+class TestMessageDeltaTracker:
+    def test_text_append_and_state(self):
+        message = _agent_message()
+        tracker = MessageDeltaTracker()
+        tracker.snapshot(message)
+
+        message.text = "Hello"
+        assert tracker.diff(message) == {"id": "msg-1", "seq": 1, "text_append": "Hello"}
+        message.text = "Hello world"
+        message.properties.state = "complete"
+        assert tracker.diff(message) == {"id": "msg-1", "seq": 2, "text_append": " world", "state": "complete"}
+        assert tracker.diff(message) == {}
+
+    def test_new_and_updated_contents(self):
+        message = _agent_message()
+        tracker = MessageDeltaTracker()
+        tracker.snapshot(message)
+
+        tool = ToolContent(type="tool_use", name="search", tool_input={"q": "x"})
+        message.content_blocks[0].contents.append(tool)
+        delta = tracker.diff(message)
+        assert [(c["block"], c["index"]) for c in delta["contents"]] == [(0, 1)]
+
+        message.content_blocks[0].contents[1].output = "result"
+        delta = tracker.diff(message)
+        assert delta["contents"][0]["index"] == 1
+        assert delta["contents"][0]["content"]["output"] == "result"
+
+    def test_structural_changes_and_interval_require_snapshot(self):
+        message = _agent_message()
+        tracker = MessageDeltaTracker(snapshot_interval=2)
+        tracker.snapshot(message)
+
+        message.text = "a"
+        assert tracker.diff(message)
+        message.text = "ab"
+        assert tracker.diff(message)
+        message.text = "abc"
+        assert tracker.diff(message) is None
+
+        tracker.snapshot(message)
+        message.content_blocks.append(ContentBlock(title="Other", contents=[]))
+        assert tracker.diff(message) is None
+
+
+def test_reducer_rebuilds_message_from_deltas():
+    message = _agent_message()
+    tracker = MessageDeltaTracker()
+    tracker.snapshot(message)
+    reducer = MessageStateReducer()
+    reducer.apply_snapshot(json.loads(message.model_dump_json()))
+
+    message.text = "Hi"
+    message.content_blocks[0].contents.append(ToolContent(type="tool_use", name="search", tool_input={}))
+    rebuilt = reducer.apply_delta(json.loads(json.dumps(tracker.diff(message))))
+
+    assert rebuilt["text"] == "Hi"
+    assert rebuilt["content_blocks"][0]["contents"][1]["name"] == "search"
+    assert reducer.apply_delta({"id": "unknown", "seq": 1, "text_append": "x"}) is None
+
+
+async def test_send_message_streams_deltas_after_first_snapshot():
+    queue: asyncio.Queue = asyncio.Queue()
+    component = Component()
+    component.set_event_manager(create_default_event_manager(queue))
+    message = _agent_message()
+
+    message = await component.send_message(message, skip_db_update=True)
+    for chunk in ["Hel", "lo"]:
+        message.text += chunk
+        message = await component.send_message(message, skip_db_update=True)
+
+    events = _drain(queue)
+    assert [event["event"] for event in events] == ["add_message", "message_delta", "message_delta"]
+    assert [event["data"]["text_append"] for event in events[1:]] == ["Hel", "lo"]
+
+
+async def test_send_message_without_delta_support_sends_full_messages():
+    queue: asyncio.Queue = asyncio.Queue()
+    component = Component()
+    component.set_event_manager(create_stream_tokens_event_manager(queue))
+    message = _agent_message()
+
+    message = await component.send_message(message, skip_db_update=True)
+    message.text += "Hello"
+    await component.send_message(message, skip_db_update=True)
+
+    events = _drain(queue)
+    assert [event["event"] for event in events] == ["add_message", "add_message"]
+    assert events[1]["data"]["text"] == "Hello"
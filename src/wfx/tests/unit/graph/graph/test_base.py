@@ -112,3 +112,49 @@ def test_graph_set_with_valid_component():
     tool = YfinanceToolComponent()
     tool_calling_agent = ToolCallingAgentComponent()
     tool_calling_agent.set(tools=[tool])
+
+
+def test_graph_edge_index_follows_structural_edits():
+    chat_input = ChatInput(_id="chat_input")
+    text_output = TextOutputComponent(_id="text_output")
+    text_output.set(input_value=chat_input.message_response)
+    chat_output = ChatOutput(input_value="test", _id="chat_output")
+    chat_output.set(input_value=text_output.text_response)
+    graph = Graph(chat_input, chat_output)
+
+    assert graph.get_edge("chat_input", "text_output").target_id == "text_output"
+    assert graph.get_edge("text_output", "chat_input") is None
+    text_output_vertex = graph.get_vertex("text_output")
+    assert [edge.source_id for edge in text_output_vertex.incoming_edges] == ["chat_input"]
+    assert [edge.target_id for edge in text_output_vertex.outgoing_edges] == ["chat_output"]
+    assert len(graph.get_vertex_edges("text_output")) == 2
+    assert [vertex.id for vertex in graph.get_vertices_with_target("chat_output")] == ["text_output"]
+    assert [vertex.id for vertex in text_output_vertex.successors] == ["chat_output"]
+    assert [vertex.id for vertex in graph.topological_sort()] == ["chat_input", "text_output", "chat_output"]
+
+    graph.remove_vertex("chat_output")
+    graph.build_graph_maps()
+
+    assert graph.get_edge("text_output", "chat_output") is None
+    assert text_output_vertex.outgoing_edges == []
+    assert text_output_vertex.successors == []
+
+
+@pytest.mark.asyncio
+async def test_graph_process_keeps_predecessor_map():
+    chat_input = ChatInput(_id="chat_input")
+    chat_input.set(should_store_message=False)
+    text_outputs = []
+    for index in range(3):
+        text_output = TextOutputComponent(_id=f"text_output_{index}")
+        text_output.set(input_value=chat_input.message_response)
+        text_outputs.append(text_output)
+    graph = Graph()
+    for component in [chat_input, *text_outputs]:
+        graph.add_component(component)
+    graph.prepare()
+
+    await graph.process(fallback_to_env_vars=False)
+
+    assert all(vertex.built for vertex in graph.vertices)
+    assert all(graph.predecessor_map[text_output.get_id()] == ["chat_input"] for text_output in text_outputs)
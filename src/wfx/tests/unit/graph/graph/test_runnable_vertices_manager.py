@@ -207,3 +207,15 @@ def test_add_to_vertices_being_run(data):
     manager.add_to_vertices_being_run(vertex_id)
 
     assert vertex_id in manager.vertices_being_run
+
+
+def test_build_run_map_does_not_drain_predecessor_map():
+    manager = RunnableVerticesManager()
+    predecessor_map = {"B": ["A"], "C": ["A", "B"]}
+
+    manager.build_run_map(predecessor_map, {"A", "B", "C"})
+    manager.remove_from_predecessors("A")
+
+    assert manager.run_predecessors["B"] == []
+    assert manager.run_predecessors["C"] == ["B"]
+    assert predecessor_map == {"B": ["A"], "C": ["A", "B"]}
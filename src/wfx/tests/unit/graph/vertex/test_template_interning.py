@@ -0,0 +1,48 @@
+import copy
+import pickle
+
+from wfx.graph.vertex.template_interning import TemplateInterner
+
+
+def _node(code: str = "class A: ...", prompt: str = "Hello") -> dict:
+    return {
+        "metadata": {"code_hash": "abc123"},
+        "template": {
+            "_type": "Component",
+            "code": {"type": "code", "value": code, "info": "Component code"},
+            "prompt": {"type": "str", "value": prompt, "info": "The prompt to send", "options": ["a", "b"]},
+        },
+    }
+
+
+def test_intern_node_shares_static_strings():
+    interner = TemplateInterner()
+    first, second = _node(), copy.deepcopy(_node())
+    interner.intern_node("Prompt", first)
+    interner.intern_node("Prompt", second)
+
+    assert second["template"]["code"]["value"] is first["template"]["code"]["value"]
+    assert second["template"]["prompt"]["info"] is first["template"]["prompt"]["info"]
+    # Lists are never shared, they may be updated in place
+    assert second["template"]["prompt"]["options"] is not first["template"]["prompt"]["options"]
+
+
+def test_intern_node_keeps_per_vertex_values_and_overrides():
+    interner = TemplateInterner()
+    first, second = _node(prompt="Hi"), _node(code="class B: ...", prompt="Hi there")
+    interner.intern_node("Prompt", first)
+    interner.intern_node("Prompt", second)
+
+    assert second["template"]["prompt"]["value"] == "Hi there"
+    assert second["template"]["code"]["value"] == "class B: ..."
+
+
+def test_interned_templates_pickle_smaller():
+    interner = TemplateInterner()
+    # Build distinct but equal strings, as parsing a flow JSON does
+    nodes = [_node(code="".join(["x = 1\n"] * 1000)) for _ in range(10)]
+    size_before = len(pickle.dumps(nodes))
+    for node in nodes:
+        interner.intern_node("Prompt", node)
+
+    assert len(pickle.dumps(nodes)) < size_before / 5
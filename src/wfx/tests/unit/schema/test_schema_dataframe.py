@@ -3,7 +3,7 @@ import pytest
 from langchain_core.documents import Document
 
 from wfx.schema.data import Data
-from wfx.schema.dataframe import DataFrame
+from wfx.schema.dataframe import DataFrame, DataFrameBuilder
 
 
 @pytest.fixture
@@ -55,6 +55,36 @@ class TestDataFrameSchema:
         assert new_df.iloc[-2:]["name"].tolist() == ["Bob", "Alice"]
         assert new_df.iloc[-2:]["text"].tolist() == ["name is Bob", "name is Alice"]
 
+    def test_to_data_list_matches_to_dict_records(self):
+        """Test that the column-wise conversion keeps the values to_dict would return."""
+        data_frame = DataFrame(
+            {
+                "count": pd.array([1, None], dtype="Int64"),
+                "score": [0.5, float("nan")],
+                "when": pd.to_datetime(["2024-01-01", None]),
+                "text": ["a", "b"],
+            }
+        )
+        records = [item.data for item in data_frame.to_data_list()]
+        expected = data_frame.to_dict(orient="records")
+        assert [list(map(repr, row.values())) for row in records] == [
+            list(map(repr, row.values())) for row in expected
+        ]
+
+    def test_builder_materializes_once(self):
+        """Test that DataFrameBuilder collects dicts and Data objects into a single frame."""
+        builder = DataFrameBuilder(text_key="content")
+        assert builder.build().empty
+
+        builder.add_row({"content": "first", "index": 0})
+        builder.add_rows([Data(data={"content": "second", "index": 1}), {"content": "third", "index": 2}])
+        data_frame = builder.build()
+
+        assert len(builder) == 3
+        assert isinstance(data_frame, DataFrame)
+        assert data_frame["content"].tolist() == ["first", "second", "third"]
+        assert data_frame.text_key == "content"
+
     def test_to_lc_document(self, dataframe_with_metadata):
         documents = dataframe_with_metadata.to_lc_documents()
         assert isinstance(documents, list)
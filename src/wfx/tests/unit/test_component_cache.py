@@ -0,0 +1,25 @@
+from wfx.interface.components import ComponentCache
+
+
+def test_get_base_type_without_catalog():
+    assert ComponentCache().get_base_type("ChatInput") is None
+
+
+def test_get_base_type_follows_catalog_changes():
+    cache = ComponentCache()
+    cache.all_types_dict = {
+        "input_output": {"ChatInput": {}, "ChatOutput": {}},
+        "custom": {"ChatInput": {}},
+    }
+
+    # The first category listing a type wins, as in the linear scan it replaces
+    assert cache.get_base_type("ChatInput") == "input_output"
+    assert cache.get_base_type("Prompt") is None
+
+    cache.all_types_dict["processing"] = {"Prompt": {}}
+    cache.mark_changed("processing")
+    assert cache.get_base_type("Prompt") == "processing"
+
+    cache.all_types_dict = {"models": {"OpenAIModel": {}}}
+    assert cache.get_base_type("ChatInput") is None
+    assert cache.get_base_type("OpenAIModel") == "models"